@@ -1,534 +1,617 @@
-import abjad
-import ide
-
-from . import const
-from . import tonality
-from .classes import *
-from .commandclasses import *
-from .commands import *
-from .figuremaker import *
-from .indicatorcommands import *
-from .indicators import *
-from .mathx import *
-from .overrides import *
-from .persistence import *
-from .piecewise import *
-from .pitcharray import *
-from .pitchclasses import *
-from .pitchcommands import *
-from .rhythmcommands import *
-from .scoping import *
-from .segmentclasses import *
-from .segmentmaker import *
-from .selectors import (
-    leaves_,
-    rleaf_,
-    leaf_after_each_ptail,
-    leaf_in_each_rleak_run,
-    leaf_in_each_run,
-    leaf_in_each_tuplet,
-    leaves_in_each_lt,
-    leaves_in_each_plt,
-    leaves_in_each_run,
-    leaves_in_each_tuplet,
-    leaves_in_get_tuplets,
-    pleaf_in_each_tuplet,
-    ptail_in_each_tuplet,
-    rleak_runs,
+"""
+Bača API.
+
+Package loads submodules lazily: ``import baca`` imports no submodule;
+first access to ``baca.X`` imports submodule that defines ``X``.
+"""
+
+import importlib
+
+_exports = {
+    "build": ("build_segments",),
+    "classes": (
+        "Counter",
+        "Cursor",
+        "PaddedTuple",
+        "SchemeManifest",
+        "select",
+        "Selection",
+        "SelectionIndex",
+        "Sequence",
+        "Tree",
+    ),
+    "commandclasses": (
+        "BCPCommand",
+        "ColorCommand",
+        "ContainerCommand",
+        "DetachCommand",
+        "GlissandoCommand",
+        "GlobalFermataCommand",
+        "IndicatorCommand",
+        "InstrumentChangeCommand",
+        "LabelCommand",
+        "MetronomeMarkCommand",
+        "PartAssignmentCommand",
+    ),
+    "commands": (
+        "allow_octaves",
+        "bcps",
+        "close_volta",
+        "color",
+        "container",
+        "cross_staff",
+        "double_volta",
+        "dynamic_down",
+        "dynamic_up",
+        "edition",
+        "finger_pressure_transition",
+        "flat_glissando",
+        "fractions",
+        "glissando",
+        "global_fermata",
+        "instrument",
+        "invisible_music",
+        "label",
+        "markup",
+        "metronome_mark",
+        "one_voice",
+        "open_volta",
+        "parts",
+        "previous_metadata",
+        "untie",
+        "voice_four",
+        "voice_one",
+        "voice_three",
+        "voice_two",
+    ),
+    "figuremaker": (
+        "Acciaccatura",
+        "Accumulator",
+        "Anchor",
+        "anchor",
+        "anchor_after",
+        "anchor_to_figure",
+        "assign",
+        "Assignment",
+        "Bind",
+        "bind",
+        "Coat",
+        "coat",
+        "Contribution",
+        "extend_beam",
+        "figure",
+        "FigureMaker",
+        "imbricate",
+        "Imbrication",
+        "LMR",
+        "lmr",
+        "Nest",
+        "nest",
+        "RestAffix",
+        "rests_after",
+        "rests_around",
+        "rests_before",
+        "resume",
+        "resume_after",
+        "skips_after",
+        "skips_around",
+        "skips_before",
+        "Stack",
+        "stack",
+    ),
+    "indicatorcommands": (
+        "accent",
+        "alternate_bow_strokes",
+        "arpeggio",
+        "articulation",
+        "articulations",
+        "bar_line",
+        "breathe",
+        "clef",
+        "damp",
+        "double_flageolet",
+        "double_staccato",
+        "down_arpeggio",
+        "down_bow",
+        "espressivo",
+        "fermata",
+        "flageolet",
+        "hide_black_note_heads",
+        "laissez_vibrer",
+        "literal",
+        "long_fermata",
+        "marcato",
+        "margin_markup",
+        "mark",
+        "parenthesize",
+        "quadruple_staccato",
+        "rehearsal_mark",
+        "repeat_tie",
+        "short_fermata",
+        "snap_pizzicato",
+        "staccatissimo",
+        "staccato",
+        "staff_lines",
+        "start_markup",
+        "stem_tremolo",
+        "stop_on_string",
+        "stop_trill",
+        "stopped",
+        "tenuto",
+        "tie",
+        "triple_staccato",
+        "up_arpeggio",
+        "up_bow",
+        "very_long_fermata",
+    ),
+    "indicators": (
+        "Accelerando",
+        "BarExtent",
+        "Ritardando",
+        "SpacingSection",
+        "StaffLines",
+    ),
+    "mathx": (
+        "increase_elements",
+        "insert_and_transpose",
+        "negate_elements",
+        "overwrite_elements",
+        "partition_integer_into_halves",
+        "partition_nested_into_inward_pointing_parts",
+        "repeat_subruns_to_length",
+    ),
+    "overrides": (
+        "accidental_extra_offset",
+        "accidental_font_size",
+        "accidental_stencil_false",
+        "accidental_transparent",
+        "accidental_x_extent_false",
+        "accidental_x_offset",
+        "accidental_y_offset",
+        "bar_line_color",
+        "bar_line_extra_offset",
+        "bar_line_transparent",
+        "bar_line_x_extent",
+        "beam_positions",
+        "beam_stencil_false",
+        "beam_transparent",
+        "clef_extra_offset",
+        "clef_shift",
+        "clef_whiteout",
+        "clef_x_extent_false",
+        "dls_padding",
+        "dls_staff_padding",
+        "dls_up",
+        "dots_extra_offset",
+        "dots_stencil_false",
+        "dots_transparent",
+        "dots_x_extent_false",
+        "dynamic_text_color",
+        "dynamic_text_extra_offset",
+        "dynamic_text_parent_alignment_x",
+        "dynamic_text_self_alignment_x",
+        "dynamic_text_stencil_false",
+        "dynamic_text_transparent",
+        "dynamic_text_x_extent_zero",
+        "dynamic_text_x_offset",
+        "dynamic_text_y_offset",
+        "flag_extra_offset",
+        "flag_stencil_false",
+        "flag_transparent",
+        "glissando_thickness",
+        "hairpin_shorten_pair",
+        "hairpin_start_shift",
+        "hairpin_stencil_false",
+        "hairpin_to_barline",
+        "hairpin_transparent",
+        "laissez_vibrer_tie_down",
+        "laissez_vibrer_tie_up",
+        "mmrest_color",
+        "mmrest_text_color",
+        "mmrest_text_extra_offset",
+        "mmrest_text_padding",
+        "mmrest_text_parent_center",
+        "mmrest_text_staff_padding",
+        "mmrest_text_transparent",
+        "mmrest_transparent",
+        "no_ledgers",
+        "note_column_shift",
+        "note_head_color",
+        "note_head_duration_log",
+        "note_head_extra_offset",
+        "note_head_font_size",
+        "note_head_no_ledgers",
+        "note_head_stencil_false",
+        "note_head_style",
+        "note_head_style_cross",
+        "note_head_style_harmonic",
+        "note_head_style_harmonic_black",
+        "note_head_transparent",
+        "note_head_x_extent_zero",
+        "ottava_bracket_shorten_pair",
+        "ottava_bracket_staff_padding",
+        "OverrideCommand",
+        "rehearsal_mark_down",
+        "rehearsal_mark_extra_offset",
+        "rehearsal_mark_padding",
+        "rehearsal_mark_self_alignment_x",
+        "rehearsal_mark_y_offset",
+        "repeat_tie_down",
+        "repeat_tie_extra_offset",
+        "repeat_tie_stencil_false",
+        "repeat_tie_transparent",
+        "repeat_tie_up",
+        "rest_color",
+        "rest_down",
+        "rest_extra_offset",
+        "rest_position",
+        "rest_transparent",
+        "rest_up",
+        "rest_x_extent_zero",
+        "script_color",
+        "script_down",
+        "script_extra_offset",
+        "script_padding",
+        "script_staff_padding",
+        "script_up",
+        "script_x_extent_zero",
+        "slur_down",
+        "slur_up",
+        "span_bar_color",
+        "span_bar_extra_offset",
+        "span_bar_transparent",
+        "stem_color",
+        "stem_down",
+        "stem_extra_offset",
+        "stem_stencil_false",
+        "stem_transparent",
+        "stem_tremolo_extra_offset",
+        "stem_up",
+        "strict_note_spacing_off",
+        "sustain_pedal_staff_padding",
+        "text_script_color",
+        "text_script_down",
+        "text_script_extra_offset",
+        "text_script_font_size",
+        "text_script_padding",
+        "text_script_parent_alignment_x",
+        "text_script_self_alignment_x",
+        "text_script_staff_padding",
+        "text_script_up",
+        "text_script_x_offset",
+        "text_script_y_offset",
+        "text_spanner_left_padding",
+        "text_spanner_right_padding",
+        "text_spanner_staff_padding",
+        "text_spanner_stencil_false",
+        "text_spanner_transparent",
+        "text_spanner_y_offset",
+        "tie_down",
+        "tie_up",
+        "time_signature_extra_offset",
+        "time_signature_stencil_false",
+        "time_signature_transparent",
+        "trill_spanner_staff_padding",
+        "tuplet_bracket_down",
+        "tuplet_bracket_extra_offset",
+        "tuplet_bracket_outside_staff_priority",
+        "tuplet_bracket_padding",
+        "tuplet_bracket_shorten_pair",
+        "tuplet_bracket_staff_padding",
+        "tuplet_bracket_transparent",
+        "tuplet_bracket_up",
+        "tuplet_number_denominator",
+        "tuplet_number_extra_offset",
+        "tuplet_number_text",
+        "tuplet_number_transparent",
+    ),
+    "persistence": ("persistence",),
+    "piecewise": (
+        "bow_speed_spanner",
+        "Bundle",
+        "circle_bow_spanner",
+        "clb_spanner",
+        "covered_spanner",
+        "damp_spanner",
+        "dynamic",
+        "hairpin",
+        "half_clt_spanner",
+        "make_dynamic",
+        "material_annotation_spanner",
+        "metric_modulation_spanner",
+        "parse_hairpin_descriptor",
+        "PiecewiseCommand",
+        "pitch_annotation_spanner",
+        "pizzicato_spanner",
+        "rhythm_annotation_spanner",
+        "scp_spanner",
+        "spazzolato_spanner",
+        "string_number_spanner",
+        "tasto_spanner",
+        "text_spanner",
+        "vibrato_spanner",
+        "xfb_spanner",
+    ),
+    "pitcharray": (
+        "PitchArray",
+        "PitchArrayCell",
+        "PitchArrayColumn",
+        "PitchArrayList",
+        "PitchArrayRow",
+    ),
+    "pitchclasses": (
+        "ArpeggiationSpacingSpecifier",
+        "ChordalSpacingSpecifier",
+        "CollectionList",
+        "CollectionTyping",
+        "Constellation",
+        "ConstellationCircuit",
+        "DesignMaker",
+        "HarmonicSeries",
+        "Partial",
+        "PitchClassSegment",
+        "PitchClassSet",
+        "PitchSegment",
+        "PitchSet",
+        "PitchTree",
+        "Registration",
+        "RegistrationComponent",
+        "ZaggedPitchClassMaker",
+    ),
+    "pitchcommands": (
+        "AccidentalAdjustmentCommand",
+        "bass_to_octave",
+        "center_to_octave",
+        "ClusterCommand",
+        "clusters",
+        "color_fingerings",
+        "ColorFingeringCommand",
+        "deviation",
+        "diatonic_clusters",
+        "DiatonicClusterCommand",
+        "displacement",
+        "force_accidental",
+        "interpolate_pitches",
+        "interpolate_staff_positions",
+        "levine_multiphonic",
+        "Loop",
+        "loop",
+        "MicrotoneDeviationCommand",
+        "natural_clusters",
+        "OctaveDisplacementCommand",
+        "pitch",
+        "PitchCommand",
+        "pitches",
+        "register",
+        "RegisterCommand",
+        "RegisterInterpolationCommand",
+        "RegisterToOctaveCommand",
+        "soprano_to_octave",
+        "staff_position",
+        "staff_positions",
+        "StaffPositionCommand",
+        "StaffPositionInterpolationCommand",
+    ),
+    "rhythmcommands": (
+        "make_even_divisions",
+        "make_fused_tuplet_monads",
+        "make_monads",
+        "make_multimeasure_rests",
+        "make_notes",
+        "make_repeat_tied_notes",
+        "make_repeated_duration_notes",
+        "make_rests",
+        "make_single_attack",
+        "make_skips",
+        "make_tied_notes",
+        "make_tied_repeated_durations",
+        "music",
+        "rhythm",
+        "RhythmCommand",
+        "RhythmMakerTyping",
+        "skeleton",
+        "tacet",
+        "tag_selection",
+    ),
+    "scoping": (
+        "chunk",
+        "Command",
+        "CommandTyping",
+        "compare_persistent_indicators",
+        "new",
+        "not_mol",
+        "not_parts",
+        "not_score",
+        "not_segment",
+        "only_mol",
+        "only_parts",
+        "only_score",
+        "only_segment",
+        "Scope",
+        "site",
+        "Suite",
+        "suite",
+        "tag",
+        "timeline",
+        "TimelineScope",
+    ),
+    "segmentclasses": (
+        "BreakMeasureMap",
+        "breaks",
+        "HorizontalSpacingSpecifier",
+        "LBSD",
+        "MeasureIndex",
+        "minimum_duration",
+        "page",
+        "PageSpecifier",
+        "scorewide_spacing",
+        "SegmentProfile",
+        "system",
+        "SystemSpecifier",
+        "TimeSignatureMaker",
+    ),
+    "segmentmaker": (
+        "nonfirst_preamble",
+        "SegmentMaker",
+    ),
+    "selectors": (
+        "leaf_after_each_ptail",
+        "leaf_in_each_rleak_run",
+        "leaf_in_each_run",
+        "leaf_in_each_tuplet",
+        "leaves_",
+        "leaves_in_each_lt",
+        "leaves_in_each_plt",
+        "leaves_in_each_run",
+        "leaves_in_each_tuplet",
+        "leaves_in_get_tuplets",
+        "pleaf_in_each_tuplet",
+        "ptail_in_each_tuplet",
+        "rleaf_",
+        "rleak_runs",
+    ),
+    "spannercommands": (
+        "beam",
+        "ottava",
+        "ottava_bassa",
+        "slur",
+        "SpannerIndicatorCommand",
+        "sustain_pedal",
+        "trill_spanner",
+    ),
+    "templates": (
+        "ScoreTemplate",
+        "SingleStaffScoreTemplate",
+        "StringTrioScoreTemplate",
+        "ThreeVoiceStaffScoreTemplate",
+        "TwoVoiceStaffScoreTemplate",
+        "ViolinSoloScoreTemplate",
+    ),
+    "typings": (
+        "HorizontalAlignmentTyping",
+        "Indices",
+        "IntegerList",
+        "Pair",
+        "ScopeTyping",
+        "SliceTyping",
+    ),
+}
+
+_selectors = (
+    "chead",
+    "cheads",
+    "chord",
+    "chords",
+    "clparts",
+    "cmgroups",
+    "components",
+    "enchain",
+    "grace",
+    "graces",
+    "group",
+    "group_by_measure",
+    "hleaf",
+    "hleaves",
+    "leaf",
+    "leaves",
+    "lleaf",
+    "lleak",
+    "lleaves",
+    "logical_ties",
+    "lparts",
+    "lt",
+    "ltleaf",
+    "ltleaves",
+    "ltqrun",
+    "ltqruns",
+    "ltrun",
+    "ltruns",
+    "lts",
+    "mgroups",
+    "mleaves",
+    "mmrest",
+    "mmrests",
+    "note",
+    "notes",
+    "ntrun",
+    "ntruns",
+    "omgroups",
+    "ompltgroups",
+    "phead",
+    "pheads",
+    "pleaf",
+    "pleaves",
+    "plt",
+    "plts",
+    "ptail",
+    "ptails",
+    "ptlt",
+    "ptlts",
+    "qrun",
+    "qruns",
+    "rest",
+    "rests",
+    "rleaf",
+    "rleak",
+    "rleaves",
+    "rmleaves",
+    "rrun",
+    "rruns",
+    "run",
+    "runs",
+    "skip",
+    "skips",
+    "tleaf",
+    "tleaves",
+    "top",
+    "tuplet",
+    "tuplets",
+    "wleaf",
+    "wleaves",
 )
-from .spannercommands import *
-from .templates import *
-from .typings import *
-
-Path = ide.Path
-tags = ide.tags
-
-
-def chead(*arguments, **keywords):
-    return select().chead(*arguments, **keywords)
-
-
-chead.__doc__ = Selection.chead.__doc__
-
-
-def cheads(*arguments, **keywords):
-    return select().cheads(*arguments, **keywords)
-
-
-cheads.__doc__ = Selection.cheads.__doc__
-
-
-def chord(*arguments, **keywords):
-    return select().chord(*arguments, **keywords)
-
-
-chord.__doc__ = Selection.chord.__doc__
-
-
-def chords(*arguments, **keywords):
-    return select().chords(*arguments, **keywords)
-
-
-chords.__doc__ = Selection.chords.__doc__
-
-
-def clparts(*arguments, **keywords):
-    return select().clparts(*arguments, **keywords)
-
-
-clparts.__doc__ = Selection.clparts.__doc__
-
-
-def cmgroups(*arguments, **keywords):
-    return select().cmgroups(*arguments, **keywords)
-
-
-cmgroups.__doc__ = Selection.cmgroups.__doc__
-
-
-def components(*arguments, **keywords):
-    return select().components(*arguments, **keywords)
-
-
-components.__doc__ = Selection.components.__doc__
-
-
-def enchain(*arguments, **keywords):
-    return select().enchain(*arguments, **keywords)
-
-
-enchain.__doc__ = Selection.enchain.__doc__
-
-
-def grace(*arguments, **keywords):
-    return select().grace(*arguments, **keywords)
-
-
-grace.__doc__ = Selection.grace.__doc__
-
-
-def graces(*arguments, **keywords):
-    return select().graces(*arguments, **keywords)
-
-
-graces.__doc__ = Selection.graces.__doc__
-
-
-def group(*arguments, **keywords):
-    return select().group(*arguments, **keywords)
-
-
-group.__doc__ = Selection.group.__doc__
-
-
-def group_by_measure(*arguments, **keywords):
-    return select().group_by_measure(*arguments, **keywords)
-
-
-group_by_measure.__doc__ = Selection.group_by_measure.__doc__
-
-
-def hleaf(*arguments, **keywords):
-    return select().hleaf(*arguments, **keywords)
-
-
-hleaf.__doc__ = Selection.hleaf.__doc__
-
-
-def hleaves(*arguments, **keywords):
-    return select().hleaves(*arguments, **keywords)
-
-
-hleaves.__doc__ = Selection.hleaves.__doc__
-
-
-def leaf(*arguments, **keywords):
-    return select().leaf(*arguments, **keywords)
-
-
-leaf.__doc__ = Selection.leaf.__doc__
-
-
-def leaves(*arguments, **keywords):
-    return select().leaves(*arguments, **keywords)
-
-
-leaves.__doc__ = Selection.leaves.__doc__
-
-
-def lleaf(*arguments, **keywords):
-    return select().lleaf(*arguments, **keywords)
-
-
-lleaf.__doc__ = Selection.lleaf.__doc__
-
-
-def lleak(*arguments, **keywords):
-    return select().lleak(*arguments, **keywords)
-
-
-lleak.__doc__ = Selection.lleak.__doc__
-
-
-def lleaves(*arguments, **keywords):
-    return select().lleaves(*arguments, **keywords)
-
-
-lleaves.__doc__ = Selection.lleaves.__doc__
-
-
-def logical_ties(*arguments, **keywords):
-    return select().logical_ties(*arguments, **keywords)
-
-
-logical_ties.__doc__ = Selection.logical_ties.__doc__
-
-
-def lparts(*arguments, **keywords):
-    return select().lparts(*arguments, **keywords)
-
-
-lparts.__doc__ = Selection.lparts.__doc__
-
-
-def lt(*arguments, **keywords):
-    return select().lt(*arguments, **keywords)
-
-
-lt.__doc__ = Selection.lt.__doc__
-
-
-def ltleaf(*arguments, **keywords):
-    return select().ltleaf(*arguments, **keywords)
-
-
-ltleaf.__doc__ = Selection.ltleaf.__doc__
-
-
-def ltleaves(*arguments, **keywords):
-    return select().ltleaves(*arguments, **keywords)
-
-
-ltleaves.__doc__ = Selection.ltleaves.__doc__
-
-
-def ltqrun(*arguments, **keywords):
-    return select().ltqrun(*arguments, **keywords)
-
-
-ltqrun.__doc__ = Selection.ltqrun.__doc__
-
-
-def ltqruns(*arguments, **keywords):
-    return select().ltqruns(*arguments, **keywords)
-
-
-ltqruns.__doc__ = Selection.ltqruns.__doc__
-
-
-def ltrun(*arguments, **keywords):
-    return select().ltrun(*arguments, **keywords)
-
-
-ltrun.__doc__ = Selection.ltrun.__doc__
-
-
-def ltruns(*arguments, **keywords):
-    return select().ltruns(*arguments, **keywords)
-
-
-ltruns.__doc__ = Selection.ltruns.__doc__
-
-
-def lts(*arguments, **keywords):
-    return select().lts(*arguments, **keywords)
-
-
-lts.__doc__ = Selection.lts.__doc__
-
-
-def mgroups(*arguments, **keywords):
-    return select().mgroups(*arguments, **keywords)
-
-
-mgroups.__doc__ = Selection.mgroups.__doc__
-
-
-def mleaves(*arguments, **keywords):
-    return select().mleaves(*arguments, **keywords)
-
-
-mleaves.__doc__ = Selection.mleaves.__doc__
-
-
-def mmrest(*arguments, **keywords):
-    return select().mmrest(*arguments, **keywords)
-
-
-mmrest.__doc__ = Selection.mmrest.__doc__
-
-
-def mmrests(*arguments, **keywords):
-    return select().mmrests(*arguments, **keywords)
-
-
-mmrests.__doc__ = Selection.mmrests.__doc__
-
-
-def note(*arguments, **keywords):
-    return select().note(*arguments, **keywords)
-
-
-note.__doc__ = Selection.note.__doc__
-
-
-def notes(*arguments, **keywords):
-    return select().notes(*arguments, **keywords)
-
-
-notes.__doc__ = Selection.notes.__doc__
-
-
-def ntrun(*arguments, **keywords):
-    return select().ntrun(*arguments, **keywords)
-
-
-ntrun.__doc__ = Selection.ntrun.__doc__
-
-
-def ntruns(*arguments, **keywords):
-    return select().ntruns(*arguments, **keywords)
-
-
-ntruns.__doc__ = Selection.ntruns.__doc__
-
-
-def omgroups(*arguments, **keywords):
-    return select().omgroups(*arguments, **keywords)
-
-
-omgroups.__doc__ = Selection.omgroups.__doc__
-
-
-def ompltgroups(*arguments, **keywords):
-    return select().ompltgroups(*arguments, **keywords)
-
-
-ompltgroups.__doc__ = Selection.ompltgroups.__doc__
-
-
-def phead(*arguments, **keywords):
-    return select().phead(*arguments, **keywords)
-
-
-phead.__doc__ = Selection.phead.__doc__
-
-
-def pheads(*arguments, **keywords):
-    return select().pheads(*arguments, **keywords)
-
-
-pheads.__doc__ = Selection.pheads.__doc__
-
-
-def pleaf(*arguments, **keywords):
-    return select().pleaf(*arguments, **keywords)
-
-
-pleaf.__doc__ = Selection.pleaf.__doc__
-
-
-def pleaves(*arguments, **keywords):
-    return select().pleaves(*arguments, **keywords)
-
-
-pleaves.__doc__ = Selection.pleaves.__doc__
-
-
-def plt(*arguments, **keywords):
-    return select().plt(*arguments, **keywords)
-
-
-plt.__doc__ = Selection.plt.__doc__
-
-
-def plts(*arguments, **keywords):
-    return select().plts(*arguments, **keywords)
-
-
-plts.__doc__ = Selection.plts.__doc__
-
-
-def ptail(*arguments, **keywords):
-    return select().ptail(*arguments, **keywords)
-
-
-ptail.__doc__ = Selection.ptail.__doc__
-
-
-def ptails(*arguments, **keywords):
-    return select().ptails(*arguments, **keywords)
-
-
-ptails.__doc__ = Selection.ptails.__doc__
-
-
-def ptlt(*arguments, **keywords):
-    return select().ptlt(*arguments, **keywords)
-
-
-ptlt.__doc__ = Selection.ptlt.__doc__
-
-
-def ptlts(*arguments, **keywords):
-    return select().ptlts(*arguments, **keywords)
-
-
-ptlts.__doc__ = Selection.ptlts.__doc__
-
-
-def qrun(*arguments, **keywords):
-    return select().qrun(*arguments, **keywords)
-
-
-qrun.__doc__ = Selection.qrun.__doc__
-
-
-def qruns(*arguments, **keywords):
-    return select().qruns(*arguments, **keywords)
-
-
-qruns.__doc__ = Selection.qruns.__doc__
-
-
-def rest(*arguments, **keywords):
-    return select().rest(*arguments, **keywords)
-
-
-rest.__doc__ = Selection.rest.__doc__
-
-
-def rests(*arguments, **keywords):
-    return select().rests(*arguments, **keywords)
-
-
-rests.__doc__ = Selection.rests.__doc__
-
-
-def rleaf(*arguments, **keywords):
-    return select().rleaf(*arguments, **keywords)
-
-
-rleaf.__doc__ = Selection.rleaf.__doc__
-
-
-def rleak(*arguments, **keywords):
-    return select().rleak(*arguments, **keywords)
-
-
-rleak.__doc__ = Selection.rleak.__doc__
-
-
-def rleaves(*arguments, **keywords):
-    return select().rleaves(*arguments, **keywords)
-
-
-rleaves.__doc__ = Selection.rleaves.__doc__
-
-
-def rmleaves(*arguments, **keywords):
-    return select().rmleaves(*arguments, **keywords)
-
-
-rmleaves.__doc__ = Selection.rmleaves.__doc__
-
-
-def rrun(*arguments, **keywords):
-    return select().rrun(*arguments, **keywords)
-
-
-rrun.__doc__ = Selection.rrun.__doc__
-
-
-def rruns(*arguments, **keywords):
-    return select().rruns(*arguments, **keywords)
-
-
-rruns.__doc__ = Selection.rruns.__doc__
-
-
-def run(*arguments, **keywords):
-    return select().run(*arguments, **keywords)
-
-
-run.__doc__ = Selection.run.__doc__
-
-
-def runs(*arguments, **keywords):
-    return select().runs(*arguments, **keywords)
-
-
-runs.__doc__ = Selection.runs.__doc__
-
-
-def skip(*arguments, **keywords):
-    return select().skip(*arguments, **keywords)
-
-
-skip.__doc__ = Selection.skip.__doc__
-
-
-def skips(*arguments, **keywords):
-    return select().skips(*arguments, **keywords)
-
-
-skips.__doc__ = Selection.skips.__doc__
-
-
-def tleaf(*arguments, **keywords):
-    return select().tleaf(*arguments, **keywords)
-
-
-tleaf.__doc__ = Selection.tleaf.__doc__
-
-
-def tleaves(*arguments, **keywords):
-    return select().tleaves(*arguments, **keywords)
-
-
-tleaves.__doc__ = Selection.tleaves.__doc__
-
-
-def top(*arguments, **keywords):
-    return select().top(*arguments, **keywords)
-
-
-top.__doc__ = Selection.top.__doc__
-
-
-def tuplet(*arguments, **keywords):
-    return select().tuplet(*arguments, **keywords)
-
-
-tuplet.__doc__ = Selection.tuplet.__doc__
-
-
-def tuplets(*arguments, **keywords):
-    return select().tuplets(*arguments, **keywords)
-
-
-tuplets.__doc__ = Selection.tuplets.__doc__
-
-
-def wleaf(*arguments, **keywords):
-    return select().wleaf(*arguments, **keywords)
-
-
-wleaf.__doc__ = Selection.wleaf.__doc__
-
-
-def wleaves(*arguments, **keywords):
-    return select().wleaves(*arguments, **keywords)
-
 
-wleaves.__doc__ = Selection.wleaves.__doc__
+_name_to_module = {
+    name: module_name for module_name, names in _exports.items() for name in names
+}
+
+
+def _make_selector(name):
+    from .classes import Selection, select
+
+    def selector(*arguments, **keywords):
+        return getattr(select(), name)(*arguments, **keywords)
+
+    selector.__doc__ = getattr(Selection, name).__doc__
+    selector.__module__ = __name__
+    selector.__name__ = name
+    selector.__qualname__ = name
+    return selector
+
+
+def __dir__():
+    names = list(globals())
+    names.extend(_name_to_module)
+    names.extend(_selectors)
+    names.extend(("Path", "tags"))
+    return sorted(set(names))
+
+
+def __getattr__(name):
+    if name in _selectors:
+        value = _make_selector(name)
+    elif name in _name_to_module:
+        module = importlib.import_module(f".{_name_to_module[name]}", __name__)
+        value = getattr(module, name)
+    elif name in ("Path", "tags"):
+        ide = importlib.import_module("ide")
+        value = getattr(ide, name)
+    else:
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+            message = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(message) from None
+    globals()[name] = value
+    return value
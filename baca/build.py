@@ -0,0 +1,524 @@
+"""
+Build library.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import multiprocessing
+import os
+import pickle
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import typing
+
+import ide
+
+import abjad
+from abjadext import rmakers
+
+from . import metadata as baca_metadata
+from . import segmentmaker
+
+### PRIVATE FUNCTIONS ###
+
+
+_cached_file_names = (
+    "__metadata__.py",
+    "__metadata__.json",
+    "__persist__.py",
+    "__persist__.json",
+    "illustration.ly",
+)
+
+_checks_file_name = ".checks.pickle"
+
+_unhashed_directory_names = ("builds", "distribution", "segments")
+
+
+def _cache_key(segment, inputs):
+    metadata, persist, previous_states = inputs
+    hash_ = hashlib.sha256()
+    hash_.update(_library_fingerprint().encode())
+    hash_.update(_score_package_fingerprint(str(segment.parent.parent)).encode())
+    hash_.update((segment / "definition.py").read_bytes())
+    for state in ((metadata, persist),) + previous_states:
+        for text in state or (None, None):
+            hash_.update(b"\0")
+            if text is not None:
+                hash_.update(text.encode())
+    return hash_.hexdigest()
+
+
+def _commit(staging, segment):
+    for name in _cached_file_names:
+        source, target = staging / name, segment / name
+        if target.is_file() and target.read_bytes() == source.read_bytes():
+            continue
+        os.replace(source, target)
+
+
+def _import_definition(segment):
+    name = f"_baca_build_{segment.parent.parent.name}_{segment.name}"
+    spec = importlib.util.spec_from_file_location(name, segment / "definition.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@functools.lru_cache()
+def _library_fingerprint():
+    hash_ = hashlib.sha256()
+    for module in (abjad, rmakers, ide):
+        version = getattr(module, "__version__", None)
+        hash_.update(f"{module.__name__} {version}\n".encode())
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            with open(os.path.join(directory, name), "rb") as file_pointer:
+                hash_.update(name.encode())
+                hash_.update(file_pointer.read())
+    return hash_.hexdigest()
+
+
+def _pdf_is_current(segment):
+    illustration_ly = segment / "illustration.ly"
+    illustration_pdf = segment / "illustration.pdf"
+    if not illustration_pdf.is_file():
+        return False
+    return illustration_ly.stat().st_mtime <= illustration_pdf.stat().st_mtime
+
+
+def _read_cache(staging, cache_directory, key):
+    entry = ide.Path(cache_directory) / key
+    if not all((entry / _).is_file() for _ in _cached_file_names):
+        return False
+    for name in _cached_file_names:
+        shutil.copyfile(entry / name, staging / name)
+    return True
+
+
+def _read_state(segment):
+    state = []
+    for file_name in ("__metadata__.py", "__persist__.py"):
+        if not (segment / file_name).is_file():
+            return None
+        metadata = baca_metadata.get_metadata(segment, file_name=file_name)
+        state.append(baca_metadata.dumps(metadata))
+    return tuple(state)
+
+
+def _run_checks(staging_string):
+    path = ide.Path(staging_string) / _checks_file_name
+    if not path.is_file():
+        return
+    for string, keywords in pickle.loads(path.read_bytes()):
+        score = pickle.loads(string)
+        segmentmaker.SegmentMaker._check_score_wellformedness(score, **keywords)
+
+
+def _run_lilypond(segment_string):
+    segment = ide.Path(segment_string)
+    illustration_ly = segment / "illustration.ly"
+    log = segment / ".log"
+    arguments = [
+        "lilypond",
+        "-dno-point-and-click",
+        "-o",
+        str(segment / "illustration"),
+        str(illustration_ly),
+    ]
+    with open(log, "w") as file_pointer:
+        completed = subprocess.run(
+            arguments, stdout=file_pointer, stderr=subprocess.STDOUT
+        )
+    return completed.returncode
+
+
+def _run_segment(segment_string, staging_string, inputs, cache_directory=None):
+    segment, staging = ide.Path(segment_string), ide.Path(staging_string)
+    metadata, persist, previous_states = inputs
+    key = None
+    if cache_directory is not None:
+        key = _cache_key(segment, inputs)
+        if _read_cache(staging, cache_directory, key):
+            return _read_state(staging), key, True
+    scores_directory = str(segment.parent.parent.parent)
+    if scores_directory not in sys.path:
+        sys.path.insert(0, scores_directory)
+    previous_metadata, previous_persist = None, None
+    if previous_states and previous_states[-1] is not None:
+        previous_metadata = baca_metadata.loads(previous_states[-1][0])
+        previous_persist = baca_metadata.loads(previous_states[-1][1])
+    definition = _import_definition(segment)
+    maker = definition.maker
+    maker._deferred_checks = []
+    lilypond_file = maker.run(
+        do_not_print_timing=True,
+        metadata=metadata and baca_metadata.loads(metadata),
+        persist=persist and baca_metadata.loads(persist),
+        previous_metadata=previous_metadata,
+        previous_persist=previous_persist,
+        segment_directory=segment,
+    )
+    baca_metadata.write_metadata(staging, maker.metadata)
+    baca_metadata.write_metadata(
+        staging, maker.persist, file_name="__persist__.py", variable_name="persist"
+    )
+    abjad.persist.as_ly(lilypond_file, staging / "illustration.ly", align_tags=89)
+    if maker._deferred_checks:
+        string = pickle.dumps(maker._deferred_checks)
+        (staging / _checks_file_name).write_bytes(string)
+    return _read_state(staging), key, False
+
+
+@functools.lru_cache()
+def _score_package_fingerprint(directory):
+    hash_ = hashlib.sha256()
+    for root, directories, file_names in os.walk(directory):
+        directories[:] = sorted(
+            _
+            for _ in directories
+            if _ not in _unhashed_directory_names and not _.startswith((".", "_"))
+        )
+        for name in sorted(file_names):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                with open(path, "rb") as file_pointer:
+                    hash_.update(os.path.relpath(path, directory).encode())
+                    hash_.update(file_pointer.read())
+    return hash_.hexdigest()
+
+
+def _write_cache(segment, cache_directory, key):
+    entry = ide.Path(cache_directory) / key
+    temporary = ide.Path(cache_directory) / f".{key}.{os.getpid()}"
+    temporary.mkdir(parents=True, exist_ok=True)
+    for name in _cached_file_names:
+        shutil.copyfile(segment / name, temporary / name)
+    try:
+        os.replace(temporary, entry)
+    except OSError:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+
+### PUBLIC FUNCTIONS ###
+
+
+def build_segments(
+    segments_directory,
+    *,
+    cache: bool = True,
+    jobs: int = None,
+    lilypond: bool = True,
+) -> abjad.OrderedDict:
+    """
+    Builds segments in ``segments_directory`` with process pool of ``jobs``
+    workers; ``jobs`` defaults to CPU count. Each task runs in fresh worker
+    process.
+
+    Segment N reads metadata and persist that segments 1 through N - 1
+    write. Builder reads metadata and persist of every segment before
+    building any segment. Builder starts segment N speculatively on those
+    inputs, without waiting for earlier segments to finish, and writes
+    segment N output to temporary directory. Builder confirms segment N
+    when segments 1 through N - 1 are confirmed with metadata and persist
+    equal to those segment N read; builder otherwise reruns segment N with
+    confirmed output. Builder moves output of segment into segment
+    directory only on confirmation. Results therefore always equal those
+    of serial build.
+
+    Builder runs wellformedness checks of each segment as separate task in
+    same pool, off critical path of next segment; builder interprets
+    ``illustration.ly`` of each confirmed segment with LilyPond in same
+    pool. Checks and LilyPond interpretation of segment N overlap Python
+    stage of segment N + 1.
+
+    When ``cache`` is true, builder keys each segment on hash of
+    ``definition.py``, metadata and persist of segment and of earlier
+    segments, Python sources of score package outside ``builds``,
+    ``distribution`` and ``segments``, baca sources and abjad, rmakers and
+    ide versions; builder stores confirmed metadata and persist (Python
+    and JSON) and ``illustration.ly`` in ``.cache`` directory of
+    ``segments_directory``. Cache hit skips ``SegmentMaker.run()``; hit
+    with up-to-date ``illustration.pdf`` also skips LilyPond. Segment whose
+    rebuilt metadata and persist are byte-identical to those before leaves
+    key of next segment unchanged; next segment then hits cache.
+
+    Builder writes segment index of ``segments_directory`` once all segments
+    finish.
+
+    Returns ordered dictionary of segment name to status: ``"ok"``,
+    ``"cached"``, ``"failed"``, ``"lilypond failed"`` or ``"skipped"``.
+
+    ..  container:: example
+
+        Makes score package with three segments:
+
+        >>> import tempfile
+        >>> directory = ide.Path(tempfile.mkdtemp()) / "etude" / "etude"
+        >>> segments = directory / "segments"
+        >>> segments.mkdir(parents=True)
+        >>> _ = (directory / "__init__.py").write_text("")
+        >>> string = '''import baca
+        ... maker = baca.SegmentMaker(
+        ...     do_not_check_persistence=True,
+        ...     score_template=baca.SingleStaffScoreTemplate(),
+        ...     spacing=baca.minimum_duration((1, 12)),
+        ...     time_signatures=[{}],
+        ... )
+        ... maker(("Music_Voice", 1), baca.make_notes(), baca.pitch("{}"))
+        ... '''
+        >>> for name in ("A", "B", "C"):
+        ...     (segments / name).mkdir()
+        ...     definition = segments / name / "definition.py"
+        ...     _ = definition.write_text(string.format("(4, 8)", "C4"))
+        ...
+
+        First build runs segments one after another because no segment
+        finds metadata of previous segment on disk:
+
+        >>> statuses = baca.build_segments(segments, jobs=2, lilypond=False)
+        Building A ...
+        Building B ...
+        Building C ...
+
+        >>> for name, status in statuses.items():
+        ...     print(name, status)
+        A ok
+        B ok
+        C ok
+
+        Second build starts all segments at once. Metadata and persist
+        that first build wrote are now inputs to each segment; no segment
+        hits cache:
+
+        >>> statuses = baca.build_segments(segments, jobs=2, lilypond=False)
+        Building A ...
+        Building B ...
+        Building C ...
+
+        >>> for name, status in statuses.items():
+        ...     print(name, status)
+        A ok
+        B ok
+        C ok
+
+        Inputs are now unchanged; every segment hits cache:
+
+        >>> statuses = baca.build_segments(segments, jobs=2, lilypond=False)
+        Building A ...
+        Building B ...
+        Building C ...
+
+        >>> for name, status in statuses.items():
+        ...     print(name, status)
+        A cached
+        B cached
+        C cached
+
+        Changing pitch of segment A leaves metadata and persist of segment
+        A unchanged; segments B and C still hit cache:
+
+        >>> definition = segments / "A" / "definition.py"
+        >>> _ = definition.write_text(string.format("(4, 8)", "D4"))
+        >>> statuses = baca.build_segments(segments, jobs=2, lilypond=False)
+        Building A ...
+        Building B ...
+        Building C ...
+
+        >>> for name, status in statuses.items():
+        ...     print(name, status)
+        A ok
+        B cached
+        C cached
+
+        Changing module in score package invalidates every segment:
+
+        >>> _ = (directory / "library.py").write_text("tempo = 60")
+        >>> statuses = baca.build_segments(segments, jobs=2, lilypond=False)
+        Building A ...
+        Building B ...
+        Building C ...
+
+        >>> for name, status in statuses.items():
+        ...     print(name, status)
+        A ok
+        B ok
+        C ok
+
+        Changing time signature of segment A changes metadata of segment
+        A; builder discards speculative output of segments B and C and
+        reruns both:
+
+        >>> _ = definition.write_text(string.format("(3, 8)", "D4"))
+        >>> statuses = baca.build_segments(segments, jobs=2, lilypond=False)
+        Building A ...
+        Building B ...
+        Building C ...
+        Building B ...
+        Building C ...
+
+        >>> for name, status in statuses.items():
+        ...     print(name, status)
+        A ok
+        B ok
+        C ok
+
+        >>> baca.metadata.get_metadatum(segments / "B", "first_measure_number")
+        2
+
+        Builder writes segment index:
+
+        >>> index = baca.metadata.get_segment_index(segments)
+        >>> [(_, index[_]["first_measure_number"]) for _ in index]
+        [('A', 1), ('B', 2), ('C', 3)]
+
+        >>> (segments / ".index.json").is_file()
+        True
+
+        Builder writes no temporary directories to segment directory:
+
+        >>> sorted(_.name for _ in segments.iterdir() if _.is_dir())
+        ['.cache', 'A', 'B', 'C']
+
+        >>> import shutil
+        >>> shutil.rmtree(directory.parent)
+
+    """
+    segments_directory = ide.Path(segments_directory)
+    segments = [
+        _
+        for _ in segments_directory.list_paths()
+        if not _.name.startswith(".") and (_ / "definition.py").is_file()
+    ]
+    names = [_.name for _ in segments]
+    cache_directory = None
+    if cache:
+        cache_directory = str(segments_directory / ".cache")
+    statuses = abjad.OrderedDict((_, "skipped") for _ in names)
+    # read every input before any segment writes
+    metadatas, persists = [], []
+    for segment in segments:
+        metadata, persist = None, None
+        if (segment / "__metadata__.py").is_file():
+            metadata = baca_metadata.get_metadata(segment)
+            metadata = baca_metadata.dumps(metadata)
+        if (segment / "__persist__.py").is_file():
+            persist = baca_metadata.get_metadata(segment, file_name="__persist__.py")
+            persist = baca_metadata.dumps(persist)
+        metadatas.append(metadata)
+        persists.append(persist)
+    states = [None if None in _ else _ for _ in zip(metadatas, persists)]
+    inputs: typing.List[typing.Any] = [None] * len(segments)
+    outputs: typing.List[typing.Any] = [None] * len(segments)
+    keys: typing.List[typing.Optional[str]] = [None] * len(segments)
+    cached = [False] * len(segments)
+    checked = [False] * len(segments)
+    confirmed = [False] * len(segments)
+    failures: typing.List[typing.Optional[Exception]] = [None] * len(segments)
+    running = [False] * len(segments)
+    attempts = [0] * len(segments)
+    stagings: typing.List[typing.Any] = [None] * len(segments)
+    temporaries: typing.List[str] = []
+    events: queue.Queue = queue.Queue()
+    pending = 0
+    jobs = jobs or os.cpu_count() or 1
+    pool = multiprocessing.Pool(processes=jobs, maxtasksperchild=1)
+
+    def apply(stage, i, function, *arguments):
+        nonlocal pending
+        tag = (stage, i, attempts[i])
+        pending += 1
+        pool.apply_async(
+            function,
+            arguments,
+            callback=lambda _: events.put((tag, _, None)),
+            error_callback=lambda _: events.put((tag, None, _)),
+        )
+
+    def submit(i):
+        print(f"Building {names[i]} ...")
+        attempts[i] += 1
+        if i == 0 or confirmed[i - 1]:
+            previous_states = tuple(outputs[:i])
+        else:
+            previous_states = tuple(states[:i])
+        inputs[i] = (metadatas[i], persists[i], previous_states)
+        outputs[i], checked[i], failures[i] = None, False, None
+        running[i] = True
+        statuses[names[i]] = "skipped"
+        prefix = f".{names[i]}."
+        staging = tempfile.mkdtemp(prefix=prefix, dir=str(segments_directory))
+        stagings[i] = ide.Path(staging)
+        temporaries.append(staging)
+        arguments = (str(segments[i]), staging, inputs[i], cache_directory)
+        apply("python", i, _run_segment, *arguments)
+
+    def settle(i):
+        if running[i] or not (i == 0 or confirmed[i - 1]):
+            return
+        if inputs[i] != (metadatas[i], persists[i], tuple(outputs[:i])):
+            submit(i)
+        elif failures[i] is not None:
+            if statuses[names[i]] != "failed":
+                print(f"{names[i]} failed: {failures[i]!r}")
+                statuses[names[i]] = "failed"
+        elif checked[i]:
+            confirm(i)
+
+    def confirm(i):
+        confirmed[i] = True
+        statuses[names[i]] = "cached" if cached[i] else "ok"
+        _commit(stagings[i], segments[i])
+        if cache_directory is not None and not cached[i]:
+            _write_cache(segments[i], cache_directory, keys[i])
+        if lilypond and not (cached[i] and _pdf_is_current(segments[i])):
+            apply("lilypond", i, _run_lilypond, str(segments[i]))
+        j = i + 1
+        if j == len(segments):
+            return
+        if inputs[j] is None:
+            submit(j)
+        else:
+            settle(j)
+
+    try:
+        for i in range(len(segments)):
+            if i == 0 or states[i - 1] is not None:
+                submit(i)
+        while pending:
+            (stage, i, attempt), result, exception = events.get()
+            pending -= 1
+            if attempt != attempts[i]:
+                continue
+            if stage == "lilypond":
+                if exception is not None:
+                    print(f"{names[i]} failed: {exception!r}")
+                    statuses[names[i]] = "failed"
+                elif result != 0:
+                    statuses[names[i]] = "lilypond failed"
+                continue
+            if stage == "python":
+                running[i] = False
+                if exception is None:
+                    outputs[i], keys[i], cached[i] = result
+                    if cached[i]:
+                        checked[i] = True
+                    else:
+                        apply("checks", i, _run_checks, str(stagings[i]))
+            elif exception is None:
+                checked[i] = True
+            if exception is not None:
+                failures[i] = exception
+            settle(i)
+        baca_metadata.get_segment_index(segments_directory)
+    finally:
+        pool.terminate()
+        pool.join()
+        for temporary in temporaries:
+            shutil.rmtree(temporary, ignore_errors=True)
+    return statuses
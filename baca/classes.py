@@ -2,6 +2,7 @@ import collections
 import copy
 import inspect
 import itertools
+import re
 import typing
 
 import uqbar
@@ -1454,6 +1455,290 @@ class SchemeManifest:
         raise KeyError(dynamic)
 
 
+class _SelectionExpression(abjad.Expression):
+    """
+    Selection expression.
+
+    Compiles callbacks to plan of Python functions on first call and caches
+    plan on expression. Plan evaluates method callbacks without rebuilding
+    evaluation globals or reparsing evaluation templates at each call.
+
+    Logical-tie callbacks (``logical_ties()``, ``lts()``, ``plts()``,
+    ``ptlts()``) compile to one leaf walk with exclude, grace and pitch
+    predicates pushed down; walk keeps logical ties unique by head leaf instead
+    of hashing logical ties.
+
+    Plan steps that depend only on score structure (leaves, logical ties,
+    runs, tuplets, measures, leak neighbors) memoize in active selection index.
+
+    Calls with keywords, with other than one argument or with callbacks that
+    depend on map index evaluate as ``abjad.Expression``.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_plan",)
+
+    _indexed_methods = frozenset(
+        [
+            "__getitem__",
+            "chead",
+            "cheads",
+            "chord",
+            "chords",
+            "clparts",
+            "cmgroups",
+            "components",
+            "exclude",
+            "flatten",
+            "get",
+            "graces",
+            "group_by_contiguity",
+            "group_by_duration",
+            "group_by_length",
+            "group_by_measure",
+            "hleaf",
+            "hleaves",
+            "leaf",
+            "leaves",
+            "lleaf",
+            "lleak",
+            "lleaves",
+            "logical_ties",
+            "lparts",
+            "lt",
+            "ltleaf",
+            "ltleaves",
+            "ltrun",
+            "ltruns",
+            "lts",
+            "mgroups",
+            "mleaves",
+            "mmrest",
+            "mmrests",
+            "nontrivial",
+            "note",
+            "notes",
+            "ntrun",
+            "ntruns",
+            "omgroups",
+            "ompltgroups",
+            "partition_by_counts",
+            "partition_by_durations",
+            "partition_by_ratio",
+            "phead",
+            "pheads",
+            "pleaf",
+            "pleaves",
+            "plt",
+            "plts",
+            "ptail",
+            "ptails",
+            "ptlt",
+            "ptlts",
+            "rest",
+            "rests",
+            "rleaf",
+            "rleak",
+            "rleaves",
+            "rmleaves",
+            "rrun",
+            "rruns",
+            "run",
+            "runs",
+            "skip",
+            "skips",
+            "tleaf",
+            "tleaves",
+            "top",
+            "tuplet",
+            "tuplets",
+            "wleaf",
+            "wleaves",
+            "with_next_leaf",
+            "with_previous_leaf",
+        ]
+    )
+
+    _logical_tie_methods = {
+        "logical_ties": {},
+        "lts": {},
+        "plts": {"pitched": True},
+        "ptlts": {"nontrivial": False, "pitched": True},
+    }
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, *arguments, **keywords):
+        """
+        Calls expression on ``arguments``.
+        """
+        if len(arguments) != 1 or keywords:
+            return super().__call__(*arguments, **keywords)
+        try:
+            plan = self._plan
+        except AttributeError:
+            plan = self._plan = self._compile()
+        if plan is None:
+            return super().__call__(*arguments)
+        result = arguments[0]
+        memo, key = None, ()
+        if SelectionIndex._current is not None:
+            memo = SelectionIndex._current._get_memo(result)
+        for key_, function in plan:
+            if memo is None or key_ is None:
+                memo, result = None, function(result)
+                continue
+            key += (key_,)
+            try:
+                result = memo[key]
+            except KeyError:
+                result = memo[key] = function(result)
+        return result
+
+    def __getstate__(self) -> dict:
+        """
+        Gets state of expression.
+
+        Omits compiled plan; plan holds closures and recompiles on first call
+        after unpickling.
+
+        ..  container:: example
+
+            >>> import pickle
+            >>> staff = abjad.Staff("c'8 d'8 ~ d'8 r8")
+            >>> selector = baca.select().plts().map(baca.select().leaf(0))
+            >>> selector(staff)
+            Selection([Note("c'8"), Note("d'8")])
+
+            >>> selector_ = pickle.loads(pickle.dumps(selector))
+            >>> selector_ == selector
+            True
+
+            >>> selector_(staff)
+            Selection([Note("c'8"), Note("d'8")])
+
+        """
+        state = {}
+        for class_ in type(self).__mro__:
+            for slot in getattr(class_, "__slots__", ()):
+                if slot == "_plan":
+                    continue
+                try:
+                    state[slot] = getattr(self, slot)
+                except AttributeError:
+                    pass
+        return state
+
+    def __setstate__(self, state) -> None:
+        """
+        Sets state of expression.
+        """
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _compile_callback(callback):
+        template = callback.evaluation_template
+        if template is None:
+            return None, callback
+        return (
+            _SelectionExpression._get_index_key(callback),
+            _SelectionExpression._compile_function(callback),
+        )
+
+    @staticmethod
+    def _compile_function(callback):
+        template = callback.evaluation_template
+        if template == "map":
+            return _SelectionExpression._compile_map(callback.map_operand)
+        if callback.is_initializer:
+            class_ = eval(template, callback._make_globals())
+            keywords = dict(callback.keywords or {})
+
+            def initialize(argument):
+                if argument is None:
+                    return class_(**keywords)
+                return class_(argument, **keywords)
+
+            return initialize
+        if template == "group_by" or callback.subclass_hook or callback.force_return:
+            return callback._evaluate
+        match = re.fullmatch(r"\{\}\.(\w+)\((.*)\)", template)
+        if match and match.group(1) in _SelectionExpression._logical_tie_methods:
+            return _SelectionExpression._compile_logical_ties(
+                callback, match.group(1), match.group(2)
+            )
+        string = "lambda __argument_0: " + template.format("__argument_0")
+        return eval(string, callback._make_globals())
+
+    @staticmethod
+    def _compile_logical_ties(callback, method_name, string):
+        keywords = eval(f"dict({string})", callback._make_globals())
+        keywords_ = dict(keywords)
+        keywords_.update(_SelectionExpression._logical_tie_methods[method_name])
+        nontrivial = keywords_.pop("nontrivial", None)
+        if not set(keywords_) <= {"exclude", "grace", "pitched", "reverse"}:
+            raise ValueError(keywords)
+
+        def logical_ties(argument):
+            if not isinstance(argument, abjad.Selection):
+                return getattr(argument, method_name)(**keywords)
+            generator = Selection._iterate_logical_ties(
+                argument, nontrivial=nontrivial, **keywords_
+            )
+            return type(argument)(generator, previous=argument._previous)
+
+        return logical_ties
+
+    @staticmethod
+    def _get_index_key(callback):
+        template = callback.evaluation_template
+        if callback.is_initializer:
+            if callback.keywords:
+                return None
+            return template
+        match = re.match(r"\{\}\.(\w+)\(", template)
+        if match and match.group(1) in _SelectionExpression._indexed_methods:
+            return template
+        return None
+
+    @staticmethod
+    def _compile_map(map_operand):
+        def map_(argument):
+            class_ = type(argument)
+            items = []
+            for i, item in enumerate(argument):
+                if hasattr(map_operand, "_set_map_index"):
+                    map_operand._set_map_index(i)
+                items.append(map_operand(item))
+            try:
+                return class_(items)
+            except TypeError:
+                return items
+
+        return map_
+
+    def _compile(self):
+        if self.subexpressions or self.evaluation_template is not None:
+            return None
+        plan = []
+        for callback in self.callbacks or []:
+            if not isinstance(callback, abjad.Expression):
+                return None
+            template = callback.evaluation_template or ""
+            if "_map_index=None" in template:
+                return None
+            try:
+                step = self._compile_callback(callback)
+            except (IndexError, KeyError, NameError, SyntaxError, ValueError):
+                return None
+            plan.append(step)
+        return plan
+
+
 class Selection(abjad.Selection):
     """
     Selection.
@@ -1471,6 +1756,105 @@ class Selection(abjad.Selection):
 
     __slots__ = ()
 
+    _trim_prototype = (abjad.MultimeasureRest, abjad.Rest, abjad.Skip)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_nth(n, make_generator):
+        # walks forward for nonnegative n and backward for negative n
+        if n < 0:
+            generator, n = make_generator(True), -n - 1
+        else:
+            generator = make_generator(False)
+        for i, item in enumerate(generator):
+            if i == n:
+                return item
+        raise IndexError("selection index out of range.")
+
+    @staticmethod
+    def _iterate_logical_ties(
+        argument,
+        *,
+        exclude=None,
+        grace=None,
+        nontrivial=None,
+        pitched=None,
+        reverse=None,
+    ):
+        heads = set()
+        for leaf in abjad.iterate(argument).leaves(
+            exclude=exclude, grace=grace, pitched=pitched, reverse=reverse
+        ):
+            leaves = abjad._iterate._get_logical_tie_leaves(leaf)
+            if leaf is not leaves[0] or id(leaf) in heads:
+                continue
+            if nontrivial is True and len(leaves) == 1:
+                continue
+            if nontrivial is False and len(leaves) != 1:
+                continue
+            heads.add(id(leaf))
+            yield abjad.LogicalTie(leaves)
+
+    def _iterate_leaves(
+        self,
+        *,
+        exclude=None,
+        grace=None,
+        pitched=None,
+        prototype=None,
+        reverse=None,
+        trim=None,
+    ):
+        if pitched:
+            prototype = (abjad.Chord, abjad.Note)
+        elif prototype is None:
+            prototype = abjad.Leaf
+        generator = abjad.iterate(self).leaves(
+            prototype, exclude=exclude, grace=grace, reverse=reverse
+        )
+        if not trim:
+            yield from generator
+            return
+        # trims rests at start of walk; buffers rests until next good leaf
+        # when walk must also trim rests at end of walk
+        trim_start = trim is True or not reverse
+        trim_stop = trim is True or bool(reverse)
+        found_good_leaf, rests = False, []
+        for leaf in generator:
+            if not isinstance(leaf, self._trim_prototype):
+                found_good_leaf = True
+                yield from rests
+                rests.clear()
+                yield leaf
+            elif found_good_leaf or not trim_start:
+                if trim_stop:
+                    rests.append(leaf)
+                else:
+                    yield leaf
+
+    def _iterate_leaves_with_neighbor(self, n, reverse, *, exclude=None):
+        # walks leaves with previous leaf (n=-1) or next leaf (n=1)
+        leaves = self._iterate_leaves(exclude=exclude, reverse=reverse)
+        if (n == 1) == bool(reverse):
+            leaf = next(leaves, None)
+            if leaf is None:
+                raise IndexError("selection index out of range.")
+            neighbor = abjad._iterate._get_leaf(leaf, n=n)
+            if neighbor is not None:
+                yield neighbor
+            yield leaf
+            yield from leaves
+            return
+        leaf = None
+        for leaf in leaves:
+            yield leaf
+        if leaf is None:
+            raise IndexError("selection index out of range.")
+        neighbor = abjad._iterate._get_leaf(leaf, n=n)
+        if neighbor is not None:
+            yield neighbor
+
     ### PUBLIC METHODS ###
 
     def chead(
@@ -2328,7 +2712,11 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.hleaves(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_leaves(exclude=exclude, grace=False, reverse=reverse)
+
+        return self._get_nth(n, make_generator)
 
     def hleaves(
         self, *, exclude: abjad.Strings = None
@@ -2433,6 +2821,76 @@ class Selection(abjad.Selection):
             return self._update_expression(inspect.currentframe())
         return self.leaves(exclude=exclude, grace=False)
 
+    def leaf(
+        self,
+        n: int,
+        *,
+        exclude: abjad.Strings = None,
+        grace: bool = None,
+        head: bool = None,
+        pitched: bool = None,
+        prototype=None,
+        reverse: bool = None,
+        tail: bool = None,
+        trim: typing.Union[bool, int] = None,
+    ) -> typing.Union[abjad.Leaf, abjad.Expression]:
+        r"""
+        Selects leaf ``n``.
+
+        Walks leaves forward for nonnegative ``n`` and backward for negative
+        ``n``; stops at leaf ``n``.
+
+        ..  container:: example
+
+            Selects leaf -1:
+
+            ..  container:: example
+
+                >>> staff = abjad.Staff("c'8 r8 d'8 e'8 r8 f'8 g'8 a'8")
+                >>> abjad.setting(staff).autoBeaming = False
+                >>> abjad.show(staff) # doctest: +SKIP
+
+                >>> baca.select(staff).leaf(-1)
+                Note("a'8")
+
+                >>> baca.select(staff).leaf(-1, pitched=False)
+                Note("a'8")
+
+            ..  container:: example expression
+
+                >>> selector = baca.select().leaf(-1)
+                >>> result = selector(staff)
+
+                >>> selector.print(result)
+                Note("a'8")
+
+        """
+        if self._expression:
+            return self._update_expression(inspect.currentframe(), lone=True)
+        if head is not None or tail is not None or trim:
+            return super().leaf(
+                n,
+                exclude=exclude,
+                grace=grace,
+                head=head,
+                pitched=pitched,
+                prototype=prototype,
+                reverse=reverse,
+                tail=tail,
+                trim=trim,
+            )
+
+        def make_generator(reverse):
+            return self._iterate_leaves(
+                exclude=exclude,
+                grace=grace,
+                pitched=pitched,
+                prototype=prototype,
+                reverse=reverse,
+            )
+
+        return self._get_nth(n, make_generator)
+
     def lleaf(
         self, n: int = 0, *, exclude: abjad.Strings = None
     ) -> typing.Union[abjad.Leaf, abjad.Expression]:
@@ -2528,7 +2986,11 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.lleaves(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_leaves_with_neighbor(-1, reverse, exclude=exclude)
+
+        return self._get_nth(n, make_generator)
 
     def lleak(self) -> typing.Union[abjad.Selection, abjad.Expression]:
         r"""
@@ -2937,7 +3399,11 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.lts(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_logical_ties(self, exclude=exclude, reverse=reverse)
+
+        return self._get_nth(n, make_generator)
 
     def ltleaf(
         self, n: int = 0, *, exclude: abjad.Strings = None
@@ -3035,7 +3501,13 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.ltleaves(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_leaves(
+                exclude=exclude, reverse=reverse, trim=abjad.Left
+            )
+
+        return self._get_nth(n, make_generator)
 
     def ltleaves(
         self, *, exclude: abjad.Strings = None
@@ -4082,7 +4554,13 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.mmrests(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_leaves(
+                exclude=exclude, prototype=abjad.MultimeasureRest, reverse=reverse
+            )
+
+        return self._get_nth(n, make_generator)
 
     def mmrests(
         self, *, exclude: abjad.Strings = None
@@ -4570,7 +5048,13 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.pheads(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_logical_ties(
+                self, exclude=exclude, pitched=True, reverse=reverse
+            )
+
+        return self._get_nth(n, make_generator).head
 
     def pheads(
         self, *, exclude: abjad.Strings = None, grace: bool = None
@@ -4806,7 +5290,13 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.pleaves(exclude=exclude, grace=grace)[n]
+
+        def make_generator(reverse):
+            return self._iterate_leaves(
+                exclude=exclude, grace=grace, pitched=True, reverse=reverse
+            )
+
+        return self._get_nth(n, make_generator)
 
     def pleaves(
         self, *, exclude: abjad.Strings = None, grace: bool = None
@@ -5049,7 +5539,13 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.plts(exclude=exclude, grace=grace)[n]
+
+        def make_generator(reverse):
+            return self._iterate_logical_ties(
+                self, exclude=exclude, grace=grace, pitched=True, reverse=reverse
+            )
+
+        return self._get_nth(n, make_generator)
 
     def plts(
         self, *, exclude: abjad.Strings = None, grace: bool = None
@@ -5285,7 +5781,13 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.ptails(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_logical_ties(
+                self, exclude=exclude, pitched=True, reverse=reverse
+            )
+
+        return self._get_nth(n, make_generator).tail
 
     def ptails(
         self, *, exclude: abjad.Strings = None
@@ -5521,7 +6023,13 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.ptlts(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_logical_ties(
+                self, exclude=exclude, nontrivial=False, pitched=True, reverse=reverse
+            )
+
+        return self._get_nth(n, make_generator)
 
     def ptlts(
         self, *, exclude: abjad.Strings = None
@@ -5975,7 +6483,11 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.rleaves(exclude=exclude)[n]
+
+        def make_generator(reverse):
+            return self._iterate_leaves_with_neighbor(1, reverse, exclude=exclude)
+
+        return self._get_nth(n, make_generator)
 
     def rleak(
         self, *, grace: bool = None
@@ -6714,7 +7226,13 @@ class Selection(abjad.Selection):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe(), lone=True)
-        return self.tleaves(exclude=exclude, grace=grace)[n]
+
+        def make_generator(reverse):
+            return self._iterate_leaves(
+                exclude=exclude, grace=grace, reverse=reverse, trim=True
+            )
+
+        return self._get_nth(n, make_generator)
 
     def tleaves(
         self, *, exclude: abjad.Strings = None, grace: bool = None
@@ -7173,6 +7691,101 @@ class Selection(abjad.Selection):
         return self.leaves(exclude=exclude).with_previous_leaf().with_next_leaf()
 
 
+class SelectionIndex:
+    """
+    Selection index.
+
+    ..  container:: example
+
+        Selector expressions memoize structural selections of leaves while
+        index is active; later selectors on same leaves reuse logical ties,
+        runs, tuplets, measure groups and leak neighbors:
+
+        >>> staff = abjad.Staff("c'8 d'8 ~ d'8 r8 e'8 f'8")
+        >>> index = baca.SelectionIndex()
+        >>> with index:
+        ...     plts = baca.plts()(abjad.select(staff).leaves())
+        ...     baca.plts()(abjad.select(staff).leaves()) is plts
+        ...
+        True
+
+        >>> len(index)
+        1
+
+        >>> baca.plts()(abjad.select(staff).leaves()) is plts
+        False
+
+        Clear index when score changes:
+
+        >>> index.clear()
+        >>> len(index)
+        0
+
+    Segment-maker clears index after each command that mutates score or
+    attaches or detaches ties.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Classes"
+
+    __slots__ = ("_entries", "_previous")
+
+    _current: typing.Optional["SelectionIndex"] = None
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._entries: typing.Dict[typing.Tuple, typing.Tuple] = {}
+        self._previous: typing.Optional[SelectionIndex] = None
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "SelectionIndex":
+        """
+        Activates index.
+        """
+        self._previous = SelectionIndex._current
+        SelectionIndex._current = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Deactivates index.
+        """
+        SelectionIndex._current = self._previous
+        self._previous = None
+
+    def __len__(self) -> int:
+        """
+        Gets number of indexed arguments.
+        """
+        return len(self._entries)
+
+    ### PRIVATE METHODS ###
+
+    def _get_memo(self, argument):
+        # keys by leaf identity; entry keeps leaves alive so ids stay unique
+        if not isinstance(argument, abjad.Selection):
+            return None
+        items = argument.items
+        if not all(isinstance(_, abjad.Leaf) for _ in items):
+            return None
+        key = (type(argument), tuple(id(_) for _ in items))
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = (items, {})
+        return entry[1]
+
+    ### PUBLIC METHODS ###
+
+    def clear(self) -> None:
+        """
+        Clears index.
+        """
+        self._entries.clear()
+
+
 class Sequence(abjad.Sequence):
     r"""
     Sequence.
@@ -10749,7 +11362,7 @@ class Tree:
 def select(items=None):
     if items is not None:
         return Selection(items=items)
-    expression = abjad.Expression(proxy_class=Selection)
+    expression = _SelectionExpression(proxy_class=Selection)
     callback = abjad.Expression._make_initializer_callback(
         Selection, callback_class=abjad.Expression, module_names=["baca"]
     )
@@ -1159,6 +1159,11 @@ class DetachCommand(scoping.Command):
             for argument in self.arguments:
                 abjad.detach(argument, leaf)
 
+    ### PRIVATE METHODS ###
+
+    def _changes_selections(self):
+        return True
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1572,6 +1577,15 @@ class IndicatorCommand(scoping.Command):
 
     ### PRIVATE METHODS ###
 
+    def _changes_selections(self):
+        # ties change logical ties; strings may be exclude tags
+        prototype = (str, abjad.RepeatTie, abjad.Tie)
+        for token in self.indicators or []:
+            for indicator in self._token_to_indicators(token):
+                if isinstance(indicator, prototype):
+                    return True
+        return False
+
     @staticmethod
     def _token_to_indicators(token):
         result = []
@@ -1891,6 +1905,9 @@ class PartAssignmentCommand(scoping.Command):
 
     ### PRIVATE METHODS ###
 
+    def _changes_selections(self):
+        return True
+
     def _mutates_score(self):
         # return True
         return False
@@ -11,6 +11,7 @@ from . import (
     const,
     indicatorcommands,
     indicators,
+    metadata,
     overrides,
     pitchcommands,
     scoping,
@@ -3081,7 +3082,7 @@ def previous_metadata(path: str) -> abjad.OrderedDict:
         return abjad.OrderedDict()
     previous_index = index - 1
     previous_segment = paths[previous_index]
-    previous_metadata = previous_segment.get_metadata()
+    previous_metadata = metadata.get_metadata(previous_segment)
     return previous_metadata
 
 
@@ -1,4 +1,6 @@
+import bisect
 import copy
+import functools
 import math
 import typing
 
@@ -93,6 +95,65 @@ class Stack:
         """
         return list(self._commands)
 
+    ### PUBLIC METHODS ###
+
+    def iterate(
+        self, argument: typing.Any, **keywords
+    ) -> typing.Iterator[typing.Tuple[abjad.Selection, dict]]:
+        r"""
+        Iterates stack on ``argument``.
+
+        First command must implement ``iterate()``. Stack calls remaining
+        commands on each tuplet as first command yields tuplet; stack then
+        yields selection together with state after tuplet. Use only with
+        commands that act on one tuplet at a time.
+
+        ..  container:: example
+
+            >>> stack = baca.stack(
+            ...     baca.figure([1, 1, 2], 16),
+            ...     rmakers.beam(),
+            ... )
+            >>> collections = [[0, 2, 10], [18, 16, 15, 20, 19], [9]]
+            >>> for selection, state in stack.iterate(collections):
+            ...     string = abjad.lilypond(selection[0])
+            ...     print(string)
+            \scaleDurations #'(1 . 1) {
+                c'16
+                [
+                d'16
+                bf'8
+                ]
+            }
+            \scaleDurations #'(1 . 1) {
+                fs''16
+                [
+                e''16
+                ef''8
+                af''16
+                g''16
+                ]
+            }
+            \scaleDurations #'(1 . 1) {
+                a'8
+            }
+
+        """
+        if not self.commands or not hasattr(self.commands[0], "iterate"):
+            raise Exception(f"first command must iterate: {self.commands!r}.")
+        for tuplet, state in self.commands[0].iterate(argument, **keywords):
+            result = abjad.select([tuplet])
+            for command in self.commands[1:]:
+                try:
+                    result_ = command(result)
+                except Exception:
+                    message = "exception while calling:\n"
+                    message += f"   {abjad.storage(command)}"
+                    raise Exception(message)
+                if result_ is not None:
+                    result = result_
+            yield result, state
+
 
 class LMR:
     """
@@ -2005,10 +2066,6 @@ class Imbrication:
 
         :param container: container.
         """
-        original_container = container
-        container = copy.deepcopy(container)
-        abjad.override(container).TupletBracket.stencil = False
-        abjad.override(container).TupletNumber.stencil = False
         segment = classes.Sequence(self.segment).flatten(depth=-1)
         if self.by_pitch_class:
             segment = classes.Sequence([abjad.NumberedPitchClass(_) for _ in segment])
@@ -2016,69 +2073,58 @@ class Imbrication:
             singletons=True, source=segment, suppress_exception=True
         )
         pitch_number = cursor.next()
-        if self.selector is not None:
-            selection = self.selector(original_container)
         selected_logical_ties = None
         if self.selector is not None:
             selection = self.selector(container)
             agent = abjad.iterate(selection)
             selected_logical_ties = agent.logical_ties(pitched=True)
             selected_logical_ties = list(selected_logical_ties)
-        selector = abjad.select(original_container)
-        original_logical_ties = selector.logical_ties()
-        logical_ties = abjad.select(container).logical_ties()
-        pairs = zip(logical_ties, original_logical_ties)
-        for logical_tie, original_logical_tie in pairs:
+        replacements: typing.Dict[int, abjad.Leaf] = {}
+        truncated_logical_ties = []
+        hocketed_logical_ties = []
+        for logical_tie in abjad.select(container).logical_ties():
             if (
                 selected_logical_ties is not None
                 and logical_tie not in selected_logical_ties
             ):
-                for leaf in logical_tie:
-                    duration = leaf.written_duration
-                    skip = abjad.Skip(duration)
-                    abjad.mutate.replace(leaf, [skip])
+                self._replace_with_skips(logical_tie, replacements)
             elif isinstance(logical_tie.head, abjad.Rest):
-                for leaf in logical_tie:
-                    duration = leaf.written_duration
-                    skip = abjad.Skip(duration)
-                    abjad.mutate.replace(leaf, [skip])
+                self._replace_with_skips(logical_tie, replacements)
             elif isinstance(logical_tie.head, abjad.Skip):
                 pass
             elif self._matches_pitch(logical_tie.head, pitch_number):
                 if isinstance(pitch_number, Coat):
-                    for leaf in logical_tie:
-                        duration = leaf.written_duration
-                        skip = abjad.Skip(duration)
-                        abjad.mutate.replace(leaf, [skip])
+                    self._replace_with_skips(logical_tie, replacements)
                     pitch_number = cursor.next()
                     continue
-                self._trim_matching_chord(logical_tie, pitch_number)
+                self._trim_matching_chord(logical_tie, pitch_number, replacements)
                 pitch_number = cursor.next()
                 if self.truncate_ties:
-                    head = logical_tie.head
-                    tail = logical_tie.tail
-                    for leaf in logical_tie[1:]:
-                        duration = leaf.written_duration
-                        skip = abjad.Skip(duration)
-                        abjad.mutate.replace(leaf, [skip])
-                    abjad.detach(abjad.Tie, head)
-                    next_leaf = abjad.get.leaf(tail, 1)
-                    if next_leaf is not None:
-                        abjad.detach(abjad.RepeatTie, next_leaf)
+                    self._replace_with_skips(logical_tie[1:], replacements)
+                    if isinstance(logical_tie.head, abjad.Note):
+                        truncated_logical_ties.append(logical_tie)
                 if self.hocket:
-                    for leaf in original_logical_tie:
-                        duration = leaf.written_duration
-                        skip = abjad.Skip(duration)
-                        abjad.mutate.replace(leaf, [skip])
+                    hocketed_logical_ties.append(logical_tie)
             else:
-                for leaf in logical_tie:
-                    duration = leaf.written_duration
-                    skip = abjad.Skip(duration)
-                    abjad.mutate.replace(leaf, [skip])
+                self._replace_with_skips(logical_tie, replacements)
         if not self.allow_unused_pitches and not cursor.is_exhausted:
             current, total = cursor.position - 1, len(cursor)
             message = f"{cursor!r} used only {current} of {total} pitches."
             raise Exception(message)
+        container, copies = self._copy_with_replacements(container, replacements)
+        abjad.override(container).TupletBracket.stencil = False
+        abjad.override(container).TupletNumber.stencil = False
+        for logical_tie in truncated_logical_ties:
+            head = copies[id(logical_tie.head)]
+            abjad.detach(abjad.Tie, head)
+            if len(logical_tie) == 1:
+                next_leaf = abjad.get.leaf(head, 1)
+                if next_leaf is not None:
+                    abjad.detach(abjad.RepeatTie, next_leaf)
+        for logical_tie in hocketed_logical_ties:
+            for leaf in logical_tie:
+                skip = abjad.Skip(leaf.written_duration)
+                abjad.mutate.replace(leaf, [skip])
         self._call_commands(container)
         selection = abjad.select(container)
         if not self.hocket:
@@ -2090,6 +2136,40 @@ class Imbrication:
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _copy_with_replacements(container, replacements):
+        copies = {}
+        prototype = (abjad.AfterGraceContainer, abjad.BeforeGraceContainer)
+        leaves = abjad.select(container).leaves()
+        if any(isinstance(abjad.get.parentage(_).parent, prototype) for _ in leaves):
+            container_ = copy.deepcopy(container)
+            for leaf, leaf_ in zip(leaves, abjad.select(container_).leaves()):
+                replacement = replacements.get(id(leaf))
+                if replacement is None:
+                    copies[id(leaf)] = leaf_
+                else:
+                    abjad.mutate.replace(leaf_, [replacement])
+                    copies[id(leaf)] = replacement
+            return container_, copies
+
+        def recurse(component):
+            if isinstance(component, abjad.Leaf):
+                component_ = replacements.get(id(component))
+                if component_ is None:
+                    component_ = copy.copy(component)
+                copies[id(component)] = component_
+                return component_
+            container_ = copy.copy(component)
+            if isinstance(component, abjad.Tuplet):
+                container_.denominator = component.denominator
+                container_.force_fraction = component.force_fraction
+                container_.hide = component.hide
+                container_._tweaks = copy.deepcopy(component._tweaks)
+            container_.extend([recurse(_) for _ in component])
+            return container_
+
+        return recurse(container), copies
+
     def _call_commands(self, container):
         assert isinstance(container, abjad.Container), repr(container)
         nested_selections = None
@@ -2147,7 +2227,12 @@ class Imbrication:
         return pitch_object in source
 
     @staticmethod
-    def _trim_matching_chord(logical_tie, pitch_object):
+    def _replace_with_skips(leaves, replacements):
+        for leaf in leaves:
+            replacements[id(leaf)] = abjad.Skip(leaf.written_duration)
+
+    @staticmethod
+    def _trim_matching_chord(logical_tie, pitch_object, replacements):
         if isinstance(logical_tie.head, abjad.Note):
             return
         assert isinstance(logical_tie.head, abjad.Chord), repr(logical_tie)
@@ -2155,8 +2240,7 @@ class Imbrication:
             raise NotImplementedError(logical_tie, pitch_object)
         for chord in logical_tie:
             duration = chord.written_duration
-            note = abjad.Note(pitch_object, duration)
-            abjad.mutate.replace(chord, [note])
+            replacements[id(chord)] = abjad.Note(pitch_object, duration)
 
     ### PUBLIC PROPERTIES ###
 
@@ -3519,6 +3603,36 @@ class Accumulator:
             ...
         Exception: duplicate figure name: 'D'.
 
+    ..  container:: example exception
+
+        Raises exception on overlapping figures in one voice.
+
+        >>> template = baca.StringTrioScoreTemplate()
+        >>> accumulator = baca.Accumulator(template)
+
+        >>> commands = [
+        ...     baca.figure([1], 16, signature=16),
+        ...     rmakers.beam(),
+        ... ]
+
+        >>> accumulator(
+        ...     'Violin_Music_Voice',
+        ...     [[0, 1, 2, 3]],
+        ...     *commands,
+        ...     figure_name='D',
+        ... )
+
+        >>> accumulator(
+        ...     'Violin_Music_Voice',
+        ...     [[4, 5, 6, 7]],
+        ...     *commands,
+        ...     anchor=baca.anchor_to_figure('D'),
+        ...     figure_name='E',
+        ... )
+        Traceback (most recent call last):
+            ...
+        Exception: figure 'E' overlaps figure 'D' in Violin_Music_Voice: 0 to 1/4 against 0 to 1/4.
+
     """
 
     ### CLASS VARIABLES ###
@@ -3527,11 +3641,14 @@ class Accumulator:
         "_current_offset",
         "_figure_index",
         "_figure_names",
+        "_figure_start_offsets",
         "_floating_selections",
+        "_leaf_timespans",
         "_music_maker",
         "_score_stop_offset",
         "_score_template",
         "_time_signatures",
+        "_timelines",
         "_voice_names",
     )
 
@@ -3547,9 +3664,12 @@ class Accumulator:
         self._current_offset = abjad.Offset(0)
         self._figure_index = 0
         self._figure_names: typing.List[str] = []
+        self._figure_start_offsets: typing.Dict[str, abjad.Offset] = {}
         self._floating_selections = self._make_voice_dictionary()
+        self._leaf_timespans: typing.Dict[int, typing.Tuple[str, abjad.Timespan]] = {}
         self._score_stop_offset = abjad.Offset(0)
         self._time_signatures: typing.List[abjad.TimeSignature] = []
+        self._timelines = {_: _Timeline() for _ in self._voice_names}
 
     ### SPECIAL METHODS ###
 
@@ -3675,7 +3795,13 @@ class Accumulator:
                 timespan.stop_offset,
                 annotation=selection,
             )
+            if contribution.figure_name is not None:
+                figure = f"figure {contribution.figure_name!r}"
+            else:
+                figure = f"figure {self._figure_index}"
+            self._timelines[voice_name].insert(floating_selection, figure, voice_name)
             self._floating_selections[voice_name].append(floating_selection)
+            self._index_floating_selection(voice_name, floating_selection)
         self._current_offset = stop_offset
         self._score_stop_offset = max(self._score_stop_offset, stop_offset)
 
@@ -3705,42 +3831,16 @@ class Accumulator:
             raise Exception(collections)
 
     def _get_figure_start_offset(self, figure_name):
-        for voice_name in sorted(self._floating_selections.keys()):
-            for floating_selection in self._floating_selections[voice_name]:
-                leaf_start_offset = floating_selection.start_offset
-                leaves = abjad.iterate(floating_selection.annotation).leaves()
-                for leaf in leaves:
-                    markup = abjad.get.indicators(leaf, abjad.Markup)
-                    for markup_ in markup:
-                        if isinstance(
-                            markup_._annotation, str
-                        ) and markup_._annotation.startswith("figure name: "):
-                            figure_name_ = markup_._annotation
-                            figure_name_ = figure_name_.replace("figure name: ", "")
-                            if figure_name_ == figure_name:
-                                return leaf_start_offset
-                    leaf_duration = abjad.get.duration(leaf)
-                    leaf_start_offset += leaf_duration
-        raise Exception(f"can not find figure {figure_name!r}.")
-
-    def _get_leaf_timespan(self, leaf, floating_selections):
-        found_leaf = False
-        for floating_selection in floating_selections:
-            leaf_start_offset = abjad.Offset(0)
-            for leaf_ in abjad.iterate(floating_selection.annotation).leaves():
-                leaf_duration = abjad.get.duration(leaf_)
-                if leaf_ is leaf:
-                    found_leaf = True
-                    break
-                leaf_start_offset += leaf_duration
-            if found_leaf:
-                break
-        if not found_leaf:
+        try:
+            return self._figure_start_offsets[figure_name]
+        except KeyError:
+            raise Exception(f"can not find figure {figure_name!r}.")
+
+    def _get_leaf_timespan(self, leaf, voice_name):
+        voice_name_, timespan = self._leaf_timespans.get(id(leaf), (None, None))
+        if voice_name_ != voice_name:
             raise Exception(f"can not find {leaf!r} in floating selections.")
-        selection_start_offset = floating_selection.start_offset
-        leaf_start_offset = selection_start_offset + leaf_start_offset
-        leaf_stop_offset = leaf_start_offset + leaf_duration
-        return abjad.Timespan(leaf_start_offset, leaf_stop_offset)
+        return timespan
 
     def _get_start_offset(self, selection, contribution):
         if (
@@ -3770,7 +3870,7 @@ class Accumulator:
         result = remote_selector(selections)
         selected_leaves = list(abjad.iterate(result).leaves())
         first_selected_leaf = selected_leaves[0]
-        timespan = self._get_leaf_timespan(first_selected_leaf, floating_selections)
+        timespan = self._get_leaf_timespan(first_selected_leaf, remote_voice_name)
         if use_remote_stop_offset:
             remote_anchor_offset = timespan.stop_offset
         else:
@@ -3791,33 +3891,22 @@ class Accumulator:
         start_offset = remote_anchor_offset - local_anchor_offset
         return start_offset
 
-    @staticmethod
-    def _insert_skips(floating_selections, voice_name):
-        for floating_selection in floating_selections:
-            assert isinstance(floating_selection, abjad.AnnotatedTimespan)
-        floating_selections = list(floating_selections)
-        floating_selections.sort()
-        try:
-            first_start_offset = floating_selections[0].start_offset
-        except Exception:
-            raise Exception(floating_selections, voice_name)
-        timespans = abjad.TimespanList(floating_selections)
-        gaps = ~timespans
-        if 0 < first_start_offset:
-            first_gap = abjad.Timespan(0, first_start_offset)
-            gaps.append(first_gap)
-        selections = floating_selections + list(gaps)
-        selections.sort()
-        fused_selection = []
-        for selection in selections:
-            if isinstance(selection, abjad.AnnotatedTimespan):
-                fused_selection.extend(selection.annotation)
-            else:
-                assert isinstance(selection, abjad.Timespan)
-                skip = abjad.Skip(1, multiplier=selection.duration)
-                fused_selection.append(skip)
-        fused_selection = abjad.select(fused_selection)
-        return fused_selection
+    def _index_floating_selection(self, voice_name, floating_selection):
+        leaf_start_offset = floating_selection.start_offset
+        for leaf in abjad.iterate(floating_selection.annotation).leaves():
+            for markup in abjad.get.indicators(leaf, abjad.Markup):
+                annotation = markup._annotation
+                if isinstance(annotation, str) and annotation.startswith(
+                    "figure name: "
+                ):
+                    figure_name = annotation.replace("figure name: ", "")
+                    self._figure_start_offsets.setdefault(
+                        figure_name, leaf_start_offset
+                    )
+            leaf_stop_offset = leaf_start_offset + abjad.get.duration(leaf)
+            timespan = abjad.Timespan(leaf_start_offset, leaf_stop_offset)
+            self._leaf_timespans.setdefault(id(leaf), (voice_name, timespan))
+            leaf_start_offset = leaf_stop_offset
 
     def _label_figure_name_(self, container, figure_name):
         figure_index = self._figure_index
@@ -3875,7 +3964,7 @@ class Accumulator:
         floating_selections = self._floating_selections[voice_name]
         if not floating_selections:
             return None
-        selection = self._insert_skips(floating_selections, voice_name)
+        selection = self._timelines[voice_name].fill()
         assert isinstance(selection, abjad.Selection), repr(selection)
         return selection
 
@@ -5020,30 +5109,24 @@ class FigureMaker:
 
     @staticmethod
     def _add_rest_affixes(
-        leaves,
+        items,
         talea,
         rest_prefix,
         rest_suffix,
         affix_skips_instead_of_rests,
-        increase_monotonic,
     ):
+        skips_instead_of_rests = bool(affix_skips_instead_of_rests)
         if rest_prefix:
-            durations = [(_, talea.denominator) for _ in rest_prefix]
-            maker = abjad.LeafMaker(
-                increase_monotonic=increase_monotonic,
-                skips_instead_of_rests=affix_skips_instead_of_rests,
-            )
-            leaves_ = maker([None], durations)
-            leaves[0:0] = leaves_
+            items[0:0] = [
+                (None, (_, talea.denominator), skips_instead_of_rests)
+                for _ in rest_prefix
+            ]
         if rest_suffix:
-            durations = [(_, talea.denominator) for _ in rest_suffix]
-            maker = abjad.LeafMaker(
-                increase_monotonic=increase_monotonic,
-                skips_instead_of_rests=affix_skips_instead_of_rests,
+            items.extend(
+                (None, (_, talea.denominator), skips_instead_of_rests)
+                for _ in rest_suffix
             )
-            leaves_ = maker([None], durations)
-            leaves.extend(leaves_)
-        return leaves
+        return items
 
     def _apply_state(self, state=None):
         for name in self._state_variables:
@@ -5116,6 +5199,27 @@ class FigureMaker:
             return abjad.CyclicTuple([0])
         return abjad.CyclicTuple(self.treatments)
 
+    @staticmethod
+    def _get_written_pitch(pitch):
+        if type(pitch) is abjad.NumberedPitch and pitch.arrow is None:
+            return pitch.number
+        return pitch
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_written_durations(duration, increase_monotonic):
+        if isinstance(duration, tuple):
+            denominator = duration[1]
+        else:
+            denominator = duration.denominator
+        if not abjad.math.is_nonnegative_integer_power_of_two(denominator):
+            return None
+        duration = abjad.Duration(duration)
+        numerators = abjad.math.partition_integer_into_canonic_parts(duration.numerator)
+        if increase_monotonic:
+            numerators = reversed(numerators)
+        return tuple(abjad.Duration(_, duration.denominator) for _ in numerators)
+
     @staticmethod
     def _is_treatment(argument):
         if argument is None:
@@ -5241,6 +5345,53 @@ class FigureMaker:
             multipliers.append(multiplier)
         return multipliers
 
+    @staticmethod
+    def _make_leaves(items, increase_monotonic):
+        leaves = []
+        for pitch, duration, skips_instead_of_rests in items:
+            written_durations = FigureMaker._get_written_durations(
+                duration, increase_monotonic
+            )
+            if written_durations is None:
+                maker = abjad.LeafMaker(
+                    increase_monotonic=increase_monotonic,
+                    skips_instead_of_rests=skips_instead_of_rests,
+                )
+                leaves.extend(maker([pitch], [duration]))
+            elif pitch is None:
+                if skips_instead_of_rests:
+                    leaves.extend(abjad.Skip(_) for _ in written_durations)
+                else:
+                    leaves.extend(abjad.Rest(_) for _ in written_durations)
+            else:
+                if isinstance(pitch, (tuple, list)):
+                    class_ = abjad.Chord
+                    pitch = [FigureMaker._get_written_pitch(_) for _ in pitch]
+                else:
+                    class_ = abjad.Note
+                    pitch = FigureMaker._get_written_pitch(pitch)
+                leaves_ = [class_(pitch, _) for _ in written_durations]
+                if 1 < len(leaves_):
+                    abjad.tie(abjad.select(leaves_))
+                leaves.extend(leaves_)
+        return leaves
+
+    def _make_collection_tuplet(self, collection, collection_index, total_collections):
+        if self.affix is not None:
+            result = self.affix(collection_index, total_collections)
+            rest_prefix, rest_suffix = result
+            affix_skips_instead_of_rests = self.affix.skips_instead_of_rests
+        else:
+            rest_prefix, rest_suffix = None, None
+            affix_skips_instead_of_rests = None
+        tuplet = self._make_tuplet(
+            collection,
+            rest_prefix=rest_prefix,
+            rest_suffix=rest_suffix,
+            affix_skips_instead_of_rests=affix_skips_instead_of_rests,
+        )
+        return tuplet
+
     def _make_music(
         self, collections, collection_index=None, total_collections=None
     ) -> typing.List[abjad.Tuplet]:
@@ -5248,35 +5399,13 @@ class FigureMaker:
         tuplets = []
         if collection_index is None:
             for i, segment in enumerate(collections):
-                if self.affix is not None:
-                    result = self.affix(i, segment_count)
-                    rest_prefix, rest_suffix = result
-                    affix_skips_instead_of_rests = self.affix.skips_instead_of_rests
-                else:
-                    rest_prefix, rest_suffix = None, None
-                    affix_skips_instead_of_rests = None
-                tuplet = self._make_tuplet(
-                    segment,
-                    rest_prefix=rest_prefix,
-                    rest_suffix=rest_suffix,
-                    affix_skips_instead_of_rests=affix_skips_instead_of_rests,
-                )
+                tuplet = self._make_collection_tuplet(segment, i, segment_count)
                 tuplets.append(tuplet)
         else:
             assert len(collections) == 1, repr(collections)
             segment = collections[0]
-            if self.affix is not None:
-                result = self.affix(collection_index, total_collections)
-                rest_prefix, rest_suffix = result
-                affix_skips_instead_of_rests = self.affix.skips_instead_of_rests
-            else:
-                rest_prefix, rest_suffix = None, None
-                affix_skips_instead_of_rests = None
-            tuplet = self._make_tuplet(
-                segment,
-                rest_prefix=rest_prefix,
-                rest_suffix=rest_suffix,
-                affix_skips_instead_of_rests=affix_skips_instead_of_rests,
+            tuplet = self._make_collection_tuplet(
+                segment, collection_index, total_collections
             )
             tuplets.append(tuplet)
         assert all(isinstance(_, abjad.Tuplet) for _ in tuplets)
@@ -5291,7 +5420,10 @@ class FigureMaker:
     ):
         self._next_segment += 1
         talea = self._get_talea()
-        leaves = []
+        counts = abjad.CyclicTuple(
+            list(talea.preamble or []) + list(talea.counts or [])
+        )
+        items = []
         spelling = self._get_spelling_specifier()
         current_selection = self._next_segment - 1
         treatment = self._get_treatments()[current_selection]
@@ -5313,17 +5445,13 @@ class FigureMaker:
             prototype = abjad.NumberedPitchClass
             if isinstance(pitch_expression, prototype):
                 pitch_expression = pitch_expression.number
-            count = self._next_attack
-            while talea[count] < 0:
+            while counts[self._next_attack] < 0:
+                duration = (-counts[self._next_attack], talea.denominator)
+                items.append((None, duration, False))
                 self._next_attack += 1
-                duration = -talea[count]
-                maker = abjad.LeafMaker(increase_monotonic=spelling.increase_monotonic)
-                leaves_ = maker([None], [duration])
-                leaves.extend(leaves_)
-                count = self._next_attack
+            duration = (counts[self._next_attack], talea.denominator)
             self._next_attack += 1
-            duration = talea[count]
-            assert 0 < duration, repr(duration)
+            assert 0 < duration[0], repr(duration)
             skips_instead_of_rests = False
             if (
                 isinstance(pitch_expression, tuple)
@@ -5336,31 +5464,21 @@ class FigureMaker:
                 if pitch_expression[-1] == "skip":
                     skips_instead_of_rests = True
                 pitch_expression = None
-            maker = abjad.LeafMaker(
-                increase_monotonic=spelling.increase_monotonic,
-                skips_instead_of_rests=skips_instead_of_rests,
-            )
             if is_chord:
-                leaves_ = maker([tuple(pitch_expression)], [duration])
-            else:
-                leaves_ = maker([pitch_expression], [duration])
-            leaves.extend(leaves_)
-            count = self._next_attack
-            while talea[count] < 0 and not count % len(talea) == 0:
+                pitch_expression = tuple(pitch_expression)
+            items.append((pitch_expression, duration, skips_instead_of_rests))
+            while counts[self._next_attack] < 0 and self._next_attack % len(talea):
+                duration = (-counts[self._next_attack], talea.denominator)
+                items.append((None, duration, False))
                 self._next_attack += 1
-                duration = -talea[count]
-                maker = abjad.LeafMaker(increase_monotonic=spelling.increase_monotonic)
-                leaves_ = maker([None], [duration])
-                leaves.extend(leaves_)
-                count = self._next_attack
-        leaves = self._add_rest_affixes(
-            leaves,
+        items = self._add_rest_affixes(
+            items,
             talea,
             rest_prefix,
             rest_suffix,
             affix_skips_instead_of_rests,
-            spelling.increase_monotonic,
         )
+        leaves = self._make_leaves(items, spelling.increase_monotonic)
         leaf_selection = abjad.select(leaves)
         if isinstance(treatment, int):
             tuplet = self._make_tuplet_with_extra_count(
@@ -7521,6 +7639,60 @@ class FigureMaker:
         """
         return self._treatments
 
+    ### PUBLIC METHODS ###
+
+    def iterate(
+        self, collections: typing.Sequence, state: dict = None
+    ) -> typing.Iterator[typing.Tuple[abjad.Tuplet, dict]]:
+        r"""
+        Iterates figure-maker over ``collections``.
+
+        Makes one tuplet per collection only when asked; yields each tuplet
+        together with state after tuplet. Calling ``iterate()`` again with
+        same collections and yielded state resumes after that tuplet:
+        iteration skips first ``state['_next_segment']`` collections.
+
+        ..  container:: example
+
+            >>> maker = baca.figure([1, 1, 2], 16)
+            >>> collections = [[0, 2, 10], [18, 16, 15, 20, 19], [9]]
+            >>> for tuplet, state in maker.iterate(collections):
+            ...     state
+            {'_next_attack': 3, '_next_segment': 1}
+            {'_next_attack': 8, '_next_segment': 2}
+            {'_next_attack': 9, '_next_segment': 3}
+
+            Resumes after first tuplet:
+
+            >>> state = {'_next_attack': 3, '_next_segment': 1}
+            >>> for tuplet, state in maker.iterate(collections, state=state):
+            ...     string = abjad.lilypond(tuplet)
+            ...     print(string)
+            \scaleDurations #'(1 . 1) {
+                fs''16
+                e''16
+                ef''8
+                af''16
+                g''16
+            }
+            \scaleDurations #'(1 . 1) {
+                a'8
+            }
+
+        Yields tuplet, state pairs equal to those of figure-maker call.
+        """
+        collections = self._coerce_collections(collections)
+        state = dict(state or {})
+        total_collections = len(collections)
+        for i in range(state.get("_next_segment", 0), total_collections):
+            if self.restart_talea:
+                self._apply_state(state=None)
+            else:
+                self._apply_state(state=state)
+            tuplet = self._make_collection_tuplet(collections[i], i, total_collections)
+            state = {"_next_attack": self._next_attack, "_next_segment": i + 1}
+            yield tuplet, state
+
 
 class Assignment:
     """
@@ -7671,6 +7843,66 @@ class Bind:
         return self._assignments
 
 
+class _Timeline:
+    """
+    Timeline.
+
+    Keeps floating selections of one voice sorted by start offset. Checks
+    each new floating selection against its neighbors only; floating
+    selections already in timeline never overlap.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_figures", "_floating_selections", "_start_offsets")
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._figures: typing.List[str] = []
+        self._floating_selections: typing.List[abjad.AnnotatedTimespan] = []
+        self._start_offsets: typing.List[abjad.Offset] = []
+
+    ### PUBLIC METHODS ###
+
+    def fill(self) -> abjad.Selection:
+        """
+        Fuses floating selections; fills gaps with skips.
+        """
+        leaves = []
+        stop_offset = abjad.Offset(0)
+        for floating_selection in self._floating_selections:
+            if stop_offset < floating_selection.start_offset:
+                duration = floating_selection.start_offset - stop_offset
+                skip = abjad.Skip(1, multiplier=duration)
+                leaves.append(skip)
+            leaves.extend(floating_selection.annotation)
+            stop_offset = floating_selection.stop_offset
+        return abjad.select(leaves)
+
+    def insert(self, floating_selection, figure, voice_name) -> None:
+        """
+        Inserts ``floating_selection``; raises exception on overlap.
+        """
+        assert isinstance(floating_selection, abjad.AnnotatedTimespan)
+        start_offset = floating_selection.start_offset
+        stop_offset = floating_selection.stop_offset
+        i = bisect.bisect_right(self._start_offsets, start_offset)
+        for j in (i - 1, i):
+            if not 0 <= j < len(self._floating_selections):
+                continue
+            other = self._floating_selections[j]
+            if other.start_offset < stop_offset and start_offset < other.stop_offset:
+                message = f"{figure} overlaps {self._figures[j]} in {voice_name}:"
+                message += f" {floating_selection.start_offset}"
+                message += f" to {floating_selection.stop_offset}"
+                message += f" against {other.start_offset} to {other.stop_offset}."
+                raise Exception(message)
+        self._figures.insert(i, figure)
+        self._floating_selections.insert(i, floating_selection)
+        self._start_offsets.insert(i, start_offset)
+
+
 ### FACTORY FUNCTIONS ###
 
 
@@ -0,0 +1,373 @@
+"""
+Metadata library.
+
+Reads and writes segment metadata and persist in compact JSON next to
+``__metadata__.py`` and ``__persist__.py``.
+
+File holds format version, table of interned strings, top-level keys and one
+encoded value per key. Strings encode as one-element lists that index string
+table; containers, rationals and storage-formattable objects encode as lists
+that start with type code. Readers decode only keys they ask for and fall
+back to Python metadata files when no JSON file is current.
+
+Segment index aggregates measure profile, alive contexts and clock times of
+all segments in one file per segments directory.
+"""
+
+import importlib
+import json
+import numbers
+import os
+import pathlib
+import typing
+
+import abjad
+
+### PRIVATE FUNCTIONS ###
+
+
+_version = 1
+
+
+class _Decoder:
+    """
+    Metadata decoder.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_classes", "_strings")
+
+    ### INITIALIZER ###
+
+    def __init__(self, strings):
+        self._classes: typing.Dict[str, typing.Any] = {}
+        self._strings = strings
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, node):
+        if not isinstance(node, list):
+            return node
+        code = node[0]
+        if isinstance(code, int):
+            return self._strings[code]
+        if code == "l":
+            return [self(_) for _ in node[1:]]
+        if code == "t":
+            return tuple(self(_) for _ in node[1:])
+        if code in ("d", "o"):
+            pairs = [(self(k), self(v)) for k, v in zip(node[1::2], node[2::2])]
+            if code == "d":
+                return dict(pairs)
+            return abjad.OrderedDict(pairs)
+        if code == "q":
+            class_ = self._get_class(self(node[1]))
+            return class_(node[2], node[3])
+        if code == "c":
+            class_ = self._get_class(self(node[1]))
+            names = [self(_) for _ in node[2::2]]
+            values = [self(_) for _ in node[3::2]]
+            return class_(**dict(zip(names, values)))
+        raise Exception(f"unknown metadata type code {code!r}.")
+
+    ### PRIVATE METHODS ###
+
+    def _get_class(self, string):
+        if string not in self._classes:
+            module_name, _, class_name = string.rpartition(".")
+            module = importlib.import_module(module_name)
+            self._classes[string] = getattr(module, class_name)
+        return self._classes[string]
+
+
+class _Encoder:
+    """
+    Metadata encoder.
+
+    Interns strings in order of first appearance.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_string_to_index", "_strings")
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self._string_to_index: typing.Dict[str, int] = {}
+        self._strings: typing.List[str] = []
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, value):
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, str):
+            return [self._intern(value)]
+        if isinstance(value, list):
+            return ["l"] + [self(_) for _ in value]
+        if isinstance(value, tuple):
+            return ["t"] + [self(_) for _ in value]
+        if isinstance(value, (dict, abjad.OrderedDict)):
+            code = "d" if isinstance(value, dict) else "o"
+            node = [code]
+            for key, value_ in value.items():
+                node.extend((self(key), self(value_)))
+            return node
+        if isinstance(value, numbers.Rational):
+            class_name = self._get_class_name(value)
+            return ["q", self(class_name), value.numerator, value.denominator]
+        manager = abjad.StorageFormatManager(value)
+        node = ["c", self(self._get_class_name(value))]
+        for name, value_ in manager.get_template_dict().items():
+            node.extend((self(name), self(value_)))
+        return node
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_class_name(value):
+        class_ = type(value)
+        return f"{class_.__module__}.{class_.__name__}"
+
+    def _intern(self, string):
+        if string not in self._string_to_index:
+            self._string_to_index[string] = len(self._strings)
+            self._strings.append(string)
+        return self._string_to_index[string]
+
+
+_index_file_name = ".index.json"
+
+
+def _get_current_json_path(directory, file_name):
+    path = _json_path(directory, file_name)
+    if not path.is_file():
+        return None
+    path_py = pathlib.Path(directory, file_name)
+    if path_py.is_file() and path.stat().st_mtime_ns < path_py.stat().st_mtime_ns:
+        return None
+    return path
+
+
+def _get_stamp(directory, file_name):
+    stamp = []
+    for path in (pathlib.Path(directory, file_name), _json_path(directory, file_name)):
+        if path.is_file():
+            stat = path.stat()
+            stamp.append([path.name, stat.st_mtime_ns, stat.st_size])
+    return stamp
+
+
+def _json_path(directory, file_name):
+    return pathlib.Path(directory, file_name).with_suffix(".json")
+
+
+def _list_segments(segments_directory):
+    paths = segments_directory.list_paths()
+    return [_ for _ in paths if (_ / "definition.py").is_file()]
+
+
+def _make_index_entry(segment):
+    keys = [
+        "fermata_measure_numbers",
+        "first_measure_number",
+        "start_clock_time",
+        "stop_clock_time",
+        "time_signatures",
+    ]
+    metadata, persist = abjad.OrderedDict(), abjad.OrderedDict()
+    if (segment / "__metadata__.py").is_file():
+        metadata = get_metadata(segment, keys=keys)
+    if (segment / "__persist__.py").is_file():
+        keys = ["alive_during_segment"]
+        persist = get_metadata(segment, keys=keys, file_name="__persist__.py")
+    entry = abjad.OrderedDict()
+    entry["alive_during_segment"] = list(persist.get("alive_during_segment") or [])
+    value = metadata.get("fermata_measure_numbers")
+    entry["fermata_measure_numbers"] = list(value or [])
+    entry["first_measure_number"] = metadata.get("first_measure_number")
+    entry["measure_count"] = len(metadata.get("time_signatures") or [])
+    entry["start_clock_time"] = metadata.get("start_clock_time")
+    entry["stop_clock_time"] = metadata.get("stop_clock_time")
+    return entry
+
+
+def _make_index(entries):
+    index = abjad.OrderedDict()
+    previous_measure_count = 0
+    for name, entry in entries.items():
+        entry = abjad.OrderedDict(entry)
+        if entry["first_measure_number"] is None:
+            entry["first_measure_number"] = previous_measure_count + 1
+        entry["previous_measure_count"] = previous_measure_count
+        previous_measure_count += entry["measure_count"]
+        index[name] = entry
+    return index
+
+
+def _read_segment_index(segments_directory):
+    if not segments_directory.is_dir():
+        return abjad.OrderedDict(), abjad.OrderedDict(), False
+    path = segments_directory / _index_file_name
+    entries, stamps = abjad.OrderedDict(), abjad.OrderedDict()
+    if path.is_file():
+        try:
+            document = loads(path.read_text())
+        except Exception:
+            document = abjad.OrderedDict()
+        entries = document.get("segments") or entries
+        stamps = document.get("stamps") or stamps
+    entries_, stamps_ = abjad.OrderedDict(), abjad.OrderedDict()
+    for segment in _list_segments(segments_directory):
+        stamp = [
+            _get_stamp(segment, "__metadata__.py"),
+            _get_stamp(segment, "__persist__.py"),
+        ]
+        entry = entries.get(segment.name)
+        if entry is None or stamps.get(segment.name) != stamp:
+            entry = _make_index_entry(segment)
+        entries_[segment.name] = entry
+        stamps_[segment.name] = stamp
+    changed = entries_ != entries or stamps_ != stamps
+    return entries_, stamps_, changed
+
+
+### PUBLIC FUNCTIONS ###
+
+
+def dumps(dictionary) -> str:
+    """
+    Dumps ``dictionary`` to compact JSON.
+
+    ..  container:: example
+
+        >>> metadata = abjad.OrderedDict()
+        >>> metadata["duration"] = abjad.Duration(9, 8)
+        >>> metadata["first_measure_number"] = 5
+        >>> metadata["time_signatures"] = ["4/8", "3/8", "4/8"]
+        >>> string = baca.metadata.dumps(metadata)
+        >>> print(string)
+        {"version":1,"strings":["abjad.duration.Duration","4/8","3/8"],"keys":["duration","first_measure_number","time_signatures"],"values":[["q",[0],9,8],5,["l",[1],[2],[1]]]}
+
+    """
+    encoder = _Encoder()
+    keys, values = [], []
+    for key, value in dictionary.items():
+        keys.append(key)
+        values.append(encoder(value))
+    document = {
+        "version": _version,
+        "strings": encoder._strings,
+        "keys": keys,
+        "values": values,
+    }
+    return json.dumps(document, separators=(",", ":"))
+
+
+def get_metadata(
+    directory, keys: typing.Sequence[str] = None, file_name: str = "__metadata__.py"
+) -> abjad.OrderedDict:
+    """
+    Gets metadata in ``directory``.
+
+    Reads JSON version of ``file_name`` when it exists and is no older than
+    ``file_name``; otherwise reads ``file_name``. Gets only ``keys`` when ``keys`` is not none.
+    """
+    path = _get_current_json_path(directory, file_name)
+    if path is not None:
+        return loads(path.read_text(), keys=keys)
+    metadata = directory.get_metadata(file_name=file_name)
+    metadata = abjad.OrderedDict(metadata)
+    if keys is None:
+        return metadata
+    return abjad.OrderedDict([(_, metadata[_]) for _ in keys if _ in metadata])
+
+
+def get_segment_index(segments_directory) -> abjad.OrderedDict:
+    """
+    Gets index of segments in ``segments_directory``.
+
+    Index maps segment name to alive contexts, fermata measure numbers, first
+    measure number, measure count, previous measure count (cumulative measure
+    count of earlier segments) and start and stop clock times of segment.
+    Index derives first measure number of segment from previous measure count
+    when segment metadata has none.
+
+    Index persists as ``.index.json`` in ``segments_directory``. Reading index
+    stats metadata and persist of each segment and rereads only segments
+    whose files changed since index was written; rewrites index atomically
+    when any segment changed.
+    """
+    entries, stamps, changed = _read_segment_index(segments_directory)
+    if changed:
+        document = abjad.OrderedDict()
+        document["segments"] = entries
+        document["stamps"] = stamps
+        path = segments_directory / _index_file_name
+        temporary = path.with_name(f"{path.name}.{os.getpid()}")
+        temporary.write_text(dumps(document))
+        os.replace(temporary, path)
+    return _make_index(entries)
+
+
+def get_metadatum(
+    directory, key: str, default=None, file_name: str = "__metadata__.py"
+) -> typing.Any:
+    """
+    Gets metadatum ``key`` in ``directory``.
+    """
+    metadata = get_metadata(directory, keys=[key], file_name=file_name)
+    return metadata.get(key, default)
+
+
+def loads(string: str, keys: typing.Sequence[str] = None) -> abjad.OrderedDict:
+    """
+    Loads metadata from compact JSON ``string``.
+
+    ..  container:: example
+
+        >>> metadata = abjad.OrderedDict()
+        >>> metadata["duration"] = abjad.Duration(9, 8)
+        >>> metadata["first_measure_number"] = 5
+        >>> metadata["time_signatures"] = ["4/8", "3/8", "4/8"]
+        >>> string = baca.metadata.dumps(metadata)
+        >>> baca.metadata.loads(string) == metadata
+        True
+
+        Loads only ``keys``:
+
+        >>> baca.metadata.loads(string, keys=["duration", "segment_name"])
+        OrderedDict([('duration', Duration(9, 8))])
+
+    """
+    document = json.loads(string)
+    version = document.get("version")
+    if version != _version:
+        raise Exception(f"unknown metadata version {version!r}.")
+    decoder = _Decoder(document["strings"])
+    metadata = abjad.OrderedDict()
+    key_to_node = dict(zip(document["keys"], document["values"]))
+    if keys is None:
+        keys = document["keys"]
+    for key in keys:
+        if key in key_to_node:
+            metadata[key] = decoder(key_to_node[key])
+    return metadata
+
+
+def write_metadata(
+    directory,
+    dictionary,
+    file_name: str = "__metadata__.py",
+    variable_name: str = "metadata",
+) -> None:
+    """
+    Writes ``dictionary`` to ``file_name`` in ``directory``; then writes
+    ``dictionary`` to JSON version of ``file_name``.
+    """
+    directory.write_metadata_py(
+        dictionary, file_name=file_name, variable_name=variable_name
+    )
+    _json_path(directory, file_name).write_text(dumps(dictionary))
@@ -1,40 +1,34 @@
 import typing
 
-import abjad
+from . import metadata as baca_metadata
 
 
 def get_measure_profile_metadata(path) -> typing.Tuple[int, int, list]:
     """
     Gets measure profile metadata.
 
-    Reads segment metadata when path is segment.
+    Reads segment entry of segment index when path is segment; derives first
+    measure number from measure counts of earlier segments when segment
+    metadata has none.
 
-    Reads score metadata when path is not segment.
+    Sums measure counts and fermata measure numbers of all entries of segment
+    index when path is not segment.
 
     Returns tuple of three metadata: first measure number; measure count;
     list of fermata measure numbers.
     """
     if path.parent.is_segment():
-        string = "first_measure_number"
-        first_measure_number = path.parent.get_metadatum(string)
-        time_signatures = path.parent.get_metadatum("time_signatures")
-        if bool(time_signatures):
-            measure_count = len(time_signatures)
-        else:
-            measure_count = 0
-        string = "fermata_measure_numbers"
-        fermata_measure_numbers = path.parent.get_metadatum(string)
+        index = baca_metadata.get_segment_index(path.parent.parent)
+        entry = index[path.parent.name]
+        first_measure_number = entry["first_measure_number"]
+        measure_count = entry["measure_count"]
+        fermata_measure_numbers = entry["fermata_measure_numbers"]
     else:
+        index = baca_metadata.get_segment_index(path.contents / "segments")
         first_measure_number = 1
-        dictionary = path.contents.get_metadatum("time_signatures")
-        dictionary = dictionary or abjad.OrderedDict()
         measure_count = 0
-        for segment, time_signatures in dictionary.items():
-            measure_count += len(time_signatures)
-        string = "fermata_measure_numbers"
-        dictionary = path.contents.get_metadatum(string)
-        dictionary = dictionary or abjad.OrderedDict()
         fermata_measure_numbers = []
-        for segment, fermata_measure_numbers_ in dictionary.items():
-            fermata_measure_numbers.extend(fermata_measure_numbers_)
+        for entry in index.values():
+            measure_count += entry["measure_count"]
+            fermata_measure_numbers.extend(entry["fermata_measure_numbers"])
     return (first_measure_number, measure_count, fermata_measure_numbers)
@@ -3,10 +3,13 @@ Pitch library.
 """
 import collections as collections_module
 import copy
+import functools
 import inspect
 import math
 import typing
 
+import numpy
+
 import abjad
 
 from . import classes
@@ -4181,6 +4184,166 @@ class Partial:
         return self._number
 
 
+class _TransformTable:
+    """
+    Transform table.
+
+    Models every T/I/M/R/rotation transform of pitch-class segments of one
+    length as affine map on doubled pitch-class numbers (mod 24) followed by
+    index permutation. Doubling keeps quarter tones integral. Table applies
+    all transforms to segment as single array operation and builds Abjad
+    operators only on request.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_multipliers", "_offsets", "_permutations", "_specifiers")
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        length,
+        inversion=False,
+        multiplication=False,
+        retrograde=False,
+        rotation=None,
+        transposition=False,
+    ):
+        if transposition:
+            specifiers = [(n, False, None, False, None) for n in range(12)]
+        else:
+            specifiers = [(0, False, None, False, None)]
+        if inversion:
+            specifiers += [(_[0], True, None, False, None) for _ in specifiers]
+        if multiplication:
+            specifiers_ = specifiers[:]
+            for n in (1, 5, 7, 11):
+                specifiers_ += [(_[0], _[1], n, False, None) for _ in specifiers]
+            specifiers = specifiers_
+        if retrograde:
+            specifiers_ = []
+            for specifier in specifiers:
+                specifiers_.append(specifier)
+                specifiers_.append(specifier[:3] + (True, None))
+            specifiers = specifiers_
+        if rotation:
+            specifiers_ = []
+            for specifier in specifiers:
+                for n in range(length):
+                    if rotation is abjad.Left:
+                        n *= -1
+                    specifiers_.append(specifier[:4] + (n,))
+            specifiers = specifiers_
+        multipliers, offsets, permutations = [], [], []
+        for n, inverted, multiplier, retrograde_, rotation_ in specifiers:
+            multiplier = multiplier or 1
+            multipliers.append(-multiplier if inverted else multiplier)
+            offsets.append(2 * multiplier * n)
+            permutation = numpy.arange(length)
+            if retrograde_:
+                permutation = permutation[::-1]
+            if rotation_ is not None:
+                permutation = numpy.roll(permutation, rotation_)
+            permutations.append(permutation)
+        self._multipliers = numpy.array(multipliers, dtype=numpy.int16)[:, None]
+        self._offsets = numpy.array(offsets, dtype=numpy.int16)[:, None]
+        self._permutations = numpy.array(permutations, dtype=numpy.intp).reshape(
+            len(specifiers), length
+        )
+        self._specifiers = tuple(specifiers)
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, numbers):
+        """
+        Calls table on doubled pitch-class ``numbers``.
+
+        Returns array with one row of doubled pitch-class numbers per
+        transform.
+        """
+        numbers = numpy.asarray(numbers, dtype=numpy.int16)
+        return (self._multipliers * numbers[self._permutations] + self._offsets) % 24
+
+    def __len__(self):
+        """
+        Gets number of transforms in table.
+        """
+        return len(self._specifiers)
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get(
+        length,
+        inversion=False,
+        multiplication=False,
+        retrograde=False,
+        rotation=None,
+        transposition=False,
+    ):
+        """
+        Gets (cached) table.
+        """
+        return _TransformTable(
+            length,
+            inversion=bool(inversion),
+            multiplication=bool(multiplication),
+            retrograde=bool(retrograde),
+            rotation=rotation,
+            transposition=bool(transposition),
+        )
+
+    @staticmethod
+    def get_numbers(segment):
+        """
+        Gets doubled pitch-class numbers of ``segment``.
+
+        Returns none when ``segment`` is not numbered or contains pitch
+        classes finer than quarter tones.
+        """
+        if segment.item_class is not abjad.NumberedPitchClass:
+            return None
+        numbers = []
+        for pitch_class in segment:
+            number = 2 * pitch_class.number
+            if number != int(number):
+                return None
+            numbers.append(int(number))
+        return numbers
+
+    def match(self, numbers_1, numbers_2):
+        """
+        Gets indices of transforms that carry ``numbers_1`` to
+        ``numbers_2``.
+
+        Returns list of nonnegative integers.
+        """
+        rows = self(numbers_1)
+        target = numpy.asarray(numbers_2, dtype=numpy.int16)
+        return numpy.flatnonzero((rows == target).all(axis=1)).tolist()
+
+    def operator(self, index):
+        """
+        Makes compound operator of transform ``index``.
+
+        Returns compound operator.
+        """
+        n, inverted, multiplier, retrograde, rotation = self._specifiers[index]
+        operator = abjad.CompoundOperator()
+        if inverted:
+            operator = operator.invert()
+        operator = operator.transpose(n=n)
+        if multiplier is not None:
+            operator = operator.multiply(n=multiplier)
+        if retrograde:
+            operator = operator.retrograde()
+        if rotation is not None:
+            operator = operator.rotate(n=rotation)
+        return operator
+
+
 class PitchClassSegment(abjad.PitchClassSegment):
     r"""
     Pitch-class segment.
@@ -4245,6 +4408,17 @@ class PitchClassSegment(abjad.PitchClassSegment):
             return False
         return self._collection == argument._collection
 
+    ### PRIVATE METHODS ###
+
+    def _can_match_numerically(self, segment_2):
+        if not issubclass(type(segment_2), type(self)) and not issubclass(
+            type(self), type(segment_2)
+        ):
+            return False
+        if _TransformTable.get_numbers(self) is None:
+            return False
+        return _TransformTable.get_numbers(segment_2) is not None
+
     ### PUBLIC METHODS ###
 
     def alpha(self):
@@ -4566,6 +4740,16 @@ class PitchClassSegment(abjad.PitchClassSegment):
         result = []
         if not len(self) == len(segment_2):
             return result
+        if self._can_match_numerically(segment_2):
+            operators = self.get_matching_operators(
+                segment_2,
+                inversion=inversion,
+                multiplication=multiplication,
+                retrograde=retrograde,
+                rotation=rotation,
+                transposition=transposition,
+            )
+            return [(_, _(self)) for _ in operators]
         transforms = self.get_transforms(
             inversion=inversion,
             multiplication=multiplication,
@@ -4578,6 +4762,76 @@ class PitchClassSegment(abjad.PitchClassSegment):
                 result.append((operator, transform))
         return result
 
+    def get_matching_operators(
+        self,
+        segment_2,
+        inversion=False,
+        multiplication=False,
+        retrograde=False,
+        rotation=False,
+        transposition=False,
+    ):
+        r"""
+        Gets operators that transform segment into ``segment_2``.
+
+        ..  container:: example
+
+            Like ``get_matching_transforms()`` but makes no transforms;
+            applies all transforms to segment as one array operation:
+
+            >>> segment_1 = baca.PitchClassSegment([-2, -1, 6, 7, -1, 7])
+            >>> segment_2 = baca.PitchClassSegment([9, 2, 1, 6, 2, 6])
+            >>> operators = segment_1.get_matching_operators(
+            ...     segment_2,
+            ...     inversion=True,
+            ...     multiplication=True,
+            ...     retrograde=True,
+            ...     transposition=True,
+            ...     )
+            >>> [str(_) for _ in operators]
+            ['M5T11', 'M7T1I']
+
+        ..  container:: example
+
+            Works with quarter tones and rotation:
+
+            >>> segment_1 = baca.PitchClassSegment([0, 1.5, 4, 7])
+            >>> segment_2 = baca.PitchClassSegment([9, 2, 3.5, 6])
+            >>> operators = segment_1.get_matching_operators(
+            ...     segment_2,
+            ...     rotation=True,
+            ...     transposition=True,
+            ...     )
+            >>> [str(_) for _ in operators]
+            ['r1T2']
+
+        Returns list of compound operators.
+        """
+        if not len(self) == len(segment_2):
+            return []
+        if not self._can_match_numerically(segment_2):
+            pairs = self.get_matching_transforms(
+                segment_2,
+                inversion=inversion,
+                multiplication=multiplication,
+                retrograde=retrograde,
+                rotation=rotation,
+                transposition=transposition,
+            )
+            return [_[0] for _ in pairs]
+        table = _TransformTable.get(
+            len(self),
+            inversion=bool(inversion),
+            multiplication=bool(multiplication),
+            retrograde=bool(retrograde),
+            rotation=rotation or None,
+            transposition=bool(transposition),
+        )
+        numbers_1 = _TransformTable.get_numbers(self)
+        numbers_2 = _TransformTable.get_numbers(segment_2)
+        indices = table.match(numbers_1, numbers_2)
+        return [table.operator(_) for _ in indices]
+
     def get_transforms(
         self,
         inversion=False,
@@ -4902,59 +5156,17 @@ class PitchClassSegment(abjad.PitchClassSegment):
             True
 
         """
-        operators = []
-        if transposition:
-            for n in range(12):
-                operator = abjad.CompoundOperator()
-                operator = operator.transpose(n=n)
-                operators.append(operator)
-        else:
-            operator = abjad.CompoundOperator()
-            operator = operator.transpose()
-            operators.append(operator)
-        if inversion:
-            operators_ = operators[:]
-            for operator in operators:
-                operator_ = abjad.CompoundOperator()
-                operator_ = operator_.invert()
-                foo = list(operator_._operators)
-                foo.extend(operator.operators)
-                operator_._operators = tuple(foo)
-                operators_.append(operator_)
-            operators = operators_
-        if multiplication:
-            operators_ = operators[:]
-            for operator in operators:
-                operator_ = operator.multiply(n=1)
-                operators_.append(operator_)
-            for operator in operators:
-                operator_ = operator.multiply(n=5)
-                operators_.append(operator_)
-            for operator in operators:
-                operator_ = operator.multiply(n=7)
-                operators_.append(operator_)
-            for operator in operators:
-                operator_ = operator.multiply(n=11)
-                operators_.append(operator_)
-            operators = operators_
-        if retrograde:
-            operators_ = []
-            for operator in operators:
-                operators_.append(operator)
-                operator_ = operator.retrograde()
-                operators_.append(operator_)
-            operators = operators_
-        if rotation:
-            operators_ = []
-            for operator in operators:
-                for n in range(len(self)):
-                    if rotation is abjad.Left:
-                        n *= -1
-                    operator_ = operator.rotate(n=n)
-                    operators_.append(operator_)
-            operators = operators_
+        table = _TransformTable.get(
+            len(self),
+            inversion=bool(inversion),
+            multiplication=bool(multiplication),
+            retrograde=bool(retrograde),
+            rotation=rotation or None,
+            transposition=bool(transposition),
+        )
         result = []
-        for operator in operators:
+        for i in range(len(table)):
+            operator = table.operator(i)
             transform = operator(self)
             result.append((operator, transform))
         return result
@@ -321,8 +321,7 @@ class RhythmCommand(scoping.Command):
     def _make_rhythm_annotation_string(self):
         if not self.frame:
             return
-        frame_info = inspect.getframeinfo(self.frame)
-        function_name = frame_info.function
+        function_name = self.frame.f_code.co_name
         wrapped_arguments = abjad.Expression._wrap_arguments(self.frame)
         string = f"{function_name}({wrapped_arguments}) =|"
         return string
@@ -1,5 +1,5 @@
-import functools
-import inspect
+import fractions
+import heapq
 import typing
 
 import ide
@@ -159,28 +159,50 @@ class TimelineScope:
     ### PRIVATE METHODS ###
 
     @staticmethod
-    def _sort_by_timeline(leaves):
-        assert leaves.are_leaves(), repr(leaves)
-
-        def compare(leaf_1, leaf_2):
-            start_offset_1 = abjad.get.timespan(leaf_1).start_offset
-            start_offset_2 = abjad.get.timespan(leaf_2).start_offset
-            if start_offset_1 < start_offset_2:
-                return -1
-            if start_offset_2 < start_offset_1:
-                return 1
-            index_1 = abjad.get.parentage(leaf_1).score_index()
-            index_2 = abjad.get.parentage(leaf_2).score_index()
-            if index_1 < index_2:
-                return -1
-            if index_2 < index_1:
-                return 1
-            return 0
-
-        leaves = list(leaves)
-        leaves.sort(key=functools.cmp_to_key(compare))
+    def _get_score_index(leaf, indices):
+        parentage = abjad.get.parentage(leaf)
+        for component in parentage:
+            if isinstance(
+                component, (abjad.AfterGraceContainer, abjad.BeforeGraceContainer)
+            ):
+                return parentage.score_index()
+        result = []
+        for component, parent in zip(parentage, parentage[1:]):
+            if id(parent) not in indices:
+                indices[id(parent)] = {id(_): i for i, _ in enumerate(parent)}
+            result.append(indices[id(parent)][id(component)])
+        result.reverse()
+        return tuple(result)
+
+    @staticmethod
+    def _merge_by_timeline(selections):
+        indices: typing.Dict[int, typing.Dict[int, int]] = {}
+        keyed_selections = []
+        for i, leaves in enumerate(selections):
+            assert leaves.are_leaves(), repr(leaves)
+            keyed_leaves = []
+            for j, leaf in enumerate(leaves):
+                start_offset = abjad.get.timespan(leaf).start_offset
+                displacement = start_offset.displacement or 0
+                score_index = TimelineScope._get_score_index(leaf, indices)
+                key = (
+                    fractions.Fraction(start_offset),
+                    fractions.Fraction(displacement),
+                    score_index,
+                )
+                keyed_leaves.append((key, i, j, leaf))
+            for keyed_leaf, next_keyed_leaf in zip(keyed_leaves, keyed_leaves[1:]):
+                if next_keyed_leaf[0] < keyed_leaf[0]:
+                    keyed_leaves.sort()
+                    break
+            keyed_selections.append(keyed_leaves)
+        leaves = [_[-1] for _ in heapq.merge(*keyed_selections)]
         return abjad.select(leaves)
 
+    @staticmethod
+    def _sort_by_timeline(leaves):
+        return TimelineScope._merge_by_timeline([leaves])
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1454,19 +1476,41 @@ def only_segment(command: _command_typing) -> _command_typing:
     return tag(ide.tags.ONLY_SEGMENT, command)
 
 
+_site_tags: typing.Dict[typing.Tuple, abjad.Tag] = {}
+
+
 def site(frame, prefix, *, n=None) -> abjad.Tag:
     """
     Makes site from ``frame``.
 
+    Reads function name from code object of ``frame`` instead of frame info
+    (which reads source line from disk); makes one tag per prefix, function
+    name and ``n``.
+
+    ..  container:: example
+
+        >>> import inspect
+        >>> def accent():
+        ...     return baca.scoping.site(inspect.currentframe(), "baca")
+
+        >>> accent()
+        Tag('baca.accent()')
+
+        >>> accent() is accent()
+        True
+
     ..  todo:: Determine prefix dynamically.
 
     """
-    frame_info = inspect.getframeinfo(frame)
-    if n is None:
-        string = f"{prefix}.{frame_info.function}()"
-    else:
-        string = f"{prefix}.{frame_info.function}({n})"
-    return abjad.Tag(string)
+    key = (prefix, frame.f_code.co_name, n)
+    tag = _site_tags.get(key)
+    if tag is None:
+        if n is None:
+            string = f"{prefix}.{key[1]}()"
+        else:
+            string = f"{prefix}.{key[1]}({n})"
+        tag = _site_tags[key] = abjad.Tag(string)
+    return tag
 
 
 def suite(*commands: CommandTyping, **keywords) -> Suite:
@@ -1,4 +1,10 @@
+import bisect
 import collections
+import contextlib
+import json
+import pathlib
+import time
+import tracemalloc
 import typing
 
 import ide
@@ -1680,9 +1686,8 @@ class HorizontalSpacingSpecifier:
         if self.measures and len(self.measures) == len(skips):
             programmatic = False
         if programmatic:
-            leaves = abjad.iterate(score).leaves(grace=False)
-            method = self._get_minimum_durations_by_measure
-            minimum_durations_by_measure = method(skips, leaves)
+            method = segment_maker._get_minimum_durations_by_measure
+            minimum_durations_by_measure = method()
         else:
             minimum_durations_by_measure = []
         string = "_fermata_start_offsets"
@@ -1786,44 +1791,6 @@ class HorizontalSpacingSpecifier:
             )
         return measure_number
 
-    def _get_minimum_durations_by_measure(self, skips, leaves):
-        measure_timespans = []
-        durations_by_measure = []
-        for skip in skips:
-            measure_timespan = abjad.get.timespan(skip)
-            measure_timespans.append(measure_timespan)
-            durations_by_measure.append([])
-        leaf_timespans = set()
-        leaf_count = 0
-        for leaf in leaves:
-            leaf_timespan = abjad.get.timespan(leaf)
-            leaf_duration = leaf_timespan.duration
-            if leaf.multiplier is not None:
-                leaf_duration = leaf_duration / leaf.multiplier
-            pair = (leaf_timespan, leaf_duration)
-            leaf_timespans.add(pair)
-            leaf_count += 1
-        measure_index = 0
-        measure_timespan = measure_timespans[measure_index]
-        leaf_timespans = list(leaf_timespans)
-        leaf_timespans.sort(key=lambda _: _[0].start_offset)
-        start_offset = 0
-        for pair in leaf_timespans:
-            leaf_timespan, leaf_duration = pair
-            assert start_offset <= leaf_timespan.start_offset
-            start_offset = leaf_timespan.start_offset
-            if leaf_timespan.starts_during_timespan(measure_timespan):
-                durations_by_measure[measure_index].append(leaf_duration)
-            else:
-                measure_index += 1
-                if len(measure_timespans) <= measure_index:
-                    continue
-                measure_timespan = measure_timespans[measure_index]
-                assert leaf_timespan.starts_during_timespan(measure_timespan)
-                durations_by_measure[measure_index].append(leaf_duration)
-        minimum_durations_by_measure = [min(_) for _ in durations_by_measure]
-        return minimum_durations_by_measure
-
     def _is_fermata_measure(self, measure_number, skip):
         if (
             self.fermata_measure_numbers
@@ -2355,6 +2322,256 @@ class LBSD:
         return self._y_offset
 
 
+class MeasureIndex:
+    """
+    Measure index.
+
+    ..  container:: example
+
+        >>> timespans = [
+        ...     abjad.Timespan(0, (4, 8)),
+        ...     abjad.Timespan((4, 8), (7, 8)),
+        ...     abjad.Timespan((7, 8), (11, 8)),
+        ...     ]
+        >>> index = baca.MeasureIndex(timespans, first_measure_number=5)
+
+        >>> index.measure_count
+        3
+
+        >>> index.get_measure_number((5, 8))
+        6
+
+        >>> index.get_measure_number((11, 8)) is None
+        True
+
+        >>> index.get_timespan(7)
+        Timespan(Offset((7, 8)), Offset((11, 8)))
+
+        >>> for offset, measure_number in index.offset_to_measure_number.items():
+        ...     offset, measure_number
+        (Offset((0, 1)), 5)
+        (Offset((1, 2)), 6)
+        (Offset((7, 8)), 7)
+
+    ..  container:: example
+
+        Caches leaves by context name and measure number:
+
+        >>> voice = abjad.Voice("c'4 d' e' f' g' a' b' c''", name="Music_Voice")
+        >>> for leaf in voice:
+        ...     start_offset = abjad.get.timespan(leaf).start_offset
+        ...     measure_number = index.get_measure_number(start_offset)
+        ...     index.cache_leaf("Music_Voice", measure_number, leaf)
+
+        >>> index.get_leaves("Music_Voice", 6, 6)
+        [Note("e'4"), Note("f'4")]
+
+        >>> index.get_leaves("Music_Voice", 5, 7)
+        [Note("c'4"), Note("d'4"), Note("e'4"), Note("f'4"), Note("g'4"), Note("a'4")]
+
+    Measure numbers are score measure numbers, starting at
+    ``first_measure_number``.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_first_measure_number",
+        "_leaves",
+        "_offset_to_measure_number",
+        "_start_offsets",
+        "_stop_offsets",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        timespans: typing.Sequence[abjad.Timespan],
+        *,
+        first_measure_number: int = 1,
+    ) -> None:
+        assert isinstance(first_measure_number, int), repr(first_measure_number)
+        self._first_measure_number = first_measure_number
+        start_offsets: typing.List[abjad.Offset] = []
+        stop_offsets: typing.List[abjad.Offset] = []
+        for timespan in timespans:
+            assert isinstance(timespan, abjad.Timespan), repr(timespan)
+            if stop_offsets:
+                assert stop_offsets[-1] <= timespan.start_offset, repr(timespan)
+            start_offsets.append(timespan.start_offset)
+            stop_offsets.append(timespan.stop_offset)
+        self._start_offsets = start_offsets
+        self._stop_offsets = stop_offsets
+        offset_to_measure_number = {}
+        for i, start_offset in enumerate(start_offsets):
+            offset_to_measure_number[start_offset] = first_measure_number + i
+        self._offset_to_measure_number = offset_to_measure_number
+        self._leaves: typing.Dict[str, typing.Dict[int, typing.List]] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        name = type(self).__name__
+        first, count = self.first_measure_number, self.measure_count
+        return f"{name}(first_measure_number={first}, measure_count={count})"
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def context_names(self) -> typing.List[str]:
+        """
+        Gets names of contexts with cached leaves.
+        """
+        return list(self._leaves)
+
+    @property
+    def first_measure_number(self) -> int:
+        """
+        Gets first measure number.
+        """
+        return self._first_measure_number
+
+    @property
+    def measure_count(self) -> int:
+        """
+        Gets measure count.
+        """
+        return len(self._start_offsets)
+
+    @property
+    def offset_to_measure_number(self) -> typing.Dict[abjad.Offset, int]:
+        """
+        Gets dictionary of measure start offsets to measure numbers.
+        """
+        return self._offset_to_measure_number
+
+    ### PUBLIC METHODS ###
+
+    def cache_leaf(self, context_name: str, measure_number: int, leaf) -> None:
+        """
+        Caches ``leaf`` in ``context_name`` under ``measure_number``.
+        """
+        leaves_by_measure_number = self._leaves.setdefault(context_name, {})
+        leaves = leaves_by_measure_number.setdefault(measure_number, [])
+        leaves.append(leaf)
+
+    def clear_leaves(
+        self,
+        context_name: str = None,
+        start_measure_number: int = None,
+        stop_measure_number: int = None,
+    ) -> None:
+        """
+        Clears leaf cache.
+
+        Clears only ``context_name`` when ``context_name`` is set. Clears only
+        measures ``start_measure_number`` to ``stop_measure_number``,
+        inclusive, when measure numbers are set.
+
+        ..  container:: example
+
+            >>> index = baca.MeasureIndex([abjad.Timespan(0, 1), abjad.Timespan(1, 2)])
+            >>> index.cache_leaf("Music_Voice", 1, abjad.Note("c'1"))
+            >>> index.cache_leaf("Music_Voice", 2, abjad.Note("d'1"))
+            >>> index.clear_leaves("Music_Voice", 2, 2)
+            >>> index.get_leaves("Music_Voice", 1, 2)
+            [Note("c'1")]
+
+        """
+        if context_name is None:
+            self._leaves.clear()
+            return
+        leaves_by_measure_number = self._leaves.setdefault(context_name, {})
+        if start_measure_number is None and stop_measure_number is None:
+            leaves_by_measure_number.clear()
+            return
+        for measure_number in list(leaves_by_measure_number):
+            if start_measure_number is not None:
+                if measure_number < start_measure_number:
+                    continue
+            if stop_measure_number is not None:
+                if stop_measure_number < measure_number:
+                    continue
+            del leaves_by_measure_number[measure_number]
+
+    def get_leaves(
+        self, context_name: str, start_measure_number: int, stop_measure_number: int
+    ) -> typing.List:
+        """
+        Gets leaves cached in ``context_name`` from ``start_measure_number``
+        to ``stop_measure_number``, inclusive.
+
+        Raises key error when no leaves are cached in ``context_name``.
+        """
+        leaves_by_measure_number = self._leaves[context_name]
+        leaves: typing.List = []
+        for measure_number in range(start_measure_number, stop_measure_number + 1):
+            leaves.extend(leaves_by_measure_number.get(measure_number, []))
+        return leaves
+
+    def get_measure_number(self, offset: abjad.DurationTyping) -> typing.Optional[int]:
+        """
+        Gets number of measure that contains ``offset``.
+
+        Returns none when no measure contains ``offset``.
+        """
+        offset = abjad.Offset(offset)
+        i = bisect.bisect_right(self._start_offsets, offset) - 1
+        if i < 0 or self._stop_offsets[i] <= offset:
+            return None
+        return self.first_measure_number + i
+
+    def get_minimum_durations(self, leaves) -> typing.List[abjad.Duration]:
+        """
+        Gets minimum nonmultiplied duration of ``leaves`` that start in each
+        measure.
+
+        ..  container:: example
+
+            >>> index = baca.MeasureIndex([abjad.Timespan(0, 1), abjad.Timespan(1, 2)])
+            >>> voice = abjad.Voice("c'2 d'4 e'8 f'8 g'1 * 1/2 a'4 * 2")
+            >>> for duration in index.get_minimum_durations(voice[:]):
+            ...     duration
+            Duration(1, 8)
+            Duration(1, 4)
+
+        Ignores leaves that start outside every measure. Gives none for measure
+        in which no leaf starts.
+        """
+        durations: typing.List[typing.Any] = [None] * self.measure_count
+        for leaf in leaves:
+            timespan = abjad.get.timespan(leaf)
+            measure_number = self.get_measure_number(timespan.start_offset)
+            if measure_number is None:
+                continue
+            duration = timespan.duration
+            if leaf.multiplier is not None:
+                duration = abjad.Duration(duration / leaf.multiplier)
+            i = measure_number - self.first_measure_number
+            if durations[i] is None or duration < durations[i]:
+                durations[i] = duration
+        return durations
+
+    def get_timespan(self, measure_number: int) -> abjad.Timespan:
+        """
+        Gets timespan of measure ``measure_number``.
+        """
+        i = measure_number - self.first_measure_number
+        if not 0 <= i < self.measure_count:
+            raise IndexError(f"no measure {measure_number}.")
+        return abjad.Timespan(self._start_offsets[i], self._stop_offsets[i])
+
+    def has_leaves(self) -> bool:
+        """
+        Is true when leaves are cached.
+        """
+        return bool(self._leaves)
+
+
 class PageSpecifier:
     """
     Page specifier.
@@ -2409,6 +2626,145 @@ class PageSpecifier:
         return self._systems
 
 
+class SegmentProfile:
+    """
+    Segment profile.
+
+    ..  container:: example
+
+        >>> profile = baca.SegmentProfile()
+        >>> for i in range(3):
+        ...     with profile.measure("postprocessing", "_whitespace_leaves"):
+        ...         pass
+
+        >>> with profile.measure(
+        ...     "commands",
+        ...     "IndicatorCommand",
+        ...     site="baca.staccato()",
+        ...     scope="Music_Voice (1, -1)",
+        ... ):
+        ...     pass
+
+        >>> for record in profile.records:
+        ...     record["phase"], record["name"], record["calls"]
+        ('postprocessing', '_whitespace_leaves', 3)
+        ('commands', 'IndicatorCommand', 1)
+
+    Records wall time (in seconds), call count and allocation delta (in
+    bytes) per phase, name, site and scope. Allocation deltas are zero unless
+    ``tracemalloc`` is tracing.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_records",)
+
+    _keys = ("phase", "name", "site", "scope")
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._records: typing.Dict[typing.Tuple, typing.Dict] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return f"{type(self).__name__}(records={len(self._records)})"
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def records(self) -> typing.List[typing.Dict]:
+        """
+        Gets records in order of first measurement.
+        """
+        return [dict(_) for _ in self._records.values()]
+
+    ### PUBLIC METHODS ###
+
+    @contextlib.contextmanager
+    def measure(
+        self, phase: str, name: str, *, site: str = None, scope: str = None
+    ) -> typing.Iterator[None]:
+        """
+        Measures body of ``with`` statement.
+        """
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start_time
+            allocated = 0
+            if tracing:
+                allocated = tracemalloc.get_traced_memory()[0] - start_memory
+            self.record(
+                phase, name, seconds, allocated=allocated, site=site, scope=scope
+            )
+
+    def record(
+        self,
+        phase: str,
+        name: str,
+        seconds: float,
+        *,
+        allocated: int = 0,
+        site: str = None,
+        scope: str = None,
+    ) -> None:
+        """
+        Adds one call of ``seconds`` duration to record.
+        """
+        key = (phase, name, site, scope)
+        record: typing.Dict[str, typing.Any]
+        if key not in self._records:
+            record = dict(zip(self._keys, key))
+            record.update(calls=0, seconds=0.0, allocated=0)
+            self._records[key] = record
+        record = self._records[key]
+        record["calls"] += 1
+        record["seconds"] += seconds
+        record["allocated"] += allocated
+
+    def slowest(self, count: int = None) -> typing.List[typing.Dict]:
+        """
+        Gets records sorted by decreasing wall time.
+        """
+        records = self.records
+        records.sort(key=lambda _: _["seconds"], reverse=True)
+        if count is not None:
+            records = records[:count]
+        return records
+
+    def to_json(self) -> str:
+        """
+        Changes profile to JSON string.
+        """
+        return json.dumps({"records": self.records}, indent=4)
+
+    def wrap(self, phase: str, name: str, function: typing.Callable) -> typing.Callable:
+        """
+        Wraps ``function`` in measurement.
+        """
+
+        def wrapper(*arguments, **keywords):
+            with self.measure(phase, name):
+                return function(*arguments, **keywords)
+
+        return wrapper
+
+    def write(self, path) -> None:
+        """
+        Writes profile to ``path`` as JSON.
+        """
+        pathlib.Path(path).write_text(self.to_json() + "\n")
+
+
 class SystemSpecifier:
     """
     System specifier.
@@ -1,7 +1,12 @@
+import bisect
+import contextlib
 import copy
+import functools
 import importlib
 import inspect
 import pathlib
+import pickle
+import tracemalloc
 import typing
 
 import ide
@@ -10,6 +15,7 @@ import abjad
 from abjadext import rmakers
 
 from . import classes, const, indicators
+from . import metadata as baca_metadata
 from . import overrides as baca_overrides
 from . import (
     pitchclasses,
@@ -22,11 +28,268 @@ from . import (
 )
 
 
+def _profiled(phase):
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *arguments, **keywords):
+            if self._profile is None:
+                return method(self, *arguments, **keywords)
+            with self._profile.measure(phase, method.__name__):
+                return method(self, *arguments, **keywords)
+
+        return wrapper
+
+    return decorator
+
+
 def _site(frame, n=None):
     prefix = "baca.SegmentMaker"
     return scoping.site(frame, prefix, n=n)
 
 
+class _EffectiveIndicatorCache:
+    """
+    Effective indicator cache.
+
+    Caches one run-length map per component and prototype: start offsets of
+    component wrappers (and of context dependent wrappers) in ascending
+    order, each paired with first wrapper at that offset. Looks up effective
+    indicator of leaf with one bisection per component in leaf parentage.
+
+    Matches ``abjad.get.effective()`` when ``n`` is zero. Callers clear cache
+    after attaching or detaching indicators of cached prototypes.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_maps",)
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._maps: typing.Dict[typing.Tuple, typing.Tuple] = {}
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _filter_wrappers(wrappers, prototype):
+        return [
+            _
+            for _ in wrappers
+            if not _.annotation and isinstance(_.indicator, prototype)
+        ]
+
+    def _get_map(self, component, prototype):
+        key = (id(component), prototype)
+        if key not in self._maps:
+            self._maps[key] = self._make_map(component, prototype)
+        return self._maps[key]
+
+    def _get_wrapper(self, component, prototype, start_offset):
+        if isinstance(component, abjad.Leaf):
+            offsets, wrappers = self._make_map(component, prototype)
+        else:
+            offsets, wrappers = self._get_map(component, prototype)
+        i = bisect.bisect_right(offsets, start_offset) - 1
+        if i < 0:
+            return None, None
+        return offsets[i], wrappers[i]
+
+    @classmethod
+    def _make_map(class_, component, prototype):
+        # active indicator takes precedence over inactive indicator
+        wrappers = class_._filter_wrappers(component._wrappers, prototype)
+        if any(_.deactivate is True for _ in wrappers) and not all(
+            _.deactivate is True for _ in wrappers
+        ):
+            wrappers = [_ for _ in wrappers if _.deactivate is not True]
+        if isinstance(component, abjad.Context):
+            wrappers.extend(
+                class_._filter_wrappers(component._dependent_wrappers, prototype)
+            )
+        offset_to_wrapper: typing.Dict = {}
+        for wrapper in wrappers:
+            offset_to_wrapper.setdefault(wrapper.start_offset, wrapper)
+        offsets = sorted(offset_to_wrapper)
+        return offsets, [offset_to_wrapper[_] for _ in offsets]
+
+    ### PUBLIC METHODS ###
+
+    def clear(self) -> None:
+        """
+        Clears cache.
+        """
+        self._maps.clear()
+
+    def get(self, leaf, prototype, default=None):
+        """
+        Gets effective indicator of ``prototype`` attached to ``leaf``.
+
+        Returns ``default`` when no indicator is effective.
+        """
+        leaf._update_now(indicators=True)
+        start_offset = leaf._get_timespan().start_offset
+        best_offset, best_wrapper = None, None
+        voice_name = None
+        for component in abjad.get.parentage(leaf):
+            if isinstance(component, abjad.Voice):
+                if voice_name is not None and component.name != voice_name:
+                    continue
+                voice_name = component.name or id(component)
+            offset, wrapper = self._get_wrapper(component, prototype, start_offset)
+            if wrapper is None:
+                continue
+            if best_offset is None or best_offset < offset:
+                best_offset, best_wrapper = offset, wrapper
+        if best_wrapper is None:
+            return default
+        return best_wrapper.indicator
+
+
+class _TagIndex:
+    """
+    Tag index.
+
+    Interns tag words as integers and maps each word to (leaf, wrapper) pairs
+    whose tag contains word. Builds in one walk of leaves; callers add
+    wrappers they attach after build. Skips wrappers detached since build.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_pairs", "_word_to_id")
+
+    ### INITIALIZER ###
+
+    def __init__(self, leaves=()) -> None:
+        self._pairs: typing.Dict[int, typing.List[typing.Tuple]] = {}
+        self._word_to_id: typing.Dict[str, int] = {}
+        for leaf in leaves:
+            for wrapper in abjad.get.wrappers(leaf):
+                self.add(leaf, wrapper)
+
+    ### PUBLIC METHODS ###
+
+    def add(self, leaf, wrapper) -> None:
+        """
+        Adds ``wrapper`` attached to ``leaf``.
+        """
+        if wrapper.tag is None:
+            return
+        for word in wrapper.tag:
+            word_id = self._word_to_id.setdefault(word, len(self._word_to_id))
+            self._pairs.setdefault(word_id, []).append((leaf, wrapper))
+
+    def get(self, tags) -> typing.List[typing.Tuple]:
+        """
+        Gets (leaf, wrapper) pairs with tag that contains any of ``tags``.
+        """
+        pairs, wrapper_ids = [], set()
+        for tag in tags:
+            word_id = self._word_to_id.get(str(tag))
+            if word_id is None:
+                continue
+            for leaf, wrapper in self._pairs[word_id]:
+                if wrapper.component is not leaf or id(wrapper) in wrapper_ids:
+                    continue
+                wrapper_ids.add(id(wrapper))
+                pairs.append((leaf, wrapper))
+        return pairs
+
+
+class _LeafVisitor:
+    """
+    Leaf visitor.
+
+    Postprocessing methods register voice, leaf and logical tie hooks; leaf
+    visitor dispatches all hooks during one traversal of score leaves.
+
+    Hooks run in registration order at each leaf; indicators therefore attach
+    to any one leaf in the same order as when each postprocessing method
+    iterates the score separately.
+
+    Records hook calls under name of registering method when ``profile`` is
+    set.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_finalizers", "_hooks", "_profile")
+
+    ### INITIALIZER ###
+
+    def __init__(self, profile: segmentclasses.SegmentProfile = None) -> None:
+        self._finalizers: typing.List[typing.Callable] = []
+        self._hooks: typing.List[typing.Tuple[str, typing.Callable]] = []
+        self._profile = profile
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, score) -> None:
+        """
+        Calls hooks on leaves in ``score``; then calls finalizers.
+
+        Voice hooks run once per voice name, at the first leaf of the voice.
+        Logical tie hooks run at the head of each logical tie.
+        """
+        voice_names: typing.Set[str] = set()
+        for leaf in abjad.iterate(score).leaves():
+            voice = abjad.get.parentage(leaf).get(abjad.Voice)
+            first_voice_leaf = False
+            if voice is not None and voice.name not in voice_names:
+                voice_names.add(voice.name)
+                first_voice_leaf = True
+            logical_tie = None
+            for kind, hook in self._hooks:
+                if kind == "leaf":
+                    hook(leaf, voice)
+                elif kind == "logical_tie":
+                    if logical_tie is None:
+                        logical_tie = abjad.get.logical_tie(leaf)
+                    if logical_tie.head is leaf:
+                        hook(logical_tie, voice)
+                else:
+                    assert kind == "voice", repr(kind)
+                    if first_voice_leaf:
+                        hook(voice)
+        for finalizer in self._finalizers:
+            finalizer()
+
+    ### PRIVATE METHODS ###
+
+    def _profile_hook(self, hook):
+        if self._profile is None:
+            return hook
+        name = hook.__qualname__.split(".<locals>")[0].split(".")[-1]
+        return self._profile.wrap("postprocessing", name, hook)
+
+    ### PUBLIC METHODS ###
+
+    def finalize(self, hook) -> None:
+        """
+        Registers ``hook()`` to run after traversal.
+        """
+        self._finalizers.append(self._profile_hook(hook))
+
+    def leaf(self, hook) -> None:
+        """
+        Registers ``hook(leaf, voice)``.
+        """
+        self._hooks.append(("leaf", self._profile_hook(hook)))
+
+    def logical_tie(self, hook) -> None:
+        """
+        Registers ``hook(logical_tie, voice)``.
+        """
+        self._hooks.append(("logical_tie", self._profile_hook(hook)))
+
+    def voice(self, hook) -> None:
+        """
+        Registers ``hook(voice)``.
+        """
+        self._hooks.append(("voice", self._profile_hook(hook)))
+
+
 nonfirst_preamble = r"""\header { composer = ##f poet = ##f title = ##f }
 \layout { indent = 0 }
 \paper { print-first-page-number = ##t }"""
@@ -612,7 +875,6 @@ class SegmentMaker(abjad.SegmentMaker):
         "_activate",
         "_allow_empty_selections",
         "_breaks",
-        "_cache",
         "_cached_time_signatures",
         "_check_all_are_pitched",
         "_clock_time_extra_offset",
@@ -620,6 +882,7 @@ class SegmentMaker(abjad.SegmentMaker):
         "_color_octaves",
         "_commands",
         "_deactivate",
+        "_deferred_checks",
         "_do_not_check_beamed_long_notes",
         "_do_not_check_out_of_range_pitches",
         "_do_not_check_persistence",
@@ -627,6 +890,7 @@ class SegmentMaker(abjad.SegmentMaker):
         "_do_not_include_layout_ly",
         "_do_not_force_nonnatural_accidentals",
         "_duration",
+        "_effective_indicator_cache",
         "_environment",
         "_fermata_measure_empty_overrides",
         "_fermata_measure_numbers",
@@ -642,21 +906,26 @@ class SegmentMaker(abjad.SegmentMaker):
         "_local_measure_number_extra_offset",
         "_magnify_staves",
         "_margin_markups",
+        "_measure_index",
         "_measure_number_extra_offset",
         "_parts_metric_modulation_multiplier",
         "_metronome_marks",
         "_midi",
+        "_minimum_durations_by_measure",
         "_offset_to_measure_number",
         "_previously_alive_contexts",
+        "_profile",
         "_remove_phantom_measure",
         "_score",
         "_score_template",
         "_segment_bol_measure_numbers",
         "_segment_directory",
         "_segment_duration",
+        "_selection_index",
         "_skips_instead_of_rests",
         "_sounds_during_segment",
         "_spacing",
+        "_tag_index",
         "_spacing_extra_offset",
         "_stage_markup",
         "_stage_number_extra_offset",
@@ -794,11 +1063,11 @@ class SegmentMaker(abjad.SegmentMaker):
             assert isinstance(clock_time_override, abjad.MetronomeMark)
         self._clock_time_override = clock_time_override
         self._color_octaves = color_octaves
-        self._cache = None
         self._cached_time_signatures: typing.List[abjad.TimeSignature] = []
         if deactivate is not None:
             assert all(isinstance(_, abjad.Tag) for _ in deactivate)
         self._deactivate = deactivate
+        self._deferred_checks: typing.Optional[typing.List] = None
         if do_not_check_out_of_range_pitches is not None:
             do_not_check_out_of_range_pitches = bool(do_not_check_out_of_range_pitches)
         self._do_not_check_beamed_long_notes = do_not_check_beamed_long_notes
@@ -808,6 +1077,7 @@ class SegmentMaker(abjad.SegmentMaker):
         self._do_not_force_nonnatural_accidentals = do_not_force_nonnatural_accidentals
         self._do_not_include_layout_ly = do_not_include_layout_ly
         self._duration: typing.Optional[abjad.DurationTyping] = None
+        self._effective_indicator_cache = _EffectiveIndicatorCache()
         self._fermata_measure_empty_overrides = fermata_measure_empty_overrides
         self._fermata_measure_numbers: typing.List = []
         self._fermata_start_offsets: typing.List[abjad.Offset] = []
@@ -824,15 +1094,20 @@ class SegmentMaker(abjad.SegmentMaker):
         self._local_measure_number_extra_offset = local_measure_number_extra_offset
         self._magnify_staves = magnify_staves
         self._margin_markups = margin_markups
+        self._measure_index: typing.Optional[segmentclasses.MeasureIndex] = None
         self._measure_number_extra_offset = measure_number_extra_offset
         self._metronome_marks = metronome_marks
         self._midi: typing.Optional[bool] = None
+        self._minimum_durations_by_measure: typing.Optional[
+            typing.List[abjad.Duration]
+        ] = None
         self._offset_to_measure_number: typing.Dict[abjad.Offset, int] = {}
         if parts_metric_modulation_multiplier is not None:
             assert isinstance(parts_metric_modulation_multiplier, tuple)
             assert len(parts_metric_modulation_multiplier) == 2
         self._parts_metric_modulation_multiplier = parts_metric_modulation_multiplier
         self._previously_alive_contexts: typing.List[str] = []
+        self._profile: typing.Optional[segmentclasses.SegmentProfile] = None
         if remove_phantom_measure is not None:
             remove_phantom_measure = bool(remove_phantom_measure)
         self._remove_phantom_measure = remove_phantom_measure
@@ -842,9 +1117,11 @@ class SegmentMaker(abjad.SegmentMaker):
             segment_directory = ide.Path(segment_directory)
         self._segment_directory: typing.Optional[ide.Path] = segment_directory
         self._segment_duration: typing.Optional[abjad.DurationTyping] = None
+        self._selection_index = classes.SelectionIndex()
         self._skips_instead_of_rests = skips_instead_of_rests
         self._sounds_during_segment: abjad.OrderedDict = abjad.OrderedDict()
         self._spacing = spacing
+        self._tag_index: typing.Optional[_TagIndex] = None
         self._spacing_extra_offset = spacing_extra_offset
         self._stage_markup = stage_markup
         self._stage_number_extra_offset = stage_number_extra_offset
@@ -1243,6 +1520,38 @@ class SegmentMaker(abjad.SegmentMaker):
                 <BLANKLINE>
                 >>
 
+        ..  container:: example
+
+            Selectors see ties, detached ties and new chords of earlier
+            commands in same scope:
+
+            >>> maker = baca.SegmentMaker(
+            ...     score_template=baca.SingleStaffScoreTemplate(),
+            ...     time_signatures=[(4, 8)],
+            ...     )
+
+            >>> maker(
+            ...     'Music_Voice',
+            ...     baca.make_even_divisions(),
+            ...     baca.pitch('E4'),
+            ...     baca.accent(baca.pheads()),
+            ...     baca.tie(baca.pleaf(0)),
+            ...     baca.marcato(baca.pheads()),
+            ...     baca.untie(baca.pleaf(0)),
+            ...     baca.pitch('<C4 E4>', baca.pleaf(-1), allow_repitch=True),
+            ...     baca.staccato(baca.pheads()),
+            ...     )
+
+            >>> lilypond_file = maker.run(environment='docs')
+            >>> staff = lilypond_file['Music_Staff']
+            >>> for leaf in abjad.select(staff).leaves()[:4]:
+            ...     articulations = abjad.get.indicators(leaf, abjad.Articulation)
+            ...     print(repr(leaf), [_.name for _ in articulations])
+            Note("e'8") ['>', 'marcato', 'staccato']
+            Note("e'8") ['>', 'staccato']
+            Note("e'8") ['>', 'marcato', 'staccato']
+            Chord("<c' e'>8") ['>', 'marcato', 'staccato']
+
         ..  container:: example exception
 
             Raises exception on noncommand input:
@@ -1328,6 +1637,7 @@ class SegmentMaker(abjad.SegmentMaker):
 
     ### PRIVATE METHODS ###
 
+    @_profiled("clock_time")
     def _activate_tags(self, tags):
         tags = tags or []
         tags = set(tags)
@@ -1335,18 +1645,11 @@ class SegmentMaker(abjad.SegmentMaker):
         if not tags:
             return
         assert all(isinstance(_, abjad.Tag) for _ in tags), repr(tags)
-        for leaf in abjad.iterate(self.score).leaves():
-            if not isinstance(leaf, abjad.Skip):
-                continue
-            wrappers = abjad.get.wrappers(leaf)
-            for wrapper in wrappers:
-                if wrapper.tag is None:
-                    continue
-                for tag in tags:
-                    if tag in wrapper.tag:
-                        wrapper.deactivate = False
-                        break
+        for leaf, wrapper in self._get_tag_index().get(tags):
+            if isinstance(leaf, abjad.Skip):
+                wrapper.deactivate = False
 
+    @_profiled("postprocessing")
     def _add_container_identifiers(self):
         if self.environment == "docs" and not getattr(
             self, "test_container_identifiers", False
@@ -1474,6 +1777,7 @@ class SegmentMaker(abjad.SegmentMaker):
             tag_ = wrapper.tag.append(tag)
             wrapper.tag = tag_
 
+    @_profiled("postprocessing")
     def _apply_breaks(self):
         if self.breaks is None:
             return
@@ -1481,6 +1785,7 @@ class SegmentMaker(abjad.SegmentMaker):
         if self.breaks.local_measure_numbers:
             abjad.setting(self.score).current_bar_number = 1
 
+    @_profiled("after_rhythm")
     def _apply_spacing(self):
         if self.spacing is None:
             return
@@ -1621,6 +1926,7 @@ class SegmentMaker(abjad.SegmentMaker):
         rests = self._make_global_rests()
         context.extend(rests)
 
+    @_profiled("after_rhythm")
     def _attach_first_appearance_score_template_defaults(self):
         if self.first_segment:
             return
@@ -1632,6 +1938,7 @@ class SegmentMaker(abjad.SegmentMaker):
             for wrapper in self.score_template.attach_defaults(staff__group):
                 self._treat_persistent_wrapper(self.manifests, wrapper, "default")
 
+    @_profiled("after_rhythm")
     def _attach_first_segment_score_template_defaults(self):
         if not self.first_segment:
             return
@@ -1685,7 +1992,9 @@ class SegmentMaker(abjad.SegmentMaker):
         tag = tag.append(_site(inspect.currentframe()))
         abjad.attach(markup, leaf, deactivate=existing_deactivate, tag=tag)
 
+    @_profiled("postprocessing")
     def _attach_metronome_marks(self):
+        self._effective_indicator_cache.clear()
         indicator_count = 0
         skips = classes.Selection(self.score["Global_Skips"]).skips()
         final_leaf_metronome_mark = abjad.get.indicator(skips[-1], abjad.MetronomeMark)
@@ -1967,18 +2276,24 @@ class SegmentMaker(abjad.SegmentMaker):
     # because of this LilyPond incorrectly prints accidentals in front of some
     # repeat-tied notes;
     # this method works around LilyPond's behavior
-    def _attach_shadow_tie_indicators(self):
+    def _attach_shadow_tie_indicators(self, visitor):
         tag = _site(inspect.currentframe())
-        for plt in classes.Selection(self.score).plts():
-            if len(plt) == 1:
-                continue
-            for pleaf in plt[:-1]:
+
+        def attach(lt, voice):
+            if not isinstance(lt.head, (abjad.Note, abjad.Chord)):
+                return
+            if len(lt) == 1:
+                return
+            for pleaf in lt[:-1]:
                 if abjad.get.has_indicator(pleaf, abjad.Tie):
                     continue
                 tie = abjad.Tie()
                 abjad.tweak(tie).stencil = False
                 abjad.attach(tie, pleaf, tag=tag)
 
+        visitor.logical_tie(attach)
+
+    @_profiled("after_rhythm")
     def _attach_sounds_during(self):
         for voice in abjad.iterate(self.score).components(abjad.Voice):
             pleaves = []
@@ -2072,6 +2387,7 @@ class SegmentMaker(abjad.SegmentMaker):
         manifests["score_template"] = self.score_template
         return manifests
 
+    @_profiled("postprocessing")
     def _cache_fermata_measure_numbers(self):
         if "Global_Rests" not in self.score:
             return
@@ -2093,38 +2409,25 @@ class SegmentMaker(abjad.SegmentMaker):
             self._fermata_measure_numbers.append(measure_number)
 
     def _cache_leaves(self):
-        measure_timespans = []
-        for measure_index in range(self.measure_count):
-            measure_number = measure_index + 1
-            measure_timespan = self._get_measure_timespan(measure_number)
-            measure_timespans.append(measure_timespan)
-        self._cache = abjad.OrderedDict()
+        measure_index = self._get_measure_index()
+        measure_index.clear_leaves()
         for leaf in abjad.select(self.score).leaves():
-            parentage = abjad.get.parentage(leaf)
-            context = parentage.get(abjad.Context)
-            leaves_by_measure_number = self._cache.setdefault(
-                context.name, abjad.OrderedDict()
-            )
-            leaf_timespan = abjad.get.timespan(leaf)
-            # TODO: replace loop with bisection:
-            for i, measure_timespan in enumerate(measure_timespans):
-                measure_number = i + 1
-                if leaf_timespan.starts_during_timespan(measure_timespan):
-                    cached_leaves = leaves_by_measure_number.setdefault(
-                        measure_number, []
-                    )
-                    cached_leaves.append(leaf)
+            start_offset = abjad.get.timespan(leaf).start_offset
+            measure_number = measure_index.get_measure_number(start_offset)
+            if measure_number is None:
+                continue
+            context = abjad.get.parentage(leaf).get(abjad.Context)
+            measure_index.cache_leaf(context.name, measure_number, leaf)
 
     def _cache_previously_alive_contexts(self) -> None:
         if self.segment_directory is None:
             return
         contexts: typing.Set[str] = set()
-        string = "alive_during_segment"
-        for segment in self.segment_directory.parent.list_paths():
-            if segment == self.segment_directory:
+        index = baca_metadata.get_segment_index(self.segment_directory.parent)
+        for name, entry in index.items():
+            if name == self.segment_directory.name:
                 break
-            contexts_ = segment.get_metadatum(string, file_name="__persist__.py")
-            contexts.update(contexts_)
+            contexts.update(entry["alive_during_segment"])
         self._previously_alive_contexts.extend(sorted(contexts))
 
     def _cache_voice_names(self):
@@ -2189,13 +2492,23 @@ class SegmentMaker(abjad.SegmentMaker):
         self._duration = duration_clock_string
         return clock_times
 
-    def _call_commands(self):
+    def _call_commands(self, voice_names=None):
         command_count = 0
-        for command in self.commands:
-            assert isinstance(command, scoping.Command)
-            if isinstance(command, rhythmcommands.RhythmCommand):
-                continue
-            command_count += 1
+        self._selection_index.clear()
+        with self._selection_index:
+            for command in self.commands:
+                command_count += self._call_command(command, voice_names)
+        self._selection_index.clear()
+        return command_count
+
+    def _call_command(self, command, voice_names):
+        assert isinstance(command, scoping.Command)
+        if isinstance(command, rhythmcommands.RhythmCommand):
+            return 0
+        if voice_names is not None:
+            if getattr(command.scope, "voice_name", None) not in voice_names:
+                return 0
+        with self._measure_command("commands", command):
             selection = self._scope_to_leaf_selection(command)
             voice_name = command.scope.voice_name
             runtime = self._bundle_manifests(voice_name)
@@ -2205,15 +2518,15 @@ class SegmentMaker(abjad.SegmentMaker):
                 print(f"Interpreting ...\n\n{abjad.storage(command)}\n")
                 raise
             self._handle_mutator(command)
-            if getattr(command, "persist", None):
-                parameter = command.parameter
-                state = command.state
-                assert "name" not in state
-                state["name"] = command.persist
-                if voice_name not in self.voice_metadata:
-                    self.voice_metadata[voice_name] = abjad.OrderedDict()
-                self.voice_metadata[voice_name][parameter] = state
-        return command_count
+        if getattr(command, "persist", None):
+            parameter = command.parameter
+            state = command.state
+            assert "name" not in state
+            state["name"] = command.persist
+            if voice_name not in self.voice_metadata:
+                self.voice_metadata[voice_name] = abjad.OrderedDict()
+            self.voice_metadata[voice_name][parameter] = state
+        return 1
 
     def _call_rhythm_commands(self):
         self._attach_fermatas()
@@ -2246,11 +2559,12 @@ class SegmentMaker(abjad.SegmentMaker):
                 result = self._get_measure_time_signatures(*measures)
                 start_offset, time_signatures = result
                 runtime = self._bundle_manifests(voice.name)
-                try:
-                    selection = command._make_selection(time_signatures, runtime)
-                except Exception:
-                    print(f"Interpreting ...\n\n{abjad.storage(command)}\n")
-                    raise
+                with self._measure_command("rhythm_commands", command):
+                    try:
+                        selection = command._make_selection(time_signatures, runtime)
+                    except Exception:
+                        print(f"Interpreting ...\n\n{abjad.storage(command)}\n")
+                        raise
                 timespan = abjad.AnnotatedTimespan(
                     start_offset=start_offset, annotation=selection
                 )
@@ -2282,17 +2596,29 @@ class SegmentMaker(abjad.SegmentMaker):
             voice.extend(selections)
         return command_count
 
-    def _check_all_are_pitched_(self):
+    def _can_make_layout(self):
+        # layout spacing reads minimum durations that full run computed
+        strings = self.metadata.get("minimum_durations_by_measure")
+        if not strings:
+            return False
+        return len(strings) == self._get_measure_index().measure_count
+
+    def _check_all_are_pitched_(self, visitor):
         if not self.check_all_are_pitched:
             return
         indicator = const.NOT_YET_PITCHED
-        for voice in abjad.iterate(self.score).components(abjad.Voice):
-            for leaf in abjad.iterate(voice).leaves():
-                if abjad.get.has_indicator(leaf, indicator):
-                    message = "not yet pitched:\n"
-                    message += f"   {repr(leaf)} in {voice.name}"
-                    raise Exception(message)
 
+        def check(leaf, voice):
+            if voice is None:
+                return
+            if abjad.get.has_indicator(leaf, indicator):
+                message = "not yet pitched:\n"
+                message += f"   {repr(leaf)} in {voice.name}"
+                raise Exception(message)
+
+        visitor.leaf(check)
+
+    @_profiled("postprocessing")
     def _check_all_music_in_part_containers(self):
         name = "all_music_in_part_containers"
         if getattr(self.score_template, name, None) is not True:
@@ -2316,28 +2642,43 @@ class SegmentMaker(abjad.SegmentMaker):
                 message += " outside part container."
                 raise Exception(message)
 
-    def _check_doubled_dynamics(self):
-        for leaf in abjad.iterate(self.score).leaves():
+    @_profiled("postprocessing")
+    def _check_duplicate_part_assignments(self):
+        super()._check_duplicate_part_assignments()
+
+    def _check_doubled_dynamics(self, visitor):
+        def check(leaf, voice):
             dynamics = abjad.get.indicators(leaf, abjad.Dynamic)
             if 1 < len(dynamics):
-                voice = abjad.get.parentage(leaf).get(abjad.Voice)
                 message = f"leaf {str(leaf)} in {voice.name} has"
                 message += f" {len(dynamics)} dynamics attached:"
                 for dynamic in dynamics:
                     message += f"\n   {dynamic!s}"
                 raise Exception(message)
 
-    def _check_persistent_indicators(self):
+        visitor.leaf(check)
+
+    def _check_persistent_indicators(self, visitor):
         if self.do_not_check_persistence:
             return
         if self.environment == "docs":
             return
         indicator = const.SOUNDS_DURING_SEGMENT
-        for voice in abjad.iterate(self.score).components(abjad.Voice):
-            if not abjad.get.has_indicator(voice, indicator):
-                continue
-            for i, leaf in enumerate(abjad.iterate(voice).leaves()):
-                self._check_persistent_indicators_for_leaf(voice.name, leaf, i)
+        voice_name_to_leaf_index = {}
+
+        def start_voice(voice):
+            if abjad.get.has_indicator(voice, indicator):
+                voice_name_to_leaf_index[voice.name] = 0
+
+        def check(leaf, voice):
+            if voice is None or voice.name not in voice_name_to_leaf_index:
+                return
+            i = voice_name_to_leaf_index[voice.name]
+            voice_name_to_leaf_index[voice.name] = i + 1
+            self._check_persistent_indicators_for_leaf(voice.name, leaf, i)
+
+        visitor.voice(start_voice)
+        visitor.leaf(check)
 
     def _check_persistent_indicators_for_leaf(self, voice, leaf, i):
         prototype = (
@@ -2345,48 +2686,56 @@ class SegmentMaker(abjad.SegmentMaker):
             abjad.MetronomeMark,
             indicators.Ritardando,
         )
-        mark = abjad.get.effective(leaf, prototype)
+        cache = self._effective_indicator_cache
+        mark = cache.get(leaf, prototype)
         if mark is None:
             message = f"{voice} leaf {i} ({leaf!s}) missing metronome mark."
             raise Exception(message)
-        instrument = abjad.get.effective(leaf, abjad.Instrument)
+        instrument = cache.get(leaf, abjad.Instrument)
         if instrument is None:
             message = f"{voice} leaf {i} ({leaf!s}) missing instrument."
             raise Exception(message)
         if not self.score_template.do_not_require_margin_markup:
-            markup = abjad.get.effective(leaf, abjad.MarginMarkup)
+            markup = cache.get(leaf, abjad.MarginMarkup)
             if markup is None:
                 message = f"{voice} leaf {i} ({leaf!s}) missing margin markup."
                 raise Exception(message)
-        clef = abjad.get.effective(leaf, abjad.Clef)
+        clef = cache.get(leaf, abjad.Clef)
         if clef is None:
             raise Exception(f"{voice} leaf {i} ({leaf!s}) missing clef.")
 
+    @staticmethod
+    def _check_score_wellformedness(score, **keywords):
+        if not abjad.wf.wellformed(score, **keywords):
+            message = abjad.wf.tabulate_wellformedness(score, **keywords)
+            raise Exception("\n" + message)
+
+    @_profiled("postprocessing")
     def _check_wellformedness(self):
         if self.do_not_check_wellformedness:
             return
-        check_beamed_long_notes = not self.do_not_check_beamed_long_notes
-        check_out_of_range_pitches = not self.do_not_check_out_of_range_pitches
-        if not abjad.wf.wellformed(
-            self.score,
-            check_beamed_long_notes=check_beamed_long_notes,
-            check_out_of_range_pitches=check_out_of_range_pitches,
-        ):
-            message = abjad.wf.tabulate_wellformedness(
-                self.score,
-                check_beamed_long_notes=check_beamed_long_notes,
-                check_out_of_range_pitches=check_out_of_range_pitches,
-            )
-            raise Exception("\n" + message)
+        keywords = {
+            "check_beamed_long_notes": not self.do_not_check_beamed_long_notes,
+            "check_out_of_range_pitches": not self.do_not_check_out_of_range_pitches,
+        }
+        # build driver checks pickled snapshot off segment's critical path
+        if self._deferred_checks is not None:
+            self._deferred_checks.append((pickle.dumps(self.score), keywords))
+            return
+        self._check_score_wellformedness(self.score, **keywords)
 
-    def _clean_up_laissez_vibrer_tie_direction(self):
+    def _clean_up_laissez_vibrer_tie_direction(self, visitor):
+        cache = self._effective_indicator_cache
         default = abjad.Clef("treble")
-        for note in abjad.iterate(self.score).leaves(abjad.Note):
+
+        def clean_up(note, voice):
+            if not isinstance(note, abjad.Note):
+                return
             if note.written_duration < 1:
-                continue
+                return
             if not abjad.get.has_indicator(note, abjad.LaissezVibrer):
-                continue
-            clef = abjad.get.effective(note, abjad.Clef, default=default)
+                return
+            clef = cache.get(note, abjad.Clef, default=default)
             staff_position = abjad.StaffPosition.from_pitch_and_clef(
                 note.written_pitch,
                 clef,
@@ -2394,14 +2743,20 @@ class SegmentMaker(abjad.SegmentMaker):
             if staff_position == abjad.StaffPosition(0):
                 abjad.override(note).laissez_vibrer_tie.direction = abjad.Up
 
-    def _clean_up_repeat_tie_direction(self):
+        visitor.leaf(clean_up)
+
+    def _clean_up_repeat_tie_direction(self, visitor):
+        cache = self._effective_indicator_cache
         default = abjad.Clef("treble")
-        for leaf in abjad.iterate(self.score).leaves(pitched=True):
+
+        def clean_up(leaf, voice):
+            if not isinstance(leaf, (abjad.Note, abjad.Chord)):
+                return
             if leaf.written_duration < 1:
-                continue
+                return
             if not abjad.get.has_indicator(leaf, abjad.RepeatTie):
-                continue
-            clef = abjad.get.effective(leaf, abjad.Clef, default=default)
+                return
+            clef = cache.get(leaf, abjad.Clef, default=default)
             if hasattr(leaf, "written_pitch"):
                 note_heads = [leaf.note_head]
             else:
@@ -2415,6 +2770,9 @@ class SegmentMaker(abjad.SegmentMaker):
                     abjad.tweak(repeat_tie).direction = abjad.Up
                     break
 
+        visitor.leaf(clean_up)
+
+    @_profiled("postprocessing")
     def _clean_up_on_beat_grace_containers(self):
         prototype = abjad.OnBeatGraceContainer
         for container in abjad.select(self.score).components(prototype):
@@ -2428,6 +2786,7 @@ class SegmentMaker(abjad.SegmentMaker):
                 outer = abjad.get.parentage(voice).get(abjad.Voice, 1)
                 voice.name = outer.name
 
+    @_profiled("postprocessing")
     def _clone_segment_initial_short_instrument_name(self):
         if self.first_segment:
             return
@@ -2457,6 +2816,7 @@ class SegmentMaker(abjad.SegmentMaker):
                 result.append(context.name)
         return result
 
+    @_profiled("clock_time")
     def _collect_metadata(self):
         metadata, persist = abjad.OrderedDict(), abjad.OrderedDict()
         persist["alive_during_segment"] = self._collect_alive_during_segment()
@@ -2478,6 +2838,9 @@ class SegmentMaker(abjad.SegmentMaker):
         metadata["final_measure_number"] = self._get_final_measure_number()
         if self._final_measure_is_fermata is True:
             metadata["final_measure_is_fermata"] = True
+        if self._minimum_durations_by_measure:
+            strings = [str(_) for _ in self._minimum_durations_by_measure]
+            metadata["minimum_durations_by_measure"] = strings
         dictionary = self._collect_persistent_indicators()
         if dictionary:
             persist["persistent_indicators"] = dictionary
@@ -2604,27 +2967,32 @@ class SegmentMaker(abjad.SegmentMaker):
                     result[context_name] = momentos
         return result
 
-    def _color_mock_pitch(self):
+    def _color_mock_pitch(self, visitor):
         indicator = const.MOCK
         tag = _site(inspect.currentframe())
         tag = tag.append(ide.tags.MOCK_COLORING)
-        leaves = []
-        for pleaf in abjad.iterate(self.score).leaves(pitched=True):
+
+        def color(pleaf, voice):
+            if not isinstance(pleaf, (abjad.Note, abjad.Chord)):
+                return
             if not abjad.get.has_indicator(pleaf, indicator):
-                continue
+                return
             string = r"\baca-mock-coloring"
             literal = abjad.LilyPondLiteral(string, format_slot="before")
             abjad.attach(literal, pleaf, tag=tag)
-            leaves.append(pleaf)
 
-    def _color_not_yet_pitched(self):
+        visitor.leaf(color)
+
+    def _color_not_yet_pitched(self, visitor):
         indicator = const.NOT_YET_PITCHED
         tag = _site(inspect.currentframe())
         tag = tag.append(ide.tags.NOT_YET_PITCHED_COLORING)
-        leaves = []
-        for pleaf in abjad.iterate(self.score).leaves(pitched=True):
+
+        def color(pleaf, voice):
+            if not isinstance(pleaf, (abjad.Note, abjad.Chord)):
+                return
             if not abjad.get.has_indicator(pleaf, indicator):
-                continue
+                return
             string = r"\baca-not-yet-pitched-coloring"
             literal = abjad.LilyPondLiteral(string, format_slot="before")
             tag_ = tag
@@ -2633,19 +3001,26 @@ class SegmentMaker(abjad.SegmentMaker):
             if abjad.get.has_indicator(pleaf, const.NOTE):
                 tag_ = tag_.append(ide.tags.NOTE)
             abjad.attach(literal, pleaf, tag=tag_)
-            leaves.append(pleaf)
 
-    def _color_not_yet_registered(self):
+        visitor.leaf(color)
+
+    def _color_not_yet_registered(self, visitor):
         indicator = const.NOT_YET_REGISTERED
         tag = _site(inspect.currentframe())
         tag = tag.append(ide.tags.NOT_YET_REGISTERED_COLORING)
-        for pleaf in abjad.iterate(self.score).leaves(pitched=True):
+
+        def color(pleaf, voice):
+            if not isinstance(pleaf, (abjad.Note, abjad.Chord)):
+                return
             if not abjad.get.has_indicator(pleaf, indicator):
-                continue
+                return
             string = r"\baca-not-yet-registered-coloring"
             literal = abjad.LilyPondLiteral(string, format_slot="before")
             abjad.attach(literal, pleaf, tag=tag)
 
+        visitor.leaf(color)
+
+    @_profiled("postprocessing")
     def _color_octaves_(self):
         if not self.color_octaves:
             return
@@ -2684,43 +3059,91 @@ class SegmentMaker(abjad.SegmentMaker):
                     literal = abjad.LilyPondLiteral(string, format_slot="before")
                     abjad.attach(literal, pleaf, tag=tag)
 
-    def _color_out_of_range(self):
+    def _color_out_of_range(self, visitor):
         indicator = const.ALLOW_OUT_OF_RANGE
         tag = _site(inspect.currentframe())
         tag = tag.append(ide.tags.OUT_OF_RANGE_COLORING)
-        for voice in abjad.iterate(self.score).components(abjad.Voice):
-            for pleaf in abjad.iterate(voice).leaves(pitched=True):
-                if abjad.get.has_indicator(pleaf, const.HIDDEN):
-                    continue
-                if abjad.get.has_indicator(pleaf, indicator):
-                    continue
-                instrument = abjad.get.effective(pleaf, abjad.Instrument)
-                if instrument is None:
-                    continue
-                if not abjad.iterpitches.sounding_pitches_are_in_range(
-                    pleaf, instrument.pitch_range
-                ):
-                    string = r"\baca-out-of-range-coloring"
-                    literal = abjad.LilyPondLiteral(string, format_slot="before")
-                    abjad.attach(literal, pleaf, tag=tag)
+        cache = self._effective_indicator_cache
+
+        def color(pleaf, voice):
+            if voice is None:
+                return
+            if not isinstance(pleaf, (abjad.Note, abjad.Chord)):
+                return
+            if abjad.get.has_indicator(pleaf, const.HIDDEN):
+                return
+            if abjad.get.has_indicator(pleaf, indicator):
+                return
+            instrument = cache.get(pleaf, abjad.Instrument)
+            if instrument is None:
+                return
+            if not abjad.iterpitches.sounding_pitches_are_in_range(
+                pleaf, instrument.pitch_range
+            ):
+                string = r"\baca-out-of-range-coloring"
+                literal = abjad.LilyPondLiteral(string, format_slot="before")
+                abjad.attach(literal, pleaf, tag=tag)
+
+        visitor.leaf(color)
 
-    def _color_repeat_pitch_classes_(self):
+    def _color_repeat_pitch_classes_(self, visitor):
         tag = _site(inspect.currentframe())
         tag = tag.append(ide.tags.REPEAT_PITCH_CLASS_COLORING)
-        lts = self._find_repeat_pitch_classes(self.score)
-        for lt in lts:
-            for leaf in lt:
-                string = r"\baca-repeat-pitch-class-coloring"
-                literal = abjad.LilyPondLiteral(string, format_slot="before")
-                abjad.attach(literal, leaf, tag=tag)
+        violators: typing.List[abjad.LogicalTie] = []
+        violator_heads: typing.Set[int] = set()
+        voice_name_to_previous = {}
+
+        def start_voice(voice):
+            if abjad.get.has_indicator(voice, const.INTERMITTENT):
+                return
+            voice_name_to_previous[voice.name] = (None, [])
+
+        def find(lt, voice):
+            if voice is None or voice.name not in voice_name_to_previous:
+                return
+            previous_lt, previous_pcs = voice_name_to_previous[voice.name]
+            if abjad.get.has_indicator(lt.head, const.HIDDEN):
+                written_pitches = []
+            elif isinstance(lt.head, abjad.Note):
+                written_pitches = [lt.head.written_pitch]
+            elif isinstance(lt.head, abjad.Chord):
+                written_pitches = lt.head.written_pitches
+            else:
+                written_pitches = []
+            pcs = pitchclasses.PitchClassSet(written_pitches)
+            if abjad.get.has_indicator(
+                lt.head, const.NOT_YET_PITCHED
+            ) or abjad.get.has_indicator(lt.head, const.ALLOW_REPEAT_PITCH):
+                pass
+            elif pcs & previous_pcs:
+                for lt_ in (previous_lt, lt):
+                    if id(lt_.head) not in violator_heads:
+                        violator_heads.add(id(lt_.head))
+                        violators.append(lt_)
+            voice_name_to_previous[voice.name] = (lt, pcs)
+
+        def color():
+            for lt in violators:
+                for leaf in lt:
+                    string = r"\baca-repeat-pitch-class-coloring"
+                    literal = abjad.LilyPondLiteral(string, format_slot="before")
+                    abjad.attach(literal, leaf, tag=tag)
+
+        visitor.voice(start_voice)
+        visitor.logical_tie(find)
+        visitor.finalize(color)
 
-    def _comment_measure_numbers(self):
+    def _comment_measure_numbers(self, visitor):
         first_measure_number = self._get_first_measure_number()
-        for leaf in abjad.iterate(self.score).leaves():
+        tag = _site(inspect.currentframe())
+
+        offset_to_measure_number = self._get_measure_index().offset_to_measure_number
+
+        def comment(leaf, voice):
             offset = abjad.get.timespan(leaf).start_offset
-            measure_number = self._offset_to_measure_number.get(offset, None)
+            measure_number = offset_to_measure_number.get(offset, None)
             if measure_number is None:
-                continue
+                return
             local_measure_number = measure_number - first_measure_number
             local_measure_number += 1
             if self.segment_name:
@@ -2736,8 +3159,11 @@ class SegmentMaker(abjad.SegmentMaker):
                 string += f" measure {measure_number} /"
                 string += f" measure {local_measure_number}]"
             literal = abjad.LilyPondLiteral(string, format_slot="absolute_before")
-            abjad.attach(literal, leaf, tag=_site(inspect.currentframe()))
+            abjad.attach(literal, leaf, tag=tag)
 
+        visitor.leaf(comment)
+
+    @_profiled("postprocessing")
     def _deactivate_tags(self, tags):
         tags = tags or []
         tags = set(tags)
@@ -2745,15 +3171,8 @@ class SegmentMaker(abjad.SegmentMaker):
         if not tags:
             return
         assert all(isinstance(_, abjad.Tag) for _ in tags), repr(tags)
-        for leaf in abjad.iterate(self.score).leaves():
-            wrappers = abjad.get.wrappers(leaf)
-            for wrapper in wrappers:
-                if wrapper.tag is None:
-                    continue
-                for tag in tags:
-                    if tag in wrapper.tag:
-                        wrapper.deactivate = True
-                        break
+        for leaf, wrapper in self._get_tag_index().get(tags):
+            wrapper.deactivate = True
 
     @staticmethod
     def _extend_beam(leaf):
@@ -2788,54 +3207,30 @@ class SegmentMaker(abjad.SegmentMaker):
                 return
             current_leaf = next_leaf
 
+    @_profiled("after_rhythm")
     def _extend_beams(self):
         for leaf in abjad.iterate(self.score).leaves():
             if abjad.get.indicator(leaf, const.RIGHT_BROKEN_BEAM):
                 self._extend_beam(leaf)
 
-    @staticmethod
-    def _find_repeat_pitch_classes(argument):
-        violators = []
-        for voice in abjad.iterate(argument).components(abjad.Voice):
-            if abjad.get.has_indicator(voice, const.INTERMITTENT):
-                continue
-            previous_lt, previous_pcs = None, []
-            for lt in abjad.iterate(voice).logical_ties():
-                if abjad.get.has_indicator(lt.head, const.HIDDEN):
-                    written_pitches = []
-                elif isinstance(lt.head, abjad.Note):
-                    written_pitches = [lt.head.written_pitch]
-                elif isinstance(lt.head, abjad.Chord):
-                    written_pitches = lt.head.written_pitches
-                else:
-                    written_pitches = []
-                pcs = pitchclasses.PitchClassSet(written_pitches)
-                if abjad.get.has_indicator(
-                    lt.head, const.NOT_YET_PITCHED
-                ) or abjad.get.has_indicator(lt.head, const.ALLOW_REPEAT_PITCH):
-                    pass
-                elif pcs & previous_pcs:
-                    if previous_lt not in violators:
-                        violators.append(previous_lt)
-                    if lt not in violators:
-                        violators.append(lt)
-                previous_lt = lt
-                previous_pcs = pcs
-        return violators
-
-    def _force_nonnatural_accidentals(self):
+    def _force_nonnatural_accidentals(self, visitor):
         if self.do_not_force_nonnatural_accidentals:
             return
         natural = abjad.Accidental("natural")
-        for plt in classes.Selection(self.score).plts():
-            if isinstance(plt[0], abjad.Note):
-                note_heads = [plt[0].note_head]
+
+        def force(plt, voice):
+            if isinstance(plt.head, abjad.Note):
+                note_heads = [plt.head.note_head]
+            elif isinstance(plt.head, abjad.Chord):
+                note_heads = plt.head.note_heads
             else:
-                note_heads = plt[0].note_heads
+                return
             for note_head in note_heads:
                 if note_head.written_pitch.accidental != natural:
                     note_head.is_forced = True
 
+        visitor.logical_tie(force)
+
     def _get_final_measure_number(self):
         return self._get_first_measure_number() + self.measure_count - 1
 
@@ -2922,15 +3317,25 @@ class SegmentMaker(abjad.SegmentMaker):
         if measure_number is not None:
             return abjad.Tag(f"MEASURE_{measure_number}")
 
+    def _get_measure_index(self):
+        if self._measure_index is None:
+            skips = classes.Selection(self.score["Global_Skips"]).skips()
+            timespans = [abjad.get.timespan(_) for _ in skips]
+            self._measure_index = segmentclasses.MeasureIndex(
+                timespans, first_measure_number=self._get_first_measure_number()
+            )
+        return self._measure_index
+
     def _get_measure_offsets(self, start_measure, stop_measure):
-        skips = classes.Selection(self.score["Global_Skips"]).skips()
-        start_skip = skips[start_measure - 1]
-        assert isinstance(start_skip, abjad.Skip), start_skip
-        start_offset = abjad.get.timespan(start_skip).start_offset
-        stop_skip = skips[stop_measure - 1]
-        assert isinstance(stop_skip, abjad.Skip), stop_skip
-        stop_offset = abjad.get.timespan(stop_skip).stop_offset
-        return start_offset, stop_offset
+        measure_index = self._get_measure_index()
+        first_measure_number = measure_index.first_measure_number
+        start_timespan = measure_index.get_timespan(
+            first_measure_number + start_measure - 1
+        )
+        stop_timespan = measure_index.get_timespan(
+            first_measure_number + stop_measure - 1
+        )
+        return start_timespan.start_offset, stop_timespan.stop_offset
 
     def _get_measure_time_signatures(self, start_measure=None, stop_measure=None):
         assert stop_measure is not None
@@ -2952,15 +3357,28 @@ class SegmentMaker(abjad.SegmentMaker):
         return abjad.Timespan(start_offset, stop_offset)
 
     def _get_measure_timespans(self, measure_numbers):
-        timespans = []
-        first_measure_number = self._get_first_measure_number()
-        measure_indices = [_ - first_measure_number - 1 for _ in measure_numbers]
-        skips = classes.Selection(self.score["Global_Skips"]).skips()
-        for i, skip in enumerate(skips):
-            if i in measure_indices:
-                timespan = abjad.get.timespan(skip)
-                timespans.append(timespan)
-        return timespans
+        measure_index = self._get_measure_index()
+        return [measure_index.get_timespan(_) for _ in sorted(set(measure_numbers))]
+
+    def _get_minimum_durations_by_measure(self):
+        if self._minimum_durations_by_measure is not None:
+            return self._minimum_durations_by_measure
+        measure_index = self._get_measure_index()
+        if self.environment == "layout" and self._can_make_layout():
+            strings = self.metadata["minimum_durations_by_measure"]
+            durations = [abjad.Duration(_) for _ in strings]
+        else:
+            if not measure_index.has_leaves():
+                self._cache_leaves()
+            start = measure_index.first_measure_number
+            stop = start + measure_index.measure_count - 1
+            leaves = []
+            for context_name in measure_index.context_names:
+                leaves_ = measure_index.get_leaves(context_name, start, stop)
+                leaves.extend(_ for _ in leaves_ if not abjad.get.grace(_))
+            durations = measure_index.get_minimum_durations(leaves)
+        self._minimum_durations_by_measure = durations
+        return durations
 
     def _get_persistent_indicator(self, context, prototype):
         assert isinstance(context, abjad.Context), repr(context)
@@ -3032,10 +3450,19 @@ class SegmentMaker(abjad.SegmentMaker):
         tag = getattr(ide.tags, name)
         return tag
 
+    def _get_tag_index(self):
+        if self._tag_index is None:
+            leaves = abjad.iterate(self.score).leaves()
+            self._tag_index = _TagIndex(leaves)
+        return self._tag_index
+
     def _handle_mutator(self, command):
         if hasattr(command, "_mutates_score") and command._mutates_score():
-            self._cache = None
             self._update_score_one_time()
+            self._recache_leaves(command.scope)
+            self._selection_index.clear()
+        elif hasattr(command, "_changes_selections") and command._changes_selections():
+            self._selection_index.clear()
 
     def _import_manifests(self):
         if not self.segment_directory:
@@ -3168,6 +3595,7 @@ class SegmentMaker(abjad.SegmentMaker):
             raise Exception(prototype)
         return indicator
 
+    @_profiled("clock_time")
     def _label_clock_time(self):
         if self.environment == "docs":
             return
@@ -3222,53 +3650,59 @@ class SegmentMaker(abjad.SegmentMaker):
                 start_text_span = abjad.StartTextSpan(
                     command=r"\bacaStartTextSpanCT", left_text=string
                 )
-                abjad.attach(
+                wrapper = abjad.attach(
                     start_text_span,
                     skip,
                     context="GlobalSkips",
                     deactivate=True,
                     tag=tag.append(_site(inspect.currentframe())),
+                    wrapper=True,
                 )
+                if self._tag_index is not None:
+                    self._tag_index.add(skip, wrapper)
             if 0 < measure_index:
                 tag = ide.tags.CLOCK_TIME
                 stop_text_span = abjad.StopTextSpan(command=r"\bacaStopTextSpanCT")
-                abjad.attach(
+                wrapper = abjad.attach(
                     stop_text_span,
                     skip,
                     context="GlobalSkips",
                     deactivate=True,
                     tag=tag.append(_site(inspect.currentframe())),
+                    wrapper=True,
                 )
+                if self._tag_index is not None:
+                    self._tag_index.add(skip, wrapper)
 
-    def _label_duration_multipliers(self):
+    def _label_duration_multipliers(self, visitor):
         tag = _site(inspect.currentframe())
         tag = tag.append(ide.tags.DURATION_MULTIPLIER)
-        already_labeled = set()
-        for voice in abjad.iterate(self.score).components(abjad.Voice):
-            for leaf in abjad.iterate(voice).leaves():
-                if isinstance(leaf, abjad.Skip):
-                    continue
-                if leaf.multiplier is None:
-                    continue
-                if leaf in already_labeled:
-                    continue
-                n, d = leaf.multiplier.pair
-                string = r"\baca-duration-multiplier-markup"
-                string += f' #"{n}" #"{d}"'
-                markup = abjad.Markup(string, direction=abjad.Up, literal=True)
-                tag_ = tag
-                if abjad.get.has_indicator(leaf, const.HIDDEN):
-                    tag_ = tag_.append(ide.tags.HIDDEN)
-                if abjad.get.has_indicator(leaf, const.MULTIMEASURE_REST):
-                    tag_ = tag_.append(ide.tags.MULTIMEASURE_REST)
-                if abjad.get.has_indicator(leaf, const.NOTE):
-                    tag_ = tag_.append(ide.tags.NOTE)
-                if abjad.get.has_indicator(leaf, const.PHANTOM):
-                    tag_ = tag_.append(ide.tags.PHANTOM)
-                if abjad.get.has_indicator(leaf, const.REST_VOICE):
-                    tag_ = tag_.append(ide.tags.REST_VOICE)
-                abjad.attach(markup, leaf, deactivate=True, tag=tag_)
-                already_labeled.add(leaf)
+
+        def label(leaf, voice):
+            if voice is None:
+                return
+            if isinstance(leaf, abjad.Skip):
+                return
+            if leaf.multiplier is None:
+                return
+            n, d = leaf.multiplier.pair
+            string = r"\baca-duration-multiplier-markup"
+            string += f' #"{n}" #"{d}"'
+            markup = abjad.Markup(string, direction=abjad.Up, literal=True)
+            tag_ = tag
+            if abjad.get.has_indicator(leaf, const.HIDDEN):
+                tag_ = tag_.append(ide.tags.HIDDEN)
+            if abjad.get.has_indicator(leaf, const.MULTIMEASURE_REST):
+                tag_ = tag_.append(ide.tags.MULTIMEASURE_REST)
+            if abjad.get.has_indicator(leaf, const.NOTE):
+                tag_ = tag_.append(ide.tags.NOTE)
+            if abjad.get.has_indicator(leaf, const.PHANTOM):
+                tag_ = tag_.append(ide.tags.PHANTOM)
+            if abjad.get.has_indicator(leaf, const.REST_VOICE):
+                tag_ = tag_.append(ide.tags.REST_VOICE)
+            abjad.attach(markup, leaf, deactivate=True, tag=tag_)
+
+        visitor.leaf(label)
 
     def _label_measure_numbers(self):
         skips = classes.Selection(self.score["Global_Skips"]).skips()
@@ -3383,6 +3817,7 @@ class SegmentMaker(abjad.SegmentMaker):
             tag=tag,
         )
 
+    @_profiled("postprocessing")
     def _magnify_staves_(self):
         if self.magnify_staves is None:
             return
@@ -3455,6 +3890,55 @@ class SegmentMaker(abjad.SegmentMaker):
             tag=tag.append(_site(inspect.currentframe(), 4)),
         )
 
+    def _make_layout(self, activate=None, deactivate=None, remove=None):
+        self._attach_fermatas()
+        self._populate_offset_to_measure_number()
+        command_count = self._call_commands(
+            voice_names=("Global_Rests", "Global_Skips")
+        )
+        self._apply_spacing()
+        self._remove_redundant_time_signatures()
+        self._cache_fermata_measure_numbers()
+        visitor = _LeafVisitor(profile=self._profile)
+        self._comment_measure_numbers(visitor)
+        visitor(self.score)
+        self._apply_breaks()
+        self._style_fermata_measures()
+        self._shift_measure_initial_clefs()
+        self._tag_index = None
+        self._deactivate_tags(deactivate)
+        self._remove_tags(remove)
+        self._add_container_identifiers()
+        self._activate_tags(activate)
+        first_measure_number = self._get_first_measure_number()
+        skips = classes.Selection(self.score["Global_Skips"]).skips()
+        self._segment_bol_measure_numbers.clear()
+        for measure_index, skip in enumerate(skips):
+            for literal in abjad.get.indicators(skip, abjad.LilyPondLiteral):
+                if literal.argument in (r"\break", r"\pageBreak"):
+                    measure_number = first_measure_number + measure_index
+                    self._segment_bol_measure_numbers.append(measure_number)
+                    break
+        if self._segment_bol_measure_numbers:
+            value = list(self._segment_bol_measure_numbers)
+            self.metadata["bol_measure_numbers"] = value
+        if self._fermata_measure_numbers:
+            self.metadata["fermata_measure_numbers"] = self._fermata_measure_numbers
+        self.metadata["first_measure_number"] = first_measure_number
+        self.metadata["final_measure_number"] = self._get_final_measure_number()
+        if self._final_measure_is_fermata is True:
+            self.metadata["final_measure_is_fermata"] = True
+        if self._minimum_durations_by_measure:
+            strings = [str(_) for _ in self._minimum_durations_by_measure]
+            self.metadata["minimum_durations_by_measure"] = strings
+        if self.segment_name is not None:
+            self.metadata["segment_name"] = self.segment_name
+        self.metadata["segment_number"] = self._get_segment_number()
+        self.metadata["time_signatures"] = self._cached_time_signatures
+        self.metadata.sort(recurse=True)
+        self._style_phantom_measures()
+        return command_count
+
     def _make_lilypond_file(self):
         tag = _site(inspect.currentframe())
         items = []
@@ -3635,6 +4119,18 @@ class SegmentMaker(abjad.SegmentMaker):
                 raise Exception(abjad.storage(momento))
         return indicator
 
+    def _measure_command(self, phase, command):
+        if self._profile is None:
+            return contextlib.nullcontext()
+        scopes = [command.scope]
+        if isinstance(command.scope, scoping.TimelineScope):
+            scopes = list(command.scope.scopes)
+        scope = ", ".join(f"{_.voice_name} {_.measures}" for _ in scopes)
+        return self._profile.measure(
+            phase, type(command).__name__, site=str(command.tag), scope=scope
+        )
+
+    @_profiled("postprocessing")
     def _move_global_rests(self):
         topmost = "_global_rests_in_topmost_staff"
         every = "_global_rests_in_every_staff"
@@ -3664,20 +4160,25 @@ class SegmentMaker(abjad.SegmentMaker):
                 staff.insert(0, global_rests_)
                 topmost_staff = False
 
+    @_profiled("after_rhythm")
     def _populate_offset_to_measure_number(self):
-        measure_number = self._get_first_measure_number()
-        for skip in classes.Selection(self.score["Global_Skips"]).skips():
-            offset = abjad.get.timespan(skip).start_offset
-            self._offset_to_measure_number[offset] = measure_number
-            measure_number += 1
+        measure_index = self._get_measure_index()
+        self._offset_to_measure_number.update(measure_index.offset_to_measure_number)
 
     def _print_cache(self):
-        for context in self._cache:
+        measure_index = self._get_measure_index()
+        first_measure_number = measure_index.first_measure_number
+        final_measure_number = self._get_final_measure_number()
+        for context in measure_index.context_names:
             print(f"CONTEXT {context} ...")
-            leaves_by_measure_number = self._cache[context]
-            for measure_number in leaves_by_measure_number:
+            for measure_number in range(first_measure_number, final_measure_number + 1):
+                leaves = measure_index.get_leaves(
+                    context, measure_number, measure_number
+                )
+                if not leaves:
+                    continue
                 print(f"MEASURE {measure_number} ...")
-                for leaf in leaves_by_measure_number[measure_number]:
+                for leaf in leaves:
                     print(leaf)
 
     @staticmethod
@@ -3687,9 +4188,10 @@ class SegmentMaker(abjad.SegmentMaker):
             parts.append(class_.__name__)
         return f"{parts[0]}.{parts[-1]}"
 
-    def _reanalyze_reapplied_synthetic_wrappers(self):
+    def _reanalyze_reapplied_synthetic_wrappers(self, visitor):
         site = _site(inspect.currentframe())
-        for leaf in abjad.iterate(self.score).leaves():
+
+        def reanalyze(leaf, voice):
             for wrapper in abjad.get.wrappers(leaf):
                 if wrapper.synthetic_offset is None:
                     continue
@@ -3702,14 +4204,19 @@ class SegmentMaker(abjad.SegmentMaker):
                     wrapper._tag = tag_
                     wrapper._synthetic_offset = None
 
-    def _reanalyze_trending_dynamics(self):
-        for leaf in abjad.iterate(self.score).leaves():
+        visitor.leaf(reanalyze)
+
+    def _reanalyze_trending_dynamics(self, visitor):
+        def reanalyze(leaf, voice):
             for wrapper in abjad.get.wrappers(leaf):
                 if isinstance(
                     wrapper.indicator, abjad.Dynamic
                 ) and abjad.get.indicators(leaf, abjad.StartHairpin):
                     self._treat_persistent_wrapper(self.manifests, wrapper, "explicit")
 
+        visitor.leaf(reanalyze)
+
+    @_profiled("after_rhythm")
     def _reapply_persistent_indicators(self):
         if self.first_segment:
             return
@@ -3793,6 +4300,39 @@ class SegmentMaker(abjad.SegmentMaker):
                 if attached:
                     self._treat_persistent_wrapper(self.manifests, wrapper, status)
 
+    def _recache_leaves(self, scope):
+        measure_index = self._get_measure_index()
+        if not measure_index.has_leaves():
+            return
+        if isinstance(scope, scoping.Scope):
+            scopes = [scope]
+        else:
+            assert isinstance(scope, scoping.TimelineScope)
+            scopes = list(scope.scopes)
+        for scope in scopes:
+            voice_name = scope.voice_name
+            start, stop = self._scope_to_measure_numbers(scope)
+            # phantom measure nests hidden voice with same name in voice;
+            # iteration visits outer context first
+            for voice in abjad.iterate(self.score).components(abjad.Context):
+                if voice.name == voice_name:
+                    break
+            else:
+                raise Exception(f"unknown voice {voice_name!r}.")
+            for context in abjad.iterate(voice).components(abjad.Context):
+                if context.name is not None:
+                    measure_index.clear_leaves(context.name, start, stop)
+            for leaf in abjad.iterate(voice).leaves():
+                start_offset = abjad.get.timespan(leaf).start_offset
+                measure_number = measure_index.get_measure_number(start_offset)
+                if measure_number is None:
+                    continue
+                if not start <= measure_number <= stop:
+                    continue
+                context = abjad.get.parentage(leaf).get(abjad.Context)
+                measure_index.cache_leaf(context.name, measure_number, leaf)
+
+    @_profiled("postprocessing")
     def _remove_redundant_time_signatures(self):
         previous_time_signature = None
         self._cached_time_signatures = []
@@ -3807,27 +4347,25 @@ class SegmentMaker(abjad.SegmentMaker):
             else:
                 previous_time_signature = time_signature
 
+    @_profiled("postprocessing")
     def _remove_tags(self, tags):
         tags = tags or []
         tags = list(tags)
         if self.environment == "docs":
             tags += ide.tags.documentation_removal_tags()
         assert all(isinstance(_, abjad.Tag) for _ in tags), repr(tags)
-        for leaf in abjad.iterate(self.score).leaves():
-            for wrapper in abjad.get.wrappers(leaf):
-                if wrapper.tag is None:
-                    continue
-                for word in wrapper.tag:
-                    if abjad.Tag(word) in tags:
-                        abjad.detach(wrapper, leaf)
-                        break
+        for leaf, wrapper in self._get_tag_index().get(tags):
+            abjad.detach(wrapper, leaf)
 
     def _scope_to_leaf_selection(self, command):
-        leaves = []
         selections = self._scope_to_leaf_selections(command.scope)
-        for selection in selections:
-            leaves.extend(selection)
-        selection = abjad.select(leaves)
+        if isinstance(command.scope, scoping.TimelineScope):
+            selection = command.scope._merge_by_timeline(selections)
+        else:
+            leaves = []
+            for selection in selections:
+                leaves.extend(selection)
+            selection = abjad.select(leaves)
         if not selection:
             message = f"EMPTY SELECTION:\n\n{abjad.storage(command)}"
             if self.allow_empty_selections:
@@ -3835,41 +4373,45 @@ class SegmentMaker(abjad.SegmentMaker):
             else:
                 raise Exception(message)
         assert selection.are_leaves(), repr(selection)
-        if isinstance(command.scope, scoping.TimelineScope):
-            selection = command.scope._sort_by_timeline(selection)
         return selection
 
     def _scope_to_leaf_selections(self, scope):
-        if self._cache is None:
+        measure_index = self._get_measure_index()
+        if not measure_index.has_leaves():
             self._cache_leaves()
         if isinstance(scope, scoping.Scope):
             scopes = [scope]
         else:
             assert isinstance(scope, scoping.TimelineScope)
             scopes = list(scope.scopes)
+        # leaf cache also holds phantom measure
+        final_measure_number = self._get_final_measure_number()
         leaf_selections = []
         for scope in scopes:
-            leaves = []
+            start, stop = self._scope_to_measure_numbers(scope)
+            stop = min(stop, final_measure_number)
             try:
-                leaves_by_measure_number = self._cache[scope.voice_name]
+                leaves = measure_index.get_leaves(scope.voice_name, start, stop)
             except KeyError:
                 print(f"Unknown voice {scope.voice_name} ...\n")
                 raise
-            start = scope.measures[0]
-            if scope.measures[1] == -1:
-                stop = self.measure_count + 1
-            else:
-                stop = scope.measures[1] + 1
-            if start < 0:
-                start = self.measure_count - abs(start) + 1
-            if stop < 0:
-                stop = self.measure_count - abs(stop) + 1
-            for measure_number in range(start, stop):
-                leaves_ = leaves_by_measure_number.get(measure_number, [])
-                leaves.extend(leaves_)
             leaf_selections.append(abjad.select(leaves))
         return leaf_selections
 
+    def _scope_to_measure_numbers(self, scope):
+        start = scope.measures[0]
+        if scope.measures[1] == -1:
+            stop = self.measure_count + 1
+        else:
+            stop = scope.measures[1] + 1
+        if start < 0:
+            start = self.measure_count - abs(start) + 1
+        if stop < 0:
+            stop = self.measure_count - abs(stop) + 1
+        first_measure_number = self._get_first_measure_number()
+        return first_measure_number + start - 1, first_measure_number + stop - 2
+
+    @_profiled("postprocessing")
     def _set_not_yet_pitched_to_staff_position_zero(self):
         indicator = const.NOT_YET_PITCHED
         pleaves = []
@@ -3895,6 +4437,7 @@ class SegmentMaker(abjad.SegmentMaker):
         tag = tag.append(status_tag)
         wrapper.tag = tag
 
+    @_profiled("postprocessing")
     def _shift_measure_initial_clefs(self):
         if self.environment == "docs":
             return
@@ -3916,11 +4459,13 @@ class SegmentMaker(abjad.SegmentMaker):
                 runtime = self._bundle_manifests()
                 suite(leaf, runtime=runtime)
 
+    @_profiled("postprocessing")
     def _style_fermata_measures(self):
         if not self.fermata_measure_empty_overrides:
             return
         if not self._fermata_start_offsets:
             return
+        self._effective_indicator_cache.clear()
         bar_lines_already_styled = []
         empty_fermata_measure_start_offsets = []
         for measure_number in self.fermata_measure_empty_overrides or []:
@@ -4057,6 +4602,7 @@ class SegmentMaker(abjad.SegmentMaker):
             grob = abjad.override(rest).multi_measure_rest_text
             grob.extra_offset = (0, 2.5)
 
+    @_profiled("clock_time")
     def _style_phantom_measures(self):
         if self.remove_phantom_measure:
             return
@@ -4139,6 +4685,7 @@ class SegmentMaker(abjad.SegmentMaker):
                     tag=_site(inspect.currentframe(), 8).append(ide.tags.PHANTOM),
                 )
 
+    @_profiled("postprocessing")
     def _transpose_score_(self):
         if not self.transpose_score:
             return
@@ -4244,6 +4791,7 @@ class SegmentMaker(abjad.SegmentMaker):
             )
             SegmentMaker._set_status_tag(wrapper_, status, redraw=True, stem=stem)
 
+    @_profiled("postprocessing")
     def _treat_untreated_persistent_wrappers(self):
         if self.environment == "layout":
             return
@@ -4410,19 +4958,24 @@ class SegmentMaker(abjad.SegmentMaker):
                 commands.append(command)
         return commands
 
-    def _whitespace_leaves(self):
-        for leaf in abjad.iterate(self.score).leaves():
+    def _whitespace_leaves(self, visitor):
+        def whitespace_leaf(leaf, voice):
             literal = abjad.LilyPondLiteral("", format_slot="absolute_before")
             abjad.attach(literal, leaf, tag=None)
-        for container in abjad.iterate(self.score).components(abjad.Container):
-            if hasattr(container, "_main_leaf"):
-                literal = abjad.LilyPondLiteral("", format_slot="absolute_after")
-                abjad.attach(literal, container, tag=None)
-            else:
-                literal = abjad.LilyPondLiteral("", format_slot="absolute_before")
+
+        def whitespace_containers():
+            for container in abjad.iterate(self.score).components(abjad.Container):
+                if hasattr(container, "_main_leaf"):
+                    literal = abjad.LilyPondLiteral("", format_slot="absolute_after")
+                    abjad.attach(literal, container, tag=None)
+                else:
+                    literal = abjad.LilyPondLiteral("", format_slot="absolute_before")
+                    abjad.attach(literal, container, tag=None)
+                literal = abjad.LilyPondLiteral("", format_slot="closing")
                 abjad.attach(literal, container, tag=None)
-            literal = abjad.LilyPondLiteral("", format_slot="closing")
-            abjad.attach(literal, container, tag=None)
+
+        visitor.leaf(whitespace_leaf)
+        visitor.finalize(whitespace_containers)
 
     ### PUBLIC PROPERTIES ###
 
@@ -5227,6 +5780,13 @@ class SegmentMaker(abjad.SegmentMaker):
         """
         return self._previous_persist
 
+    @property
+    def profile(self) -> typing.Optional[segmentclasses.SegmentProfile]:
+        """
+        Gets profile recorded by ``run(profile=True)``.
+        """
+        return self._profile
+
     @property
     def remove_phantom_measure(self) -> typing.Optional[bool]:
         """
@@ -5911,6 +6471,7 @@ class SegmentMaker(abjad.SegmentMaker):
         persist: abjad.OrderedDict = None,
         previous_metadata: abjad.OrderedDict = None,
         previous_persist: abjad.OrderedDict = None,
+        profile: bool = None,
         remove: typing.List[abjad.Tag] = None,
         segment_directory: ide.Path = None,
     ) -> abjad.LilyPondFile:
@@ -5923,7 +6484,13 @@ class SegmentMaker(abjad.SegmentMaker):
             none to render segments in real score.
             Set to ``"docs"`` for API examples.
             Set to ``"external"`` to debug API examples in a separate file.
-            Set to ``"layout"`` when making layout.ly file.
+            Set to ``"layout"`` when making layout.ly file. When
+            ``metadata`` holds minimum durations by measure of full run,
+            layout environment builds global skips and global rests only
+            and skips rhythm commands, music commands and postprocessing;
+            metadata then holds only measure profile, breaks, spacing,
+            segment name and segment number, and persist stays empty.
+            Otherwise layout environment runs segment-maker in full.
 
         :param metadata: metadata found in current segment directory.
 
@@ -5931,6 +6498,11 @@ class SegmentMaker(abjad.SegmentMaker):
 
         :param previous_metadata: metadata found in previous segment directory.
 
+        :param profile: set to true to record wall time, call count and
+            allocation delta of each command and postprocessing method in
+            ``self.profile``; profile also writes to ``__profile__.json`` in
+            segment directory when segment directory is set.
+
         :param remove: tags to remove in LilyPond file output.
 
         :param segment_directory: path providing access to current segment
@@ -5944,112 +6516,148 @@ class SegmentMaker(abjad.SegmentMaker):
         self._previous_metadata = abjad.OrderedDict(previous_metadata)
         self._previous_persist = abjad.OrderedDict(previous_persist)
         self._segment_directory = segment_directory
-        self._import_manifests()
-        with abjad.Timer() as timer:
-            self._make_score()
-            self._make_lilypond_file()
-            self._make_global_skips()
-            self._label_measure_numbers()
-            self._label_stage_numbers()
-        count = int(timer.elapsed_time)
-        seconds = abjad.String("second").pluralize(count)
-        if not do_not_print_timing and self.environment != "docs":
-            print(f"  Score initialization {count} {seconds} ...")
-        with abjad.Timer() as timer:
-            with abjad.ForbidUpdate(component=self.score, update_on_exit=True):
-                command_count = self._call_rhythm_commands()
-                self._clean_up_rhythm_maker_voice_names()
-        count = int(timer.elapsed_time)
-        seconds = abjad.String("second").pluralize(count)
-        commands = abjad.String("command").pluralize(command_count)
-        if not do_not_print_timing and self.environment != "docs":
-            message = f"  Rhythm commands {count} {seconds}"
-            message += f" [for {command_count} {commands}] ..."
-            print(message)
-        with abjad.Timer() as timer:
-            self._populate_offset_to_measure_number()
-            self._extend_beams()
-            self._attach_sounds_during()
-            self._attach_first_segment_score_template_defaults()
-            self._reapply_persistent_indicators()
-            self._attach_first_appearance_score_template_defaults()
-            self._apply_spacing()
-        count = int(timer.elapsed_time)
-        seconds = abjad.String("second").pluralize(count)
-        if not do_not_print_timing and self.environment != "docs":
-            print(f"  After-rhythm methods {count} {seconds} ...")
-        with abjad.Timer() as timer:
-            with abjad.ForbidUpdate(component=self.score, update_on_exit=True):
-                command_count = self._call_commands()
-        count = int(timer.elapsed_time)
-        seconds = abjad.String("second").pluralize(count)
-        commands = abjad.String("command").pluralize(command_count)
-        if not do_not_print_timing and self.environment != "docs":
-            message = f"  Nonrhythm commands {count} {seconds}"
-            message += f" [for {command_count} {commands}] ..."
-            print(message)
-        # TODO: optimize by consolidating score iteration:
-        with abjad.Timer() as timer:
-            with abjad.ForbidUpdate(component=self.score, update_on_exit=True):
-                self._clone_segment_initial_short_instrument_name()
-                self._remove_redundant_time_signatures()
-                self._cache_fermata_measure_numbers()
-                self._treat_untreated_persistent_wrappers()
-                self._attach_metronome_marks()
-                self._reanalyze_trending_dynamics()
-                self._reanalyze_reapplied_synthetic_wrappers()
-                self._transpose_score_()
-                self._color_not_yet_registered()
-                self._color_mock_pitch()
-                self._color_not_yet_pitched()
-                self._set_not_yet_pitched_to_staff_position_zero()
-                self._clean_up_repeat_tie_direction()
-                self._clean_up_laissez_vibrer_tie_direction()
-                self._check_all_are_pitched_()
-                self._check_doubled_dynamics()
-                self._color_out_of_range()
-                self._check_persistent_indicators()
-                self._color_repeat_pitch_classes_()
-                self._color_octaves_()
-                self._attach_shadow_tie_indicators()
-                self._force_nonnatural_accidentals()
-                self._label_duration_multipliers()
-                self._magnify_staves_()
-                self._whitespace_leaves()
-                self._comment_measure_numbers()
-                self._apply_breaks()
-                self._style_fermata_measures()
-                self._shift_measure_initial_clefs()
-                self._deactivate_tags(deactivate)
-                self._remove_tags(remove)
-                self._add_container_identifiers()
-                self._check_all_music_in_part_containers()
-                self._check_duplicate_part_assignments()
-                self._move_global_rests()
-            # mutates offsets:
-            self._clean_up_on_beat_grace_containers()
-            self._check_wellformedness()
-        count = int(timer.elapsed_time)
-        seconds = abjad.String("second").pluralize(count)
-        if self.environment == "layout" or (
-            not do_not_print_timing and self.environment != "docs"
-        ):
-            print(f"  Postprocessing {count} {seconds} ...")
-        with abjad.Timer() as timer:
-            method = getattr(self.score, "_update_now")
-            method(offsets_in_seconds=True)
-        count = int(timer.elapsed_time)
-        seconds = abjad.String("second").pluralize(count)
-        if not do_not_print_timing and self.environment != "docs":
-            print(f"  Offsets-in-seconds update {count} {seconds} ...")
-        with abjad.Timer() as timer:
-            self._label_clock_time()
-            self._activate_tags(activate)
-            self._collect_metadata()
-            self._style_phantom_measures()
-        count = int(timer.elapsed_time)
-        seconds = abjad.String("second").pluralize(count)
-        if not do_not_print_timing and self.environment != "docs":
-            print(f"  Clocktime markup {count} {seconds} ...")
-        assert isinstance(self.lilypond_file, abjad.LilyPondFile)
-        return self.lilypond_file
+        self._profile = None
+        started_tracemalloc = False
+        if profile:
+            self._profile = segmentclasses.SegmentProfile()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracemalloc = True
+        try:
+            self._import_manifests()
+            with abjad.Timer() as timer:
+                self._make_score()
+                self._make_lilypond_file()
+                self._make_global_skips()
+                self._label_measure_numbers()
+                self._label_stage_numbers()
+            count = int(timer.elapsed_time)
+            seconds = abjad.String("second").pluralize(count)
+            if not do_not_print_timing and self.environment != "docs":
+                print(f"  Score initialization {count} {seconds} ...")
+            if self.environment == "layout" and self._can_make_layout():
+                with abjad.Timer() as timer:
+                    command_count = self._make_layout(
+                        activate=activate, deactivate=deactivate, remove=remove
+                    )
+                count = int(timer.elapsed_time)
+                seconds = abjad.String("second").pluralize(count)
+                commands = abjad.String("command").pluralize(command_count)
+                if not do_not_print_timing:
+                    message = f"  Layout {count} {seconds}"
+                    message += f" [for {command_count} {commands}] ..."
+                    print(message)
+                if self._profile is not None and self.segment_directory is not None:
+                    self._profile.write(self.segment_directory / "__profile__.json")
+                assert isinstance(self.lilypond_file, abjad.LilyPondFile)
+                return self.lilypond_file
+            with abjad.Timer() as timer:
+                with abjad.ForbidUpdate(component=self.score, update_on_exit=True):
+                    command_count = self._call_rhythm_commands()
+                    self._clean_up_rhythm_maker_voice_names()
+            count = int(timer.elapsed_time)
+            seconds = abjad.String("second").pluralize(count)
+            commands = abjad.String("command").pluralize(command_count)
+            if not do_not_print_timing and self.environment != "docs":
+                message = f"  Rhythm commands {count} {seconds}"
+                message += f" [for {command_count} {commands}] ..."
+                print(message)
+            with abjad.Timer() as timer:
+                self._populate_offset_to_measure_number()
+                self._extend_beams()
+                self._attach_sounds_during()
+                self._attach_first_segment_score_template_defaults()
+                self._reapply_persistent_indicators()
+                self._attach_first_appearance_score_template_defaults()
+                self._apply_spacing()
+            count = int(timer.elapsed_time)
+            seconds = abjad.String("second").pluralize(count)
+            if not do_not_print_timing and self.environment != "docs":
+                print(f"  After-rhythm methods {count} {seconds} ...")
+            with abjad.Timer() as timer:
+                with abjad.ForbidUpdate(component=self.score, update_on_exit=True):
+                    command_count = self._call_commands()
+                self._effective_indicator_cache.clear()
+            count = int(timer.elapsed_time)
+            seconds = abjad.String("second").pluralize(count)
+            commands = abjad.String("command").pluralize(command_count)
+            if not do_not_print_timing and self.environment != "docs":
+                message = f"  Nonrhythm commands {count} {seconds}"
+                message += f" [for {command_count} {commands}] ..."
+                print(message)
+            with abjad.Timer() as timer:
+                with abjad.ForbidUpdate(component=self.score, update_on_exit=True):
+                    self._clone_segment_initial_short_instrument_name()
+                    self._remove_redundant_time_signatures()
+                    self._cache_fermata_measure_numbers()
+                    self._treat_untreated_persistent_wrappers()
+                    self._attach_metronome_marks()
+                    visitor = _LeafVisitor(profile=self._profile)
+                    self._reanalyze_trending_dynamics(visitor)
+                    self._reanalyze_reapplied_synthetic_wrappers(visitor)
+                    visitor(self.score)
+                    self._transpose_score_()
+                    visitor = _LeafVisitor(profile=self._profile)
+                    self._color_not_yet_registered(visitor)
+                    self._color_mock_pitch(visitor)
+                    self._color_not_yet_pitched(visitor)
+                    visitor(self.score)
+                    self._set_not_yet_pitched_to_staff_position_zero()
+                    visitor = _LeafVisitor(profile=self._profile)
+                    self._clean_up_repeat_tie_direction(visitor)
+                    self._clean_up_laissez_vibrer_tie_direction(visitor)
+                    self._check_all_are_pitched_(visitor)
+                    self._check_doubled_dynamics(visitor)
+                    self._color_out_of_range(visitor)
+                    self._check_persistent_indicators(visitor)
+                    self._color_repeat_pitch_classes_(visitor)
+                    visitor(self.score)
+                    self._color_octaves_()
+                    self._magnify_staves_()
+                    visitor = _LeafVisitor(profile=self._profile)
+                    self._attach_shadow_tie_indicators(visitor)
+                    self._force_nonnatural_accidentals(visitor)
+                    self._label_duration_multipliers(visitor)
+                    self._whitespace_leaves(visitor)
+                    self._comment_measure_numbers(visitor)
+                    visitor(self.score)
+                    self._apply_breaks()
+                    self._style_fermata_measures()
+                    self._shift_measure_initial_clefs()
+                    self._tag_index = None
+                    self._deactivate_tags(deactivate)
+                    self._remove_tags(remove)
+                    self._add_container_identifiers()
+                    self._check_all_music_in_part_containers()
+                    self._check_duplicate_part_assignments()
+                    self._move_global_rests()
+                # mutates offsets:
+                self._clean_up_on_beat_grace_containers()
+                self._check_wellformedness()
+            count = int(timer.elapsed_time)
+            seconds = abjad.String("second").pluralize(count)
+            if not do_not_print_timing and self.environment != "docs":
+                print(f"  Postprocessing {count} {seconds} ...")
+            with abjad.Timer() as timer:
+                method = getattr(self.score, "_update_now")
+                method(offsets_in_seconds=True)
+            count = int(timer.elapsed_time)
+            seconds = abjad.String("second").pluralize(count)
+            if not do_not_print_timing and self.environment != "docs":
+                print(f"  Offsets-in-seconds update {count} {seconds} ...")
+            with abjad.Timer() as timer:
+                self._label_clock_time()
+                self._activate_tags(activate)
+                self._collect_metadata()
+                self._style_phantom_measures()
+            count = int(timer.elapsed_time)
+            seconds = abjad.String("second").pluralize(count)
+            if not do_not_print_timing and self.environment != "docs":
+                print(f"  Clocktime markup {count} {seconds} ...")
+            if self._profile is not None and self.segment_directory is not None:
+                self._profile.write(self.segment_directory / "__profile__.json")
+            assert isinstance(self.lilypond_file, abjad.LilyPondFile)
+            return self.lilypond_file
+        finally:
+            if started_tracemalloc:
+                tracemalloc.stop()
@@ -1,386 +0,0 @@
-[
-    [0, 1, 3, 8, 2, 5, 9, 7, 4, 11, 10, 6],
-    [0, 1, 4, 8, 7, 2, 10, 3, 5, 11, 9, 6],
-    [0, 1, 4, 8, 7, 2, 11, 9, 3, 5, 10, 6],
-    [0, 1, 4, 10, 5, 3, 11, 8, 7, 9, 2, 6],
-    [0, 1, 4, 11, 10, 3, 7, 9, 5, 2, 8, 6],
-    [0, 1, 4, 11, 10, 7, 3, 5, 9, 2, 8, 6],
-    [0, 1, 5, 2, 4, 11, 7, 10, 3, 9, 8, 6],
-    [0, 1, 5, 2, 4, 11, 7, 10, 9, 3, 8, 6],
-    [0, 1, 5, 2, 8, 7, 10, 3, 11, 9, 4, 6],
-    [0, 1, 5, 2, 8, 10, 3, 11, 9, 4, 7, 6],
-    [0, 1, 5, 2, 9, 7, 3, 8, 11, 10, 4, 6],
-    [0, 1, 5, 2, 9, 11, 7, 10, 4, 3, 8, 6],
-    [0, 1, 5, 2, 9, 11, 10, 4, 7, 3, 8, 6],
-    [0, 1, 5, 4, 7, 2, 11, 9, 3, 8, 10, 6],
-    [0, 1, 5, 4, 10, 8, 3, 11, 2, 7, 9, 6],
-    [0, 1, 5, 7, 4, 10, 3, 11, 2, 9, 8, 6],
-    [0, 1, 5, 7, 4, 11, 2, 10, 3, 9, 8, 6],
-    [0, 1, 5, 7, 4, 11, 2, 10, 9, 3, 8, 6],
-    [0, 1, 5, 7, 4, 11, 9, 8, 2, 10, 3, 6],
-    [0, 1, 5, 10, 4, 2, 9, 11, 8, 7, 3, 6],
-    [0, 1, 5, 10, 4, 2, 11, 7, 9, 8, 3, 6],
-    [0, 1, 5, 10, 4, 7, 3, 2, 9, 11, 8, 6],
-    [0, 1, 5, 10, 7, 3, 2, 8, 11, 9, 4, 6],
-    [0, 1, 5, 10, 7, 9, 4, 3, 11, 2, 8, 6],
-    [0, 1, 5, 11, 7, 4, 2, 9, 8, 10, 3, 6],
-    [0, 1, 5, 11, 8, 7, 9, 4, 2, 10, 3, 6],
-    [0, 1, 8, 2, 5, 3, 7, 4, 9, 11, 10, 6],
-    [0, 1, 8, 2, 10, 3, 5, 4, 7, 11, 9, 6],
-    [0, 1, 8, 5, 3, 9, 2, 4, 7, 11, 10, 6],
-    [0, 1, 8, 5, 3, 11, 10, 4, 7, 9, 2, 6],
-    [0, 1, 8, 5, 7, 10, 4, 3, 11, 9, 2, 6],
-    [0, 1, 8, 5, 7, 10, 9, 3, 11, 4, 2, 6],
-    [0, 1, 8, 5, 7, 11, 4, 2, 10, 9, 3, 6],
-    [0, 1, 8, 5, 7, 11, 9, 2, 10, 4, 3, 6],
-    [0, 1, 8, 10, 9, 3, 11, 4, 7, 5, 2, 6],
-    [0, 1, 8, 11, 4, 10, 9, 7, 3, 5, 2, 6],
-    [0, 1, 8, 11, 7, 5, 10, 2, 4, 3, 9, 6],
-    [0, 1, 8, 11, 10, 4, 9, 7, 3, 5, 2, 6],
-    [0, 1, 9, 2, 4, 3, 7, 10, 5, 11, 8, 6],
-    [0, 1, 9, 2, 4, 3, 10, 7, 11, 5, 8, 6],
-    [0, 1, 9, 2, 8, 10, 7, 5, 4, 11, 3, 6],
-    [0, 1, 9, 2, 8, 11, 3, 10, 7, 5, 4, 6],
-    [0, 1, 9, 2, 8, 11, 10, 5, 3, 7, 4, 6],
-    [0, 1, 9, 4, 3, 5, 10, 7, 11, 2, 8, 6],
-    [0, 1, 9, 4, 7, 11, 10, 3, 5, 2, 8, 6],
-    [0, 1, 9, 7, 4, 11, 10, 3, 5, 8, 2, 6],
-    [0, 1, 9, 7, 10, 3, 5, 4, 11, 8, 2, 6],
-    [0, 1, 9, 7, 11, 8, 3, 2, 5, 10, 4, 6],
-    [0, 1, 9, 8, 2, 5, 3, 10, 7, 11, 4, 6],
-    [0, 1, 9, 11, 4, 3, 7, 10, 5, 2, 8, 6],
-    [0, 1, 9, 11, 4, 3, 10, 7, 5, 8, 2, 6],
-    [0, 1, 10, 2, 9, 3, 8, 11, 7, 5, 4, 6],
-    [0, 1, 10, 2, 9, 7, 3, 8, 11, 5, 4, 6],
-    [0, 1, 10, 3, 5, 9, 4, 2, 8, 11, 7, 6],
-    [0, 1, 10, 3, 7, 2, 8, 11, 9, 5, 4, 6],
-    [0, 1, 10, 5, 3, 11, 4, 7, 9, 8, 2, 6],
-    [0, 1, 10, 5, 9, 7, 3, 2, 8, 11, 4, 6],
-    [0, 1, 10, 5, 9, 11, 4, 2, 8, 7, 3, 6],
-    [0, 1, 10, 5, 9, 11, 4, 7, 3, 2, 8, 6],
-    [0, 1, 11, 4, 3, 10, 7, 9, 5, 8, 2, 6],
-    [0, 1, 11, 5, 4, 7, 3, 8, 10, 2, 9, 6],
-    [0, 1, 11, 5, 8, 7, 3, 10, 2, 4, 9, 6],
-    [0, 1, 11, 7, 10, 3, 5, 4, 8, 2, 9, 6],
-    [0, 1, 11, 8, 3, 7, 9, 2, 5, 4, 10, 6],
-    [0, 2, 1, 4, 11, 5, 9, 10, 7, 3, 8, 6],
-    [0, 2, 1, 5, 8, 9, 7, 4, 10, 3, 11, 6],
-    [0, 2, 1, 5, 11, 4, 7, 3, 10, 8, 9, 6],
-    [0, 2, 1, 7, 10, 3, 11, 9, 4, 8, 5, 6],
-    [0, 2, 1, 7, 10, 5, 3, 11, 4, 8, 9, 6],
-    [0, 2, 1, 8, 4, 7, 5, 10, 11, 3, 9, 6],
-    [0, 2, 1, 8, 5, 11, 3, 4, 9, 7, 10, 6],
-    [0, 2, 1, 9, 3, 10, 7, 11, 4, 5, 8, 6],
-    [0, 2, 1, 9, 7, 8, 5, 10, 4, 11, 3, 6],
-    [0, 2, 1, 9, 7, 10, 4, 11, 3, 8, 5, 6],
-    [0, 2, 1, 9, 10, 3, 7, 4, 11, 5, 8, 6],
-    [0, 2, 1, 10, 4, 9, 5, 3, 7, 8, 11, 6],
-    [0, 2, 1, 10, 11, 5, 9, 4, 7, 3, 8, 6],
-    [0, 2, 1, 11, 7, 10, 3, 9, 4, 8, 5, 6],
-    [0, 2, 1, 11, 8, 3, 7, 10, 4, 9, 5, 6],
-    [0, 2, 3, 1, 9, 8, 5, 10, 4, 7, 11, 6],
-    [0, 2, 3, 1, 10, 4, 9, 5, 8, 7, 11, 6],
-    [0, 2, 3, 7, 4, 9, 5, 11, 10, 1, 8, 6],
-    [0, 2, 3, 7, 4, 11, 5, 10, 1, 9, 8, 6],
-    [0, 2, 3, 7, 10, 4, 11, 9, 8, 5, 1, 6],
-    [0, 2, 3, 7, 10, 5, 11, 4, 1, 9, 8, 6],
-    [0, 2, 3, 7, 10, 9, 5, 11, 4, 1, 8, 6],
-    [0, 2, 3, 8, 5, 9, 4, 10, 1, 11, 7, 6],
-    [0, 2, 3, 9, 4, 1, 5, 10, 8, 11, 7, 6],
-    [0, 2, 3, 9, 4, 7, 11, 10, 8, 5, 1, 6],
-    [0, 2, 3, 9, 4, 8, 5, 10, 1, 11, 7, 6],
-    [0, 2, 3, 9, 4, 8, 11, 10, 7, 5, 1, 6],
-    [0, 2, 3, 10, 4, 7, 11, 9, 8, 5, 1, 6],
-    [0, 2, 5, 3, 8, 9, 1, 7, 4, 11, 10, 6],
-    [0, 2, 5, 3, 8, 9, 1, 10, 4, 11, 7, 6],
-    [0, 2, 5, 9, 7, 8, 1, 10, 4, 3, 11, 6],
-    [0, 2, 5, 10, 11, 7, 4, 3, 9, 1, 8, 6],
-    [0, 2, 5, 11, 4, 1, 9, 10, 8, 3, 7, 6],
-    [0, 2, 5, 11, 7, 4, 3, 10, 8, 9, 1, 6],
-    [0, 2, 5, 11, 10, 7, 3, 4, 9, 1, 8, 6],
-    [0, 2, 7, 1, 10, 9, 5, 3, 4, 8, 11, 6],
-    [0, 2, 7, 1, 10, 11, 9, 5, 4, 8, 3, 6],
-    [0, 2, 7, 3, 1, 8, 11, 10, 4, 5, 9, 6],
-    [0, 2, 7, 3, 1, 10, 4, 5, 9, 8, 11, 6],
-    [0, 2, 7, 3, 9, 10, 1, 5, 4, 11, 8, 6],
-    [0, 2, 7, 3, 10, 9, 1, 4, 5, 11, 8, 6],
-    [0, 2, 7, 4, 5, 11, 3, 10, 1, 9, 8, 6],
-    [0, 2, 7, 5, 1, 10, 9, 3, 4, 8, 11, 6],
-    [0, 2, 7, 5, 8, 9, 1, 10, 4, 3, 11, 6],
-    [0, 2, 7, 8, 4, 1, 11, 10, 5, 9, 3, 6],
-    [0, 2, 7, 8, 11, 5, 9, 4, 3, 1, 10, 6],
-    [0, 2, 7, 10, 4, 3, 11, 9, 1, 8, 5, 6],
-    [0, 2, 7, 10, 5, 11, 3, 4, 1, 9, 8, 6],
-    [0, 2, 7, 11, 5, 4, 1, 9, 10, 8, 3, 6],
-    [0, 2, 7, 11, 8, 3, 1, 4, 10, 9, 5, 6],
-    [0, 2, 8, 1, 4, 3, 10, 7, 11, 9, 5, 6],
-    [0, 2, 8, 1, 4, 3, 10, 11, 7, 5, 9, 6],
-    [0, 2, 8, 1, 5, 3, 4, 11, 7, 10, 9, 6],
-    [0, 2, 8, 1, 5, 4, 7, 3, 10, 11, 9, 6],
-    [0, 2, 8, 1, 5, 4, 11, 9, 10, 7, 3, 6],
-    [0, 2, 8, 1, 9, 10, 7, 5, 4, 11, 3, 6],
-    [0, 2, 8, 1, 10, 9, 5, 3, 4, 7, 11, 6],
-    [0, 2, 8, 3, 7, 10, 11, 9, 5, 4, 1, 6],
-    [0, 2, 8, 3, 11, 9, 1, 4, 5, 10, 7, 6],
-    [0, 2, 8, 5, 1, 4, 11, 9, 10, 3, 7, 6],
-    [0, 2, 8, 5, 3, 4, 11, 7, 10, 9, 1, 6],
-    [0, 2, 8, 5, 4, 7, 3, 10, 11, 9, 1, 6],
-    [0, 2, 8, 5, 9, 7, 3, 4, 11, 10, 1, 6],
-    [0, 2, 8, 5, 9, 10, 3, 1, 4, 11, 7, 6],
-    [0, 2, 8, 7, 3, 10, 1, 11, 4, 5, 9, 6],
-    [0, 2, 8, 7, 4, 9, 10, 1, 5, 3, 11, 6],
-    [0, 2, 8, 7, 4, 9, 10, 5, 1, 11, 3, 6],
-    [0, 2, 8, 7, 10, 3, 11, 9, 4, 1, 5, 6],
-    [0, 2, 8, 7, 11, 4, 1, 9, 10, 5, 3, 6],
-    [0, 2, 8, 7, 11, 4, 5, 3, 10, 1, 9, 6],
-    [0, 2, 8, 7, 11, 9, 4, 5, 1, 10, 3, 6],
-    [0, 2, 8, 9, 1, 10, 5, 3, 11, 4, 7, 6],
-    [0, 2, 8, 9, 5, 3, 7, 4, 11, 10, 1, 6],
-    [0, 2, 8, 11, 3, 1, 9, 4, 5, 10, 7, 6],
-    [0, 2, 8, 11, 3, 10, 9, 7, 4, 5, 1, 6],
-    [0, 2, 8, 11, 4, 1, 9, 10, 5, 3, 7, 6],
-    [0, 2, 8, 11, 7, 4, 5, 3, 10, 9, 1, 6],
-    [0, 2, 8, 11, 9, 4, 5, 1, 10, 3, 7, 6],
-    [0, 2, 9, 1, 4, 3, 11, 5, 10, 7, 8, 6],
-    [0, 2, 9, 1, 4, 5, 11, 10, 7, 3, 8, 6],
-    [0, 2, 9, 1, 10, 3, 11, 5, 4, 7, 8, 6],
-    [0, 2, 9, 1, 10, 4, 5, 3, 8, 11, 7, 6],
-    [0, 2, 9, 1, 10, 11, 5, 4, 7, 3, 8, 6],
-    [0, 2, 9, 3, 4, 1, 5, 10, 8, 11, 7, 6],
-    [0, 2, 9, 3, 4, 7, 11, 10, 8, 5, 1, 6],
-    [0, 2, 9, 3, 4, 8, 5, 10, 1, 11, 7, 6],
-    [0, 2, 9, 3, 4, 8, 11, 10, 7, 5, 1, 6],
-    [0, 2, 9, 7, 3, 8, 11, 10, 4, 1, 5, 6],
-    [0, 2, 9, 7, 10, 4, 3, 11, 8, 1, 5, 6],
-    [0, 2, 9, 8, 11, 3, 4, 10, 7, 5, 1, 6],
-    [0, 2, 9, 10, 4, 1, 5, 3, 8, 11, 7, 6],
-    [0, 2, 11, 3, 1, 8, 7, 10, 4, 9, 5, 6],
-    [0, 2, 11, 5, 1, 4, 9, 10, 8, 3, 7, 6],
-    [0, 2, 11, 5, 4, 7, 3, 10, 8, 9, 1, 6],
-    [0, 2, 11, 5, 10, 1, 9, 4, 3, 7, 8, 6],
-    [0, 2, 11, 9, 8, 3, 7, 1, 4, 5, 10, 6],
-    [0, 2, 11, 9, 8, 3, 7, 10, 4, 5, 1, 6],
-    [0, 2, 11, 10, 5, 1, 4, 9, 3, 7, 8, 6],
-    [0, 3, 1, 2, 9, 8, 5, 7, 11, 4, 10, 6],
-    [0, 3, 1, 5, 2, 7, 9, 8, 4, 10, 11, 6],
-    [0, 3, 1, 7, 8, 5, 9, 2, 4, 11, 10, 6],
-    [0, 3, 1, 7, 9, 8, 4, 5, 10, 2, 11, 6],
-    [0, 3, 1, 8, 5, 9, 2, 4, 10, 11, 7, 6],
-    [0, 3, 1, 8, 9, 5, 2, 7, 11, 10, 4, 6],
-    [0, 3, 1, 10, 5, 4, 9, 11, 7, 8, 2, 6],
-    [0, 3, 2, 4, 8, 9, 5, 10, 7, 1, 11, 6],
-    [0, 3, 2, 4, 9, 1, 10, 5, 11, 7, 8, 6],
-    [0, 3, 2, 8, 4, 9, 7, 11, 1, 10, 5, 6],
-    [0, 3, 2, 9, 7, 11, 8, 10, 4, 5, 1, 6],
-    [0, 3, 2, 10, 5, 9, 11, 4, 1, 7, 8, 6],
-    [0, 3, 4, 1, 5, 10, 9, 11, 7, 2, 8, 6],
-    [0, 3, 4, 1, 8, 2, 7, 5, 9, 11, 10, 6],
-    [0, 3, 4, 1, 9, 11, 5, 10, 8, 7, 2, 6],
-    [0, 3, 4, 2, 7, 1, 8, 5, 9, 11, 10, 6],
-    [0, 3, 4, 2, 7, 9, 1, 8, 5, 11, 10, 6],
-    [0, 3, 4, 2, 9, 8, 10, 7, 11, 5, 1, 6],
-    [0, 3, 4, 8, 1, 7, 5, 2, 9, 11, 10, 6],
-    [0, 3, 4, 8, 2, 9, 11, 10, 7, 5, 1, 6],
-    [0, 3, 4, 8, 10, 9, 5, 2, 7, 1, 11, 6],
-    [0, 3, 4, 8, 10, 9, 7, 2, 11, 5, 1, 6],
-    [0, 3, 4, 9, 5, 11, 1, 10, 8, 7, 2, 6],
-    [0, 3, 4, 9, 11, 5, 1, 10, 8, 7, 2, 6],
-    [0, 3, 4, 9, 11, 10, 7, 5, 1, 8, 2, 6],
-    [0, 3, 4, 10, 2, 7, 9, 8, 5, 1, 11, 6],
-    [0, 3, 4, 11, 10, 8, 1, 7, 9, 5, 2, 6],
-    [0, 3, 4, 11, 10, 8, 5, 1, 7, 9, 2, 6],
-    [0, 3, 4, 11, 10, 8, 5, 7, 1, 9, 2, 6],
-    [0, 3, 5, 1, 10, 11, 9, 4, 8, 2, 7, 6],
-    [0, 3, 5, 2, 1, 8, 9, 7, 11, 4, 10, 6],
-    [0, 3, 5, 4, 1, 9, 10, 8, 2, 7, 11, 6],
-    [0, 3, 5, 4, 9, 1, 10, 11, 7, 2, 8, 6],
-    [0, 3, 5, 10, 9, 4, 1, 11, 7, 8, 2, 6],
-    [0, 3, 5, 11, 4, 1, 9, 10, 8, 7, 2, 6],
-    [0, 3, 5, 11, 9, 4, 8, 1, 2, 10, 7, 6],
-    [0, 3, 7, 2, 1, 11, 8, 9, 5, 10, 4, 6],
-    [0, 3, 7, 2, 1, 11, 8, 10, 4, 9, 5, 6],
-    [0, 3, 7, 2, 8, 1, 10, 11, 9, 5, 4, 6],
-    [0, 3, 7, 2, 8, 10, 11, 9, 5, 4, 1, 6],
-    [0, 3, 7, 2, 11, 9, 8, 10, 4, 5, 1, 6],
-    [0, 3, 7, 4, 9, 11, 10, 5, 1, 2, 8, 6],
-    [0, 3, 7, 5, 1, 8, 9, 2, 11, 10, 4, 6],
-    [0, 3, 7, 5, 2, 1, 8, 9, 11, 4, 10, 6],
-    [0, 3, 8, 2, 10, 11, 9, 4, 1, 5, 7, 6],
-    [0, 3, 8, 4, 2, 9, 1, 10, 11, 5, 7, 6],
-    [0, 3, 8, 4, 2, 9, 11, 10, 7, 1, 5, 6],
-    [0, 3, 8, 4, 5, 11, 1, 10, 9, 7, 2, 6],
-    [0, 3, 8, 4, 10, 9, 7, 2, 11, 1, 5, 6],
-    [0, 3, 8, 5, 1, 2, 9, 7, 11, 10, 4, 6],
-    [0, 3, 8, 5, 4, 10, 11, 1, 9, 7, 2, 6],
-    [0, 3, 8, 5, 9, 7, 1, 2, 4, 11, 10, 6],
-    [0, 3, 8, 7, 2, 4, 1, 5, 11, 9, 10, 6],
-    [0, 3, 8, 7, 2, 4, 1, 11, 5, 9, 10, 6],
-    [0, 3, 8, 7, 2, 4, 5, 11, 9, 1, 10, 6],
-    [0, 3, 8, 9, 1, 7, 5, 2, 4, 11, 10, 6],
-    [0, 3, 8, 9, 7, 1, 5, 2, 4, 11, 10, 6],
-    [0, 3, 8, 9, 7, 2, 11, 1, 5, 4, 10, 6],
-    [0, 3, 8, 10, 9, 4, 2, 11, 7, 1, 5, 6],
-    [0, 3, 8, 10, 11, 5, 4, 1, 9, 7, 2, 6],
-    [0, 3, 8, 10, 11, 9, 5, 4, 1, 7, 2, 6],
-    [0, 3, 9, 1, 8, 7, 5, 2, 10, 11, 4, 6],
-    [0, 3, 9, 2, 4, 8, 7, 5, 1, 10, 11, 6],
-    [0, 3, 9, 4, 8, 10, 11, 7, 5, 2, 1, 6],
-    [0, 3, 9, 5, 4, 11, 1, 10, 2, 7, 8, 6],
-    [0, 3, 9, 7, 8, 1, 5, 2, 4, 11, 10, 6],
-    [0, 3, 9, 8, 4, 2, 7, 11, 1, 10, 5, 6],
-    [0, 3, 9, 10, 8, 4, 11, 1, 5, 2, 7, 6],
-    [0, 3, 9, 11, 4, 5, 1, 10, 8, 7, 2, 6],
-    [0, 3, 10, 2, 1, 9, 7, 8, 5, 11, 4, 6],
-    [0, 3, 10, 4, 8, 9, 11, 7, 5, 2, 1, 6],
-    [0, 3, 10, 8, 4, 9, 1, 2, 11, 5, 7, 6],
-    [0, 3, 10, 8, 9, 5, 2, 1, 7, 11, 4, 6],
-    [0, 3, 10, 9, 11, 7, 4, 2, 8, 1, 5, 6],
-    [0, 3, 11, 1, 5, 4, 9, 10, 7, 2, 8, 6],
-    [0, 3, 11, 1, 10, 5, 4, 9, 7, 8, 2, 6],
-    [0, 3, 11, 8, 9, 7, 2, 1, 5, 10, 4, 6],
-    [0, 3, 11, 10, 4, 2, 7, 9, 1, 8, 5, 6],
-    [0, 3, 11, 10, 4, 5, 2, 7, 9, 1, 8, 6],
-    [0, 3, 11, 10, 5, 7, 4, 2, 8, 9, 1, 6],
-    [0, 3, 11, 10, 5, 7, 4, 9, 1, 2, 8, 6],
-    [0, 3, 11, 10, 7, 9, 4, 2, 8, 1, 5, 6],
-    [0, 4, 1, 3, 2, 9, 7, 8, 11, 5, 10, 6],
-    [0, 4, 1, 3, 10, 9, 5, 11, 2, 7, 8, 6],
-    [0, 4, 1, 3, 11, 9, 2, 8, 7, 10, 5, 6],
-    [0, 4, 1, 3, 11, 9, 8, 2, 7, 10, 5, 6],
-    [0, 4, 1, 9, 11, 5, 10, 8, 7, 2, 3, 6],
-    [0, 4, 1, 11, 2, 7, 3, 9, 8, 10, 5, 6],
-    [0, 4, 2, 1, 9, 3, 8, 5, 7, 10, 11, 6],
-    [0, 4, 2, 3, 9, 11, 8, 7, 10, 5, 1, 6],
-    [0, 4, 2, 7, 3, 9, 8, 11, 1, 10, 5, 6],
-    [0, 4, 2, 9, 3, 5, 8, 1, 10, 11, 7, 6],
-    [0, 4, 3, 1, 9, 2, 8, 5, 7, 10, 11, 6],
-    [0, 4, 3, 5, 2, 8, 1, 9, 7, 10, 11, 6],
-    [0, 4, 3, 5, 10, 1, 9, 7, 8, 2, 11, 6],
-    [0, 4, 3, 5, 11, 7, 10, 8, 1, 2, 9, 6],
-    [0, 4, 3, 11, 5, 7, 10, 8, 1, 2, 9, 6],
-    [0, 4, 5, 1, 10, 8, 3, 9, 11, 2, 7, 6],
-    [0, 4, 5, 3, 8, 11, 1, 7, 2, 10, 9, 6],
-    [0, 4, 5, 3, 9, 11, 8, 7, 2, 10, 1, 6],
-    [0, 4, 5, 3, 10, 1, 9, 11, 8, 2, 7, 6],
-    [0, 4, 5, 3, 11, 1, 8, 2, 7, 10, 9, 6],
-    [0, 4, 5, 3, 11, 2, 7, 1, 8, 10, 9, 6],
-    [0, 4, 5, 10, 1, 3, 11, 8, 2, 9, 7, 6],
-    [0, 4, 5, 10, 1, 7, 3, 2, 9, 11, 8, 6],
-    [0, 4, 5, 10, 8, 3, 11, 2, 1, 7, 9, 6],
-    [0, 4, 5, 10, 8, 7, 1, 3, 11, 2, 9, 6],
-    [0, 4, 5, 10, 8, 11, 1, 7, 3, 2, 9, 6],
-    [0, 4, 5, 10, 8, 11, 7, 1, 3, 2, 9, 6],
-    [0, 4, 5, 10, 8, 11, 7, 2, 1, 3, 9, 6],
-    [0, 4, 5, 11, 2, 7, 3, 1, 8, 10, 9, 6],
-    [0, 4, 5, 11, 2, 7, 9, 8, 3, 1, 10, 6],
-    [0, 4, 7, 3, 5, 11, 10, 8, 1, 2, 9, 6],
-    [0, 4, 7, 5, 2, 1, 9, 3, 8, 10, 11, 6],
-    [0, 4, 7, 9, 2, 3, 1, 8, 5, 11, 10, 6],
-    [0, 4, 7, 9, 5, 3, 2, 8, 1, 10, 11, 6],
-    [0, 4, 7, 9, 5, 3, 8, 2, 1, 10, 11, 6],
-    [0, 4, 7, 9, 10, 3, 11, 5, 2, 1, 8, 6],
-    [0, 4, 9, 5, 11, 1, 10, 8, 7, 2, 3, 6],
-    [0, 4, 9, 7, 3, 2, 8, 11, 1, 10, 5, 6],
-    [0, 4, 9, 11, 2, 8, 7, 3, 1, 10, 5, 6],
-    [0, 4, 9, 11, 5, 1, 10, 8, 7, 2, 3, 6],
-    [0, 4, 9, 11, 10, 7, 3, 1, 8, 2, 5, 6],
-    [0, 4, 10, 1, 2, 7, 9, 8, 5, 3, 11, 6],
-    [0, 4, 10, 1, 3, 8, 7, 2, 11, 9, 5, 6],
-    [0, 4, 10, 1, 9, 11, 8, 3, 2, 7, 5, 6],
-    [0, 4, 10, 1, 11, 8, 3, 2, 7, 9, 5, 6],
-    [0, 4, 10, 3, 5, 2, 1, 9, 7, 8, 11, 6],
-    [0, 4, 10, 5, 1, 3, 2, 7, 8, 11, 9, 6],
-    [0, 4, 10, 5, 1, 11, 2, 3, 8, 7, 9, 6],
-    [0, 4, 10, 5, 1, 11, 8, 7, 9, 2, 3, 6],
-    [0, 4, 10, 5, 3, 2, 7, 8, 11, 1, 9, 6],
-    [0, 4, 10, 5, 8, 9, 7, 3, 2, 11, 1, 6],
-    [0, 4, 10, 7, 2, 1, 3, 8, 11, 9, 5, 6],
-    [0, 4, 10, 7, 3, 5, 8, 9, 2, 1, 11, 6],
-    [0, 4, 10, 7, 5, 8, 9, 2, 1, 3, 11, 6],
-    [0, 4, 10, 7, 9, 8, 1, 2, 5, 3, 11, 6],
-    [0, 4, 10, 9, 11, 2, 7, 3, 1, 8, 5, 6],
-    [0, 4, 10, 11, 7, 5, 2, 9, 8, 1, 3, 6],
-    [0, 4, 10, 11, 7, 5, 8, 1, 3, 2, 9, 6],
-    [0, 4, 10, 11, 7, 9, 2, 1, 8, 5, 3, 6],
-    [0, 4, 10, 11, 8, 3, 1, 9, 2, 5, 7, 6],
-    [0, 4, 10, 11, 9, 2, 1, 8, 5, 7, 3, 6],
-    [0, 4, 11, 5, 2, 1, 3, 8, 9, 7, 10, 6],
-    [0, 4, 11, 5, 2, 1, 9, 7, 8, 10, 3, 6],
-    [0, 4, 11, 7, 10, 8, 9, 3, 5, 2, 1, 6],
-    [0, 4, 11, 9, 3, 5, 8, 1, 2, 10, 7, 6],
-    [0, 4, 11, 9, 5, 2, 1, 7, 8, 10, 3, 6],
-    [0, 4, 11, 9, 5, 7, 8, 2, 1, 10, 3, 6],
-    [0, 4, 11, 9, 8, 5, 7, 1, 2, 10, 3, 6],
-    [0, 4, 11, 9, 10, 7, 3, 5, 8, 2, 1, 6],
-    [0, 4, 11, 10, 7, 1, 9, 2, 3, 5, 8, 6],
-    [0, 4, 11, 10, 7, 9, 5, 8, 2, 3, 1, 6],
-    [0, 4, 11, 10, 8, 1, 7, 9, 5, 2, 3, 6],
-    [0, 4, 11, 10, 8, 5, 1, 2, 7, 9, 3, 6],
-    [0, 4, 11, 10, 8, 5, 1, 7, 9, 2, 3, 6],
-    [0, 4, 11, 10, 8, 5, 7, 1, 9, 2, 3, 6],
-    [0, 4, 11, 10, 8, 9, 5, 2, 7, 1, 3, 6],
-    [0, 5, 1, 2, 8, 10, 7, 11, 9, 4, 3, 6],
-    [0, 5, 1, 2, 8, 10, 9, 7, 4, 11, 3, 6],
-    [0, 5, 1, 2, 8, 11, 3, 10, 9, 7, 4, 6],
-    [0, 5, 1, 2, 11, 3, 10, 4, 7, 9, 8, 6],
-    [0, 5, 1, 2, 11, 9, 8, 3, 7, 10, 4, 6],
-    [0, 5, 1, 7, 4, 11, 9, 8, 10, 2, 3, 6],
-    [0, 5, 1, 7, 11, 8, 10, 9, 4, 2, 3, 6],
-    [0, 5, 1, 8, 2, 4, 3, 7, 10, 11, 9, 6],
-    [0, 5, 1, 8, 11, 10, 7, 9, 3, 4, 2, 6],
-    [0, 5, 1, 10, 4, 2, 3, 7, 9, 8, 11, 6],
-    [0, 5, 1, 10, 4, 11, 2, 3, 7, 9, 8, 6],
-    [0, 5, 1, 10, 8, 7, 11, 2, 3, 9, 4, 6],
-    [0, 5, 1, 10, 8, 7, 11, 2, 9, 3, 4, 6],
-    [0, 5, 1, 10, 9, 7, 2, 8, 11, 3, 4, 6],
-    [0, 5, 1, 10, 9, 7, 11, 2, 8, 3, 4, 6],
-    [0, 5, 1, 10, 9, 11, 3, 4, 7, 2, 8, 6],
-    [0, 5, 1, 11, 8, 2, 3, 7, 10, 9, 4, 6],
-    [0, 5, 1, 11, 8, 7, 9, 4, 10, 2, 3, 6],
-    [0, 5, 1, 11, 8, 7, 10, 2, 3, 9, 4, 6],
-    [0, 5, 1, 11, 8, 7, 10, 2, 9, 3, 4, 6],
-    [0, 5, 2, 1, 3, 7, 8, 11, 9, 4, 10, 6],
-    [0, 5, 2, 1, 9, 7, 8, 10, 4, 11, 3, 6],
-    [0, 5, 2, 1, 9, 7, 8, 11, 3, 10, 4, 6],
-    [0, 5, 2, 1, 9, 11, 3, 10, 4, 7, 8, 6],
-    [0, 5, 2, 3, 1, 9, 8, 10, 4, 7, 11, 6],
-    [0, 5, 2, 3, 11, 10, 4, 7, 9, 1, 8, 6],
-    [0, 5, 2, 10, 9, 3, 4, 7, 11, 1, 8, 6],
-    [0, 5, 2, 10, 9, 11, 3, 4, 7, 1, 8, 6],
-    [0, 5, 3, 4, 10, 1, 9, 11, 8, 7, 2, 6],
-    [0, 5, 4, 1, 3, 7, 2, 8, 11, 9, 10, 6],
-    [0, 5, 4, 1, 3, 9, 10, 8, 11, 7, 2, 6],
-    [0, 5, 4, 1, 11, 2, 8, 3, 7, 9, 10, 6],
-    [0, 5, 4, 1, 11, 2, 9, 3, 7, 8, 10, 6],
-    [0, 5, 4, 1, 11, 7, 8, 10, 2, 9, 3, 6],
-    [0, 5, 4, 1, 11, 7, 9, 10, 2, 8, 3, 6],
-    [0, 5, 4, 2, 9, 3, 7, 8, 11, 1, 10, 6],
-    [0, 5, 4, 7, 2, 8, 9, 11, 3, 1, 10, 6],
-    [0, 5, 4, 7, 8, 2, 9, 11, 3, 1, 10, 6],
-    [0, 5, 4, 7, 11, 1, 2, 10, 8, 3, 9, 6],
-    [0, 5, 4, 10, 1, 3, 11, 8, 9, 7, 2, 6],
-    [0, 5, 4, 10, 2, 3, 1, 8, 11, 7, 9, 6],
-    [0, 5, 7, 1, 4, 11, 3, 2, 10, 8, 9, 6],
-    [0, 5, 7, 1, 8, 11, 3, 4, 2, 10, 9, 6],
-    [0, 5, 7, 4, 3, 11, 9, 10, 1, 8, 2, 6],
-    [0, 5, 7, 8, 3, 2, 11, 9, 1, 4, 10, 6],
-    [0, 5, 7, 11, 2, 3, 1, 8, 4, 10, 9, 6],
-    [0, 5, 8, 2, 1, 3, 7, 4, 11, 9, 10, 6],
-    [0, 5, 8, 4, 11, 10, 2, 3, 1, 7, 9, 6],
-    [0, 5, 8, 4, 11, 10, 7, 9, 3, 1, 2, 6],
-    [0, 5, 8, 7, 2, 3, 11, 9, 1, 10, 4, 6],
-    [0, 5, 8, 7, 2, 11, 3, 1, 9, 10, 4, 6],
-    [0, 5, 9, 4, 10, 1, 3, 2, 11, 7, 8, 6],
-    [0, 5, 9, 7, 8, 3, 2, 11, 1, 4, 10, 6],
-    [0, 5, 9, 7, 8, 3, 11, 2, 1, 10, 4, 6],
-    [0, 5, 9, 8, 3, 1, 2, 11, 7, 10, 4, 6],
-    [0, 5, 9, 8, 11, 7, 2, 3, 1, 10, 4, 6],
-    [0, 5, 9, 10, 4, 2, 11, 1, 8, 7, 3, 6],
-    [0, 5, 9, 10, 4, 7, 2, 1, 3, 11, 8, 6],
-    [0, 5, 9, 10, 4, 7, 3, 2, 11, 1, 8, 6],
-    [0, 5, 9, 10, 8, 3, 2, 11, 7, 1, 4, 6],
-    [0, 5, 9, 10, 8, 3, 11, 2, 1, 7, 4, 6],
-    [0, 5, 9, 11, 2, 3, 1, 8, 7, 4, 10, 6],
-    [0, 5, 9, 11, 7, 4, 3, 10, 1, 2, 8, 6],
-    [0, 5, 9, 11, 8, 7, 2, 3, 1, 4, 10, 6],
-]
@@ -0,0 +1,207 @@
+"""
+Link-chord library.
+
+Enumerates all-interval series by backtracking, identifies link chords with
+bitmask set-class lookup and caches results in ``catalog.npz``.
+"""
+import pathlib
+
+import numpy
+
+import abjad
+
+### PRIVATE FUNCTIONS ###
+
+
+def _inversions(series):
+    return (-series) % 12
+
+
+def _rotate_mask(mask, n):
+    return ((mask << n) | (mask >> (12 - n))) & 0xFFF
+
+
+def _invert_mask(mask):
+    result = 0
+    for i in range(12):
+        if mask & (1 << i):
+            result |= 1 << (-i % 12)
+    return result
+
+
+def _window_masks(series, n):
+    bits = numpy.left_shift(1, series.astype(numpy.uint16))
+    masks = numpy.zeros((len(series), 12 - n + 1), dtype=numpy.uint16)
+    for i in range(n):
+        masks |= bits[:, i : i + 12 - n + 1]
+    return masks
+
+
+### PUBLIC FUNCTIONS ###
+
+
+def get_all_interval_series():
+    """
+    Gets all-interval series that start on 0.
+
+    Backtracks through pitch classes in ascending order and prunes any
+    branch that repeats pitch class or interval; yields series in
+    lexicographic order.
+
+    ..  container:: example
+
+        >>> series = get_all_interval_series()
+        >>> series.shape
+        (3856, 12)
+
+        >>> series[0].tolist()
+        [0, 1, 3, 2, 7, 10, 8, 4, 11, 5, 9, 6]
+
+    Returns array of unsigned 8-bit integers.
+    """
+    result = []
+    row = [0] * 12
+
+    def extend(depth, pitch_classes, intervals):
+        if depth == 12:
+            result.append(list(row))
+            return
+        previous = row[depth - 1]
+        for pitch_class in range(12):
+            if pitch_classes & (1 << pitch_class):
+                continue
+            interval = (pitch_class - previous) % 12
+            if intervals & (1 << interval):
+                continue
+            row[depth] = pitch_class
+            extend(
+                depth + 1,
+                pitch_classes | (1 << pitch_class),
+                intervals | (1 << interval),
+            )
+
+    extend(1, 1, 1)
+    return numpy.array(result, dtype=numpy.uint8)
+
+
+def get_inversionally_unique_series(series):
+    """
+    Gets series in ``series`` that sort no later than their inversions.
+
+    ..  container:: example
+
+        >>> series = get_all_interval_series()
+        >>> get_inversionally_unique_series(series).shape
+        (1928, 12)
+
+    Returns array of unsigned 8-bit integers.
+    """
+    series = numpy.asarray(series, dtype=numpy.int16)
+    inversions = _inversions(series)
+    difference = series - inversions
+    first = numpy.argmax(difference != 0, axis=1)
+    keep = difference[numpy.arange(len(series)), first] <= 0
+    return series[keep].astype(numpy.uint8)
+
+
+def get_link_chords(series, ranks=None, rank=17):
+    """
+    Gets series in ``series`` with at least one hexachord of set-class
+    ``rank`` among consecutive pitch classes.
+
+    ..  container:: example
+
+        >>> series = get_all_interval_series()
+        >>> series = get_inversionally_unique_series(series)
+        >>> get_link_chords(series).shape
+        (384, 12)
+
+    Returns array of unsigned 8-bit integers.
+    """
+    if ranks is None:
+        ranks = get_set_class_ranks()
+    series = numpy.asarray(series, dtype=numpy.uint8)
+    masks = _window_masks(series, 6)
+    keep = (ranks[masks] == rank).any(axis=1)
+    return series[keep]
+
+
+def get_set_class_ranks():
+    """
+    Gets set-class rank of every pitch-class set, indexed by bitmask.
+
+    Bit ``n`` of index corresponds to pitch class ``n``. Calls Abjad once
+    per transpositional / inversional orbit; ranks every other set in orbit
+    by bit rotation and reflection. Unranked sets get rank 0.
+
+    ..  container:: example
+
+        >>> ranks = get_set_class_ranks()
+        >>> mask = sum(1 << _ for _ in [0, 1, 2, 4, 7, 8])
+        >>> int(ranks[mask])
+        17
+
+        >>> mask = sum(1 << _ for _ in [3, 4, 5, 7, 10, 11])
+        >>> int(ranks[mask])
+        17
+
+    Returns array of 4096 unsigned 8-bit integers.
+    """
+    ranks = numpy.zeros(4096, dtype=numpy.uint8)
+    seen = numpy.zeros(4096, dtype=bool)
+    for mask in range(4096):
+        if seen[mask]:
+            continue
+        pitch_classes = [_ for _ in range(12) if mask & (1 << _)]
+        try:
+            pitch_class_set = abjad.PitchClassSet(pitch_classes)
+            rank = abjad.SetClass.from_pitch_class_set(pitch_class_set).rank
+        except KeyError:
+            rank = 0
+        for mask_ in (mask, _invert_mask(mask)):
+            for n in range(12):
+                transposed_mask = _rotate_mask(mask_, n)
+                ranks[transposed_mask] = rank
+                seen[transposed_mask] = True
+    return ranks
+
+
+def make_catalog(path=None):
+    """
+    Makes catalog of all-interval series, inversionally unique
+    all-interval series, link chords and set-class ranks; writes catalog to
+    ``path`` when ``path`` is not none.
+
+    Returns dictionary of arrays.
+    """
+    all_ais = get_all_interval_series()
+    all_ieq_ais = get_inversionally_unique_series(all_ais)
+    ranks = get_set_class_ranks()
+    link_chords = get_link_chords(all_ieq_ais, ranks=ranks)
+    catalog = {
+        "all_ais": all_ais,
+        "all_ieq_ais": all_ieq_ais,
+        "link_chords": link_chords,
+        "set_class_ranks": ranks,
+    }
+    if path is not None:
+        numpy.savez_compressed(path, **catalog)
+    return catalog
+
+
+def read_catalog(path=None):
+    """
+    Reads catalog from ``path``; makes and writes catalog when ``path`` does
+    not exist.
+
+    Path defaults to ``catalog.npz`` next to this module.
+
+    Returns dictionary of arrays.
+    """
+    if path is None:
+        path = pathlib.Path(__file__).parent / "catalog.npz"
+    path = pathlib.Path(path)
+    if not path.exists():
+        return make_catalog(path)
+    with numpy.load(path) as file_pointer:
+        return {_: file_pointer[_] for _ in file_pointer.files}
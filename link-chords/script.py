@@ -1,84 +1,17 @@
-import abjad
+import time
 
-# all_ais = []
-#
-# def is_ais(permutation):
-#    my_set = set()
-#    for i in range(11):
-#        next_ = i + 1
-#        interval = (permutation[next_] - permutation[i]) % 12
-#        my_set.add(interval)
-#    return len(my_set) == 11
-#
-#
-# def succession(row):
-#    row = abjad.TwelveToneRow(row)
-#    succession = []
-#    for i in range(11):
-#        next_ = i + 1
-#        interval = (row[next_].number - row[i].number) % 12
-#        succession.append(interval)
-#    assert list(sorted(succession)) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
-#    return succession
-#
-#
-# start_time = time.time()
-# total_ais = 0
-# total_permutations = 0
-# inner_numbers = [1, 2, 3, 4, 5, 7, 8, 9, 10, 11]
-# for permutation in itertools.permutations(inner_numbers):
-#    permutation = (0,) + permutation + (6,)
-#    if is_ais(permutation):
-#        all_ais.append(permutation)
-#        total_ais += 1
-#    total_permutations += 1
-# print('TOTAL PERMUTATIONS: {}'.format(total_permutations))
-# stop_time = time.time()
-# total_time = stop_time - start_time
-# print('DONE in {} seconds!'.format(int(total_time)))
-
-# all_ais = open('all_ais.py', 'r').read()
-# all_ais = eval(all_ais)
-# start = time.time()
-# unique = set()
-# unique_list = []
-# for i, ais in enumerate(all_ais):
-#    ais = abjad.TwelveToneRow(ais)
-#    prime_form_string = str(ais)
-#    inversion_string = str(ais.invert())
-#    if (prime_form_string not in unique and
-#        inversion_string not in unique):
-#        unique.add(str(ais))
-#        numbers = [_.number for _ in ais]
-#        unique_list.append(numbers)
-# unique_list.sort()
-# stop = time.time()
+import linkchords
 
-# all_ieq_ais = open('all_ieq_ais.py', 'r').read()
-# all_ieq_ais = eval(all_ieq_ais)
+start_time = time.time()
+catalog = linkchords.make_catalog("catalog.npz")
+stop_time = time.time()
+for name in ("all_ais", "all_ieq_ais", "link_chords"):
+    print(f"{name}: {len(catalog[name])}")
+print(f"DONE in {stop_time - start_time:.2f} seconds!")
 
-
-def is_link_chord(ais):
-    for sextuple in abjad.sequence(ais).nwise(n=6):
-        pc_set = abjad.PitchClassSet(sextuple)
-        try:
-            set_class = abjad.SetClass.from_pitch_class_set(pc_set)
-            if set_class.rank == 17:
-                return True
-        except KeyError as e:
-            print(e)
-    return False
-
-
-# link_chords = []
-# for i, ais in enumerate(all_ieq_ais):
-#    print(i)
-#    if is_link_chord(ais):
-#        print('FOUND LINK CHORD ', str(len(link_chords)))
-#        link_chords.append(ais)
-
-# link_chords = open('link_chords.py', 'r').read()
-# link_chords = eval(link_chords)
+# import abjad
+#
+# link_chords = catalog["link_chords"].tolist()
 # #link_chords = link_chords[:16]
 #
 # chords = []
@@ -34,6 +34,7 @@ version of Python.
 install_requires = [
     "abjad",
     "mypy",
+    "numpy",
     "roman",
     "sphinx",
     "sphinx-rtd-theme",